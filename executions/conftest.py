@@ -0,0 +1,18 @@
+"""
+pytest configuration for the executions test suite.
+
+Test modules import the scripts under test either as top-level modules
+(``from upwork_attachment_scanner import ...``) or through the package path
+(``from executions.upwork_boost_decider import ...``). Both directories are
+put on sys.path once here, at collection start, instead of by each module.
+"""
+
+import os
+import sys
+
+_EXECUTIONS_DIR = os.path.dirname(os.path.abspath(__file__))
+_REPO_ROOT = os.path.dirname(_EXECUTIONS_DIR)
+
+for _path in (_EXECUTIONS_DIR, _REPO_ROOT):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
@@ -173,22 +173,65 @@ class TestFeature70SourceField(unittest.TestCase):
 class TestFeature71BatchProcessing(unittest.TestCase):
     """Test Feature #71: Apify scraper supports batch processing."""
 
+    # Shared job templates; each batch shallow-copies one and overwrites the
+    # per-job fields. Nested dicts are shared, so tests must not mutate them.
+    _FILTER_TEMPLATE = {
+        'description': 'Looking for Python developer',
+        'vendor': {'experienceLevel': 'intermediate'},
+        'client': {
+            'paymentMethodVerified': True,
+            'stats': {'totalSpent': 1000, 'totalHires': 5}
+        },
+    }
+
+    _PRESERVE_TEMPLATE = {
+        'budget': {'fixedBudget': 500},
+        'vendor': {'experienceLevel': 'expert'},
+        'skills': ['Python', 'Automation'],
+        'createdAt': '2026-01-19T10:00:00Z',
+        'client': {
+            'countryCode': 'US',
+            'paymentMethodVerified': True,
+            'stats': {'totalSpent': 5000, 'totalHires': 10}
+        },
+    }
+
+    _FORMAT_TEMPLATE = {
+        'budget': {'fixedBudget': 1000},
+        'vendor': {},
+        'client': {'stats': {}},
+    }
+
+    _LIMIT100_TEMPLATE = {
+        'description': 'Testing batch processing with limit 100',
+        'vendor': {'experienceLevel': 'intermediate'},
+        'skills': ['Python', 'Automation'],
+        'createdAt': '2026-01-19T10:00:00Z',
+        'applicationCost': 6,
+        'client': {
+            'countryCode': 'US',
+            'timezone': 'America/New_York',
+            'paymentMethodVerified': True,
+            'stats': {'totalSpent': 5000, 'totalHires': 10, 'hireRate': 0.8, 'feedbackRate': 4.9}
+        },
+        'isFeatured': False
+    }
+
+    _LIMIT_TEMPLATE = {
+        'budget': {'fixedBudget': 500},
+        'vendor': {},
+        'client': {'stats': {}},
+    }
+
     def test_filter_jobs_processes_all_jobs(self):
         """Test that filter_jobs processes all jobs in batch."""
-        jobs = [
-            {
-                'uid': f'job{i}',
-                'title': f'Python Job {i}',
-                'description': f'Looking for Python developer',
-                'budget': {'fixedBudget': 500 + i * 100},
-                'vendor': {'experienceLevel': 'intermediate'},
-                'client': {
-                    'paymentMethodVerified': True,
-                    'stats': {'totalSpent': 1000, 'totalHires': 5}
-                },
-            }
-            for i in range(100)
-        ]
+        jobs = []
+        for i in range(100):
+            job = self._FILTER_TEMPLATE.copy()
+            job['uid'] = f'job{i}'
+            job['title'] = f'Python Job {i}'
+            job['budget'] = {'fixedBudget': 500 + i * 100}
+            jobs.append(job)
 
         # Filter with keyword - should return all since all have 'Python'
         filtered = filter_jobs(jobs, keyword='python')
@@ -197,23 +240,13 @@ class TestFeature71BatchProcessing(unittest.TestCase):
 
     def test_batch_processing_preserves_job_data(self):
         """Test that batch processing preserves all job data."""
-        jobs = [
-            {
-                'uid': f'batch{i}',
-                'title': f'Batch Job {i}',
-                'description': f'Description for batch job {i}',
-                'budget': {'fixedBudget': 500},
-                'vendor': {'experienceLevel': 'expert'},
-                'skills': ['Python', 'Automation'],
-                'createdAt': '2026-01-19T10:00:00Z',
-                'client': {
-                    'countryCode': 'US',
-                    'paymentMethodVerified': True,
-                    'stats': {'totalSpent': 5000, 'totalHires': 10}
-                },
-            }
-            for i in range(50)
-        ]
+        jobs = []
+        for i in range(50):
+            job = self._PRESERVE_TEMPLATE.copy()
+            job['uid'] = f'batch{i}'
+            job['title'] = f'Batch Job {i}'
+            job['description'] = f'Description for batch job {i}'
+            jobs.append(job)
 
         # No filtering - return all
         filtered = filter_jobs(jobs)
@@ -227,18 +260,14 @@ class TestFeature71BatchProcessing(unittest.TestCase):
 
     def test_batch_format_all_jobs(self):
         """Test formatting a batch of jobs."""
-        raw_jobs = [
-            {
-                'uid': f'format{i}',
-                'title': f'Format Job {i}',
-                'description': f'Description {i}',
-                'externalLink': f'https://upwork.com/jobs/~format{i}',
-                'budget': {'fixedBudget': 1000},
-                'vendor': {},
-                'client': {'stats': {}},
-            }
-            for i in range(100)
-        ]
+        raw_jobs = []
+        for i in range(100):
+            job = self._FORMAT_TEMPLATE.copy()
+            job['uid'] = f'format{i}'
+            job['title'] = f'Format Job {i}'
+            job['description'] = f'Description {i}'
+            job['externalLink'] = f'https://upwork.com/jobs/~format{i}'
+            raw_jobs.append(job)
 
         formatted_jobs = [format_job(job) for job in raw_jobs]
 
@@ -251,27 +280,14 @@ class TestFeature71BatchProcessing(unittest.TestCase):
     def test_batch_100_jobs_limit(self):
         """Test Feature #71: Run scraper with --limit 100 and verify all jobs processed."""
         # Create 100 raw jobs
-        raw_jobs = [
-            {
-                'uid': f'limit100_{i}',
-                'title': f'Limit Test Job {i}',
-                'description': f'Testing batch processing with limit 100',
-                'externalLink': f'https://upwork.com/jobs/~limit100_{i}',
-                'budget': {'fixedBudget': 500 + i},
-                'vendor': {'experienceLevel': 'intermediate'},
-                'skills': ['Python', 'Automation'],
-                'createdAt': '2026-01-19T10:00:00Z',
-                'applicationCost': 6,
-                'client': {
-                    'countryCode': 'US',
-                    'timezone': 'America/New_York',
-                    'paymentMethodVerified': True,
-                    'stats': {'totalSpent': 5000, 'totalHires': 10, 'hireRate': 0.8, 'feedbackRate': 4.9}
-                },
-                'isFeatured': False
-            }
-            for i in range(100)
-        ]
+        raw_jobs = []
+        for i in range(100):
+            job = self._LIMIT100_TEMPLATE.copy()
+            job['uid'] = f'limit100_{i}'
+            job['title'] = f'Limit Test Job {i}'
+            job['externalLink'] = f'https://upwork.com/jobs/~limit100_{i}'
+            job['budget'] = {'fixedBudget': 500 + i}
+            raw_jobs.append(job)
 
         # Filter all (no filters applied)
         filtered = filter_jobs(raw_jobs)
@@ -297,18 +313,14 @@ class TestFeature71BatchProcessing(unittest.TestCase):
         import os
 
         # Create batch of jobs
-        raw_jobs = [
-            {
-                'uid': f'json_out_{i}',
-                'title': f'JSON Output Test {i}',
-                'description': f'Test job for JSON output verification',
-                'externalLink': f'https://upwork.com/jobs/~json_out_{i}',
-                'budget': {'fixedBudget': 1000},
-                'vendor': {},
-                'client': {'stats': {}},
-            }
-            for i in range(100)
-        ]
+        raw_jobs = []
+        for i in range(100):
+            job = self._FORMAT_TEMPLATE.copy()
+            job['uid'] = f'json_out_{i}'
+            job['title'] = f'JSON Output Test {i}'
+            job['description'] = 'Test job for JSON output verification'
+            job['externalLink'] = f'https://upwork.com/jobs/~json_out_{i}'
+            raw_jobs.append(job)
 
         # Format jobs
         formatted_jobs = [format_job(job) for job in raw_jobs]
@@ -338,18 +350,14 @@ class TestFeature71BatchProcessing(unittest.TestCase):
         """Test batch processing with various limit values."""
         for limit in [10, 50, 100, 200]:
             with self.subTest(limit=limit):
-                raw_jobs = [
-                    {
-                        'uid': f'limit_{limit}_{i}',
-                        'title': f'Limit {limit} Job {i}',
-                        'description': f'Description for job {i}',
-                        'externalLink': f'https://upwork.com/jobs/~limit_{limit}_{i}',
-                        'budget': {'fixedBudget': 500},
-                        'vendor': {},
-                        'client': {'stats': {}},
-                    }
-                    for i in range(limit)
-                ]
+                raw_jobs = []
+                for i in range(limit):
+                    job = self._LIMIT_TEMPLATE.copy()
+                    job['uid'] = f'limit_{limit}_{i}'
+                    job['title'] = f'Limit {limit} Job {i}'
+                    job['description'] = f'Description for job {i}'
+                    job['externalLink'] = f'https://upwork.com/jobs/~limit_{limit}_{i}'
+                    raw_jobs.append(job)
 
                 formatted_jobs = [format_job(job) for job in raw_jobs]
                 self.assertEqual(len(formatted_jobs), limit, f"Should process all {limit} jobs")
@@ -19,26 +19,36 @@ Feature #84: Job attachments are scanned for malicious content
 - Run basic security checks
 - Verify no executable content
 - Verify file type matches extension
+
+Every test is hermetic: fixtures live in a per-process scratch directory and
+the scanner keeps no mutable module state, so the suite can be sharded across
+processes (e.g. pytest -n auto, or unittest-parallel).
 """
 
 import os
 import sys
-import json
+import hashlib
+import shutil
+import itertools
 import tempfile
 import unittest
 import zipfile
-from pathlib import Path
+from unittest.mock import patch
 
-# Add executions directory to path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+# Add executions directory to path for direct runs (conftest.py covers pytest)
+_EXECUTIONS_DIR = os.path.dirname(os.path.abspath(__file__))
+if _EXECUTIONS_DIR not in sys.path:
+    sys.path.insert(0, _EXECUTIONS_DIR)
 
 from upwork_attachment_scanner import (
     ScanResult,
     scan_attachment,
     scan_directory,
+    iter_directory_files,
     scan_attachments_batch,
     filter_safe_attachments,
     validate_attachment_for_processing,
+    validate_attachment_bytes,
     get_scan_summary,
     get_file_extension,
     compute_file_hash,
@@ -58,9 +68,114 @@ from upwork_attachment_scanner import (
     MAX_FILE_SIZE,
     MAX_DECOMPRESSED_SIZE,
     ARCHIVE_BOMB_RATIO,
+    HASH_CHUNK_SIZE,
+    MMAP_HASH_THRESHOLD,
 )
 
 
+# Shared scratch directory for the whole module, on tmpfs when available.
+# Each test gets its own subdirectory (see ScratchDirTestCase) that is
+# removed with a single rmtree. The directory is unique per process, so
+# parallel test workers never share it.
+_TMPDIR = None
+
+# Canonical read-only fixtures, written once in setUpModule under
+# _FIXTURE_DIR. Tests that only read a file share these paths; tests that
+# need the same bytes under another name symlink to them (see
+# ScratchDirTestCase._link) and tests that need unique content write
+# their own copy with _mk.
+_FIXTURE_DIR = None
+
+_FIXTURE_CONTENTS = {
+    'safe.pdf': b'%PDF-1.4\n%%EOF',
+    'malware.exe': b'MZ\x90\x00\x03\x00\x00\x00',
+    'image.png': b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR',
+    'photo.jpg': b'\xff\xd8\xff\xe0\x00\x10JFIF',
+    'program.bin': b'\x7fELF\x02\x01\x01\x00',
+    'script.sh': b'#!/bin/bash\necho "test"',
+    'document.rtf': b'{\\rtf1\\ansi\\deff0',
+    'data.xyz': b'\x00\x01\x02\x03\x04\x05',
+    'macro.docm': b'test',
+    'macro.xlsm': b'test',
+    'legacy.doc': b'\xd0\xcf\x11\xe0_VBA_PROJECT_test',
+    'corrupt.zip': b'This is not a zip file',
+}
+
+# name -> {member name: member content}
+_FIXTURE_ARCHIVES = {
+    'safe.zip': {'document.txt': 'Hello world', 'readme.md': 'Some readme'},
+    'with_exe.zip': {'malware.exe': 'MZ\x90\x00', 'readme.txt': 'This is malware'},
+    'traversal.zip': {'../../../etc/passwd': 'root:x:0:0:'},
+    'bomb.zip': {'zeros.txt': '\x00' * (1024 * 1024)},
+}
+
+SAFE_PDF = EXE_FILE = PNG_FILE = ELF_FILE = RTF_FILE = None
+DOCM_FILE = DOC_VBA_FILE = ZIP_SAFE = ZIP_BOMB = ZIP_TRAVERSAL = None
+
+
+def _fixture(name: str) -> str:
+    """Path of a shared read-only fixture file."""
+    return os.path.join(_FIXTURE_DIR, name)
+
+
+def setUpModule():
+    global _TMPDIR, _FIXTURE_DIR
+    global SAFE_PDF, EXE_FILE, PNG_FILE, ELF_FILE, RTF_FILE
+    global DOCM_FILE, DOC_VBA_FILE, ZIP_SAFE, ZIP_BOMB, ZIP_TRAVERSAL
+    shm = '/dev/shm'
+    base = shm if os.path.isdir(shm) and os.access(shm, os.W_OK) else None
+    _TMPDIR = tempfile.mkdtemp(prefix=f'attachment_scanner_test_{os.getpid()}_', dir=base)
+
+    _FIXTURE_DIR = os.path.join(_TMPDIR, 'fixtures')
+    os.mkdir(_FIXTURE_DIR)
+    for name, content in _FIXTURE_CONTENTS.items():
+        with open(_fixture(name), 'wb') as f:
+            f.write(content)
+    for name, members in _FIXTURE_ARCHIVES.items():
+        with zipfile.ZipFile(_fixture(name), 'w', zipfile.ZIP_DEFLATED) as zf:
+            for member, content in members.items():
+                zf.writestr(member, content)
+
+    SAFE_PDF = _fixture('safe.pdf')
+    EXE_FILE = _fixture('malware.exe')
+    PNG_FILE = _fixture('image.png')
+    ELF_FILE = _fixture('program.bin')
+    RTF_FILE = _fixture('document.rtf')
+    DOCM_FILE = _fixture('macro.docm')
+    DOC_VBA_FILE = _fixture('legacy.doc')
+    ZIP_SAFE = _fixture('safe.zip')
+    ZIP_BOMB = _fixture('bomb.zip')
+    ZIP_TRAVERSAL = _fixture('traversal.zip')
+
+
+def tearDownModule():
+    shutil.rmtree(_TMPDIR, ignore_errors=True)
+
+
+class ScratchDirTestCase(unittest.TestCase):
+    """TestCase with a private scratch directory removed in tearDown."""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp(dir=_TMPDIR)
+        self._file_counter = itertools.count()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def _mk(self, suffix: str, content: bytes = b'') -> str:
+        """Write content to a uniquely named file in the test's scratch dir."""
+        path = os.path.join(self.tmp, f'file{next(self._file_counter)}{suffix}')
+        with open(path, 'wb') as f:
+            f.write(content)
+        return path
+
+    def _link(self, target: str, name: str) -> str:
+        """Symlink a shared fixture into the scratch dir under a new name."""
+        path = os.path.join(self.tmp, name)
+        os.symlink(target, path)
+        return path
+
+
 class TestScanResult(unittest.TestCase):
     """Test ScanResult dataclass."""
 
@@ -153,21 +268,15 @@ class TestFileExtension(unittest.TestCase):
         self.assertEqual(get_file_extension('/path/to/file.docx'), 'docx')
 
 
-class TestFileHash(unittest.TestCase):
+class TestFileHash(ScratchDirTestCase):
     """Test file hash computation."""
 
     def test_hash_computation(self):
         """Test computing file hash."""
-        with tempfile.NamedTemporaryFile(delete=False) as f:
-            f.write(b'test content')
-            temp_path = f.name
+        temp_path = self._mk('', b'test content')
 
-        try:
-            hash_value = compute_file_hash(temp_path)
-            self.assertEqual(len(hash_value), 64)  # SHA256 hex length
-            self.assertTrue(all(c in '0123456789abcdef' for c in hash_value))
-        finally:
-            os.unlink(temp_path)
+        hash_value = compute_file_hash(temp_path)
+        self.assertRegex(hash_value, r'^[0-9a-f]{64}$')  # SHA256 hex digest
 
     def test_hash_nonexistent_file(self):
         """Test hash of nonexistent file."""
@@ -176,124 +285,48 @@ class TestFileHash(unittest.TestCase):
 
     def test_hash_same_content_same_hash(self):
         """Test same content produces same hash."""
-        with tempfile.NamedTemporaryFile(delete=False) as f1:
-            f1.write(b'identical content')
-            path1 = f1.name
+        path1 = self._mk('', b'identical content')
+        path2 = self._mk('', b'identical content')
+
+        hash1 = compute_file_hash(path1)
+        hash2 = compute_file_hash(path2)
+        self.assertEqual(hash1, hash2)
+
+    def test_hash_spans_multiple_chunks(self):
+        """Test hashing a file larger than one read chunk."""
+        content = os.urandom(HASH_CHUNK_SIZE * 2 + 123)
+        temp_path = self._mk('', content)
 
-        with tempfile.NamedTemporaryFile(delete=False) as f2:
-            f2.write(b'identical content')
-            path2 = f2.name
+        self.assertEqual(compute_file_hash(temp_path), hashlib.sha256(content).hexdigest())
 
-        try:
-            hash1 = compute_file_hash(path1)
-            hash2 = compute_file_hash(path2)
-            self.assertEqual(hash1, hash2)
-        finally:
-            os.unlink(path1)
-            os.unlink(path2)
+    def test_hash_large_file_uses_mmap_path(self):
+        """Test hashing a file above the mmap threshold."""
+        content = os.urandom(MMAP_HASH_THRESHOLD + 4096)
+        temp_path = self._mk('', content)
+
+        self.assertEqual(compute_file_hash(temp_path), hashlib.sha256(content).hexdigest())
 
 
 class TestFileTypeDetection(unittest.TestCase):
     """Test file type detection from magic bytes."""
 
-    def test_detect_pdf(self):
-        """Test detecting PDF file."""
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as f:
-            f.write(b'%PDF-1.4\n%...')
-            temp_path = f.name
-
-        try:
-            detected = detect_file_type(temp_path)
-            self.assertEqual(detected, 'pdf')
-        finally:
-            os.unlink(temp_path)
-
-    def test_detect_png(self):
-        """Test detecting PNG file."""
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.png') as f:
-            f.write(b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR')
-            temp_path = f.name
-
-        try:
-            detected = detect_file_type(temp_path)
-            self.assertEqual(detected, 'png')
-        finally:
-            os.unlink(temp_path)
-
-    def test_detect_jpeg(self):
-        """Test detecting JPEG file."""
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.jpg') as f:
-            f.write(b'\xff\xd8\xff\xe0\x00\x10JFIF')
-            temp_path = f.name
-
-        try:
-            detected = detect_file_type(temp_path)
-            self.assertEqual(detected, 'jpg')
-        finally:
-            os.unlink(temp_path)
-
-    def test_detect_exe(self):
-        """Test detecting Windows executable."""
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.exe') as f:
-            f.write(b'MZ\x90\x00\x03\x00\x00\x00')
-            temp_path = f.name
-
-        try:
-            detected = detect_file_type(temp_path)
-            self.assertEqual(detected, 'exe')
-        finally:
-            os.unlink(temp_path)
-
-    def test_detect_elf(self):
-        """Test detecting Linux executable."""
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.bin') as f:
-            f.write(b'\x7fELF\x02\x01\x01\x00')
-            temp_path = f.name
-
-        try:
-            detected = detect_file_type(temp_path)
-            self.assertEqual(detected, 'elf')
-        finally:
-            os.unlink(temp_path)
-
-    def test_detect_zip(self):
-        """Test detecting ZIP file."""
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.zip') as f:
-            temp_path = f.name
-
-        try:
-            # Create actual zip file
-            with zipfile.ZipFile(temp_path, 'w') as zf:
-                zf.writestr('test.txt', 'test content')
-
-            detected = detect_file_type(temp_path)
-            self.assertEqual(detected, 'zip')
-        finally:
-            os.unlink(temp_path)
-
-    def test_detect_rtf(self):
-        """Test detecting RTF file."""
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.rtf') as f:
-            f.write(b'{\\rtf1\\ansi\\deff0')
-            temp_path = f.name
-
-        try:
-            detected = detect_file_type(temp_path)
-            self.assertEqual(detected, 'rtf')
-        finally:
-            os.unlink(temp_path)
-
-    def test_detect_unknown(self):
-        """Test detecting unknown file type."""
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.xyz') as f:
-            f.write(b'\x00\x01\x02\x03\x04\x05')
-            temp_path = f.name
-
-        try:
-            detected = detect_file_type(temp_path)
-            self.assertEqual(detected, 'unknown')
-        finally:
-            os.unlink(temp_path)
+    # (fixture name, expected detected type)
+    CASES = [
+        ('safe.pdf', 'pdf'),
+        ('image.png', 'png'),
+        ('photo.jpg', 'jpg'),
+        ('malware.exe', 'exe'),
+        ('program.bin', 'elf'),
+        ('document.rtf', 'rtf'),
+        ('data.xyz', 'unknown'),
+        ('safe.zip', 'zip'),
+    ]
+
+    def test_detect_magic_bytes(self):
+        """Test detecting each file type from its magic bytes."""
+        for name, expected in self.CASES:
+            with self.subTest(expected=expected):
+                self.assertEqual(detect_file_type(_fixture(name)), expected)
 
 
 class TestExtensionMatching(unittest.TestCase):
@@ -332,113 +365,80 @@ class TestExtensionMatching(unittest.TestCase):
 class TestExecutableDetection(unittest.TestCase):
     """Test executable content detection."""
 
-    def test_detect_pe_executable(self):
-        """Test detecting PE (Windows) executable."""
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.exe') as f:
-            f.write(b'MZ\x90\x00\x03\x00\x00\x00')
-            temp_path = f.name
-
-        try:
-            has_exec, issues = check_for_executable_content(temp_path)
-            self.assertTrue(has_exec)
-            self.assertTrue(any('Windows executable' in i for i in issues))
-        finally:
-            os.unlink(temp_path)
-
-    def test_detect_elf_executable(self):
-        """Test detecting ELF (Linux) executable."""
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.bin') as f:
-            f.write(b'\x7fELF\x02\x01\x01\x00')
-            temp_path = f.name
-
-        try:
-            has_exec, issues = check_for_executable_content(temp_path)
-            self.assertTrue(has_exec)
-            self.assertTrue(any('Linux executable' in i for i in issues))
-        finally:
-            os.unlink(temp_path)
-
-    def test_detect_shell_script(self):
-        """Test detecting shell script."""
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.sh') as f:
-            f.write(b'#!/bin/bash\necho "test"')
-            temp_path = f.name
-
-        try:
-            has_exec, issues = check_for_executable_content(temp_path)
-            self.assertTrue(has_exec)
-            self.assertTrue(any('shell script' in i for i in issues))
-        finally:
-            os.unlink(temp_path)
-
-    def test_safe_pdf(self):
-        """Test safe PDF has no executable."""
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as f:
-            f.write(b'%PDF-1.4\n%...')
-            temp_path = f.name
-
-        try:
-            has_exec, issues = check_for_executable_content(temp_path)
-            self.assertFalse(has_exec)
-            self.assertEqual(issues, [])
-        finally:
-            os.unlink(temp_path)
-
-
-class TestPDFScriptDetection(unittest.TestCase):
+    # (fixture name, expected issue fragment or None for no executable)
+    CASES = [
+        ('malware.exe', 'Windows executable'),
+        ('program.bin', 'Linux executable'),
+        ('script.sh', 'shell script'),
+        ('safe.pdf', None),
+    ]
+
+    def test_executable_content(self):
+        """Test PE, ELF and shell script headers are detected; a PDF is not."""
+        for name, fragment in self.CASES:
+            with self.subTest(name=name):
+                has_exec, issues = check_for_executable_content(_fixture(name))
+                if fragment is None:
+                    self.assertFalse(has_exec)
+                    self.assertEqual(issues, [])
+                else:
+                    self.assertTrue(has_exec)
+                    self.assertTrue(any(fragment in i for i in issues))
+
+
+class TestPDFScriptDetection(ScratchDirTestCase):
     """Test PDF JavaScript detection."""
 
     def test_pdf_with_javascript(self):
         """Test detecting JavaScript in PDF."""
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as f:
-            f.write(b'%PDF-1.4\n/JavaScript (alert("test"))\n%%EOF')
-            temp_path = f.name
+        temp_path = self._mk('.pdf', b'%PDF-1.4\n/JavaScript (alert("test"))\n%%EOF')
 
-        try:
-            has_scripts, issues = check_pdf_for_scripts(temp_path)
-            self.assertTrue(has_scripts)
-            self.assertTrue(any('JavaScript' in i for i in issues))
-        finally:
-            os.unlink(temp_path)
+        has_scripts, issues = check_pdf_for_scripts(temp_path)
+        self.assertTrue(has_scripts)
+        self.assertTrue(any('JavaScript' in i for i in issues))
 
     def test_pdf_with_launch_action(self):
         """Test detecting Launch action in PDF."""
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as f:
-            f.write(b'%PDF-1.4\n/Launch /F (cmd.exe)\n%%EOF')
-            temp_path = f.name
+        temp_path = self._mk('.pdf', b'%PDF-1.4\n/Launch /F (cmd.exe)\n%%EOF')
 
-        try:
-            has_scripts, issues = check_pdf_for_scripts(temp_path)
-            self.assertTrue(has_scripts)
-            self.assertTrue(any('Launch' in i for i in issues))
-        finally:
-            os.unlink(temp_path)
+        has_scripts, issues = check_pdf_for_scripts(temp_path)
+        self.assertTrue(has_scripts)
+        self.assertTrue(any('Launch' in i for i in issues))
 
     def test_pdf_with_embedded_files(self):
         """Test detecting embedded files in PDF."""
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as f:
-            f.write(b'%PDF-1.4\n/EmbeddedFile /test.exe\n%%EOF')
-            temp_path = f.name
+        temp_path = self._mk('.pdf', b'%PDF-1.4\n/EmbeddedFile /test.exe\n%%EOF')
+
+        has_scripts, issues = check_pdf_for_scripts(temp_path)
+        self.assertTrue(has_scripts)
+        self.assertTrue(any('embedded' in i.lower() for i in issues))
+
+    def test_pdf_with_xfa_form(self):
+        """Test detecting XFA form in PDF with AcroForm."""
+        temp_path = self._mk('.pdf', b'%PDF-1.4\n/AcroForm << /XFA 5 0 R >>\n%%EOF')
+
+        has_scripts, issues = check_pdf_for_scripts(temp_path)
+        self.assertTrue(has_scripts)
+        self.assertTrue(any('XFA' in i for i in issues))
 
-        try:
-            has_scripts, issues = check_pdf_for_scripts(temp_path)
-            self.assertTrue(has_scripts)
-            self.assertTrue(any('embedded' in i.lower() for i in issues))
-        finally:
-            os.unlink(temp_path)
+    def test_pdf_mid_file_marker_detected(self):
+        """Test markers in the middle of a large PDF are found."""
+        padding = b' ' * (64 * 1024)
+        temp_path = self._mk('.pdf', b'%PDF-1.4\n' + padding + b'/Launch /F (cmd.exe)\n' + padding + b'%%EOF')
+
+        has_scripts, issues = check_pdf_for_scripts(temp_path)
+        self.assertTrue(has_scripts)
+        self.assertTrue(any('Launch' in i for i in issues))
+
+        result = scan_attachment(temp_path)
+        self.assertFalse(result.is_safe)
+        self.assertTrue(any('Launch' in i for i in result.issues))
 
     def test_safe_pdf(self):
         """Test safe PDF without scripts."""
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as f:
-            f.write(b'%PDF-1.4\n/Page 1 0 R\n/Type /Catalog\n%%EOF')
-            temp_path = f.name
-
-        try:
-            has_scripts, issues = check_pdf_for_scripts(temp_path)
-            self.assertFalse(has_scripts)
-            self.assertEqual(issues, [])
-        finally:
-            os.unlink(temp_path)
+        has_scripts, issues = check_pdf_for_scripts(SAFE_PDF)
+        self.assertFalse(has_scripts)
+        self.assertEqual(issues, [])
 
 
 class TestOfficeMacroDetection(unittest.TestCase):
@@ -446,210 +446,192 @@ class TestOfficeMacroDetection(unittest.TestCase):
 
     def test_macro_enabled_extension(self):
         """Test detecting macro-enabled extension."""
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.docm') as f:
-            f.write(b'test')
-            temp_path = f.name
-
-        try:
-            has_macros, issues = check_office_for_macros(temp_path)
-            self.assertTrue(has_macros)
-            self.assertTrue(any('macro-enabled' in i for i in issues))
-        finally:
-            os.unlink(temp_path)
+        has_macros, issues = check_office_for_macros(DOCM_FILE)
+        self.assertTrue(has_macros)
+        self.assertTrue(any('macro-enabled' in i for i in issues))
 
     def test_xlsm_macro_extension(self):
         """Test detecting xlsm macro extension."""
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.xlsm') as f:
-            f.write(b'test')
-            temp_path = f.name
-
-        try:
-            has_macros, issues = check_office_for_macros(temp_path)
-            self.assertTrue(has_macros)
-        finally:
-            os.unlink(temp_path)
+        has_macros, issues = check_office_for_macros(_fixture('macro.xlsm'))
+        self.assertTrue(has_macros)
 
     def test_doc_with_vba(self):
         """Test detecting VBA in DOC file."""
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.doc') as f:
-            f.write(b'\xd0\xcf\x11\xe0_VBA_PROJECT_test')
-            temp_path = f.name
-
-        try:
-            has_macros, issues = check_office_for_macros(temp_path)
-            self.assertTrue(has_macros)
-            self.assertTrue(any('VBA' in i for i in issues))
-        finally:
-            os.unlink(temp_path)
+        has_macros, issues = check_office_for_macros(DOC_VBA_FILE)
+        self.assertTrue(has_macros)
+        self.assertTrue(any('VBA' in i for i in issues))
 
 
-class TestArchiveSecurity(unittest.TestCase):
+class TestArchiveSecurity(ScratchDirTestCase):
     """Test archive security checks."""
 
     def test_safe_zip(self):
         """Test scanning safe ZIP file."""
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.zip') as f:
-            temp_path = f.name
-
-        try:
-            with zipfile.ZipFile(temp_path, 'w') as zf:
-                zf.writestr('document.txt', 'Hello world')
-                zf.writestr('readme.md', 'Some readme')
-
-            has_threats, issues = check_archive_for_threats(temp_path)
-            self.assertFalse(has_threats)
-            self.assertEqual(issues, [])
-        finally:
-            os.unlink(temp_path)
+        has_threats, issues = check_archive_for_threats(ZIP_SAFE)
+        self.assertFalse(has_threats)
+        self.assertEqual(issues, [])
 
     def test_zip_with_executable(self):
         """Test detecting executable inside ZIP."""
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.zip') as f:
-            temp_path = f.name
-
-        try:
-            with zipfile.ZipFile(temp_path, 'w') as zf:
-                zf.writestr('malware.exe', 'MZ\x90\x00')
-                zf.writestr('readme.txt', 'This is malware')
-
-            has_threats, issues = check_archive_for_threats(temp_path)
-            self.assertTrue(has_threats)
-            self.assertTrue(any('dangerous file type' in i for i in issues))
-        finally:
-            os.unlink(temp_path)
+        has_threats, issues = check_archive_for_threats(_fixture('with_exe.zip'))
+        self.assertTrue(has_threats)
+        self.assertTrue(any('dangerous file type' in i for i in issues))
 
     def test_zip_with_path_traversal(self):
         """Test detecting path traversal in ZIP."""
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.zip') as f:
-            temp_path = f.name
-
-        try:
+        has_threats, issues = check_archive_for_threats(ZIP_TRAVERSAL)
+        self.assertTrue(has_threats)
+        self.assertTrue(any('path traversal' in i for i in issues))
+
+    def test_zip_bomb_ratio(self):
+        """Test detecting a suspicious compression ratio in ZIP."""
+        has_threats, issues = check_archive_for_threats(ZIP_BOMB)
+        self.assertTrue(has_threats)
+        self.assertTrue(any('archive bomb' in i for i in issues))
+
+    def test_zip_dotted_name_not_traversal(self):
+        """Test '..' inside a file name is not treated as path traversal."""
+        temp_path = self._mk('.zip')
+
+        with zipfile.ZipFile(temp_path, 'w') as zf:
+            zf.writestr('notes..final.txt', 'draft')
+            zf.writestr('..\\..\\windows\\evil.txt', 'payload')
+
+        _, issues = check_archive_for_threats(temp_path)
+        traversal = [i for i in issues if 'path traversal' in i]
+        self.assertEqual(len(traversal), 1)
+        self.assertIn('windows', traversal[0])
+
+    def test_zip_too_many_members(self):
+        """Test archives with too many members are flagged."""
+        temp_path = self._mk('.zip')
+
+        with patch('upwork_attachment_scanner.MAX_ARCHIVE_MEMBERS', 2):
             with zipfile.ZipFile(temp_path, 'w') as zf:
-                zf.writestr('../../../etc/passwd', 'root:x:0:0:')
+                for i in range(3):
+                    zf.writestr(f'file{i}.txt', 'x')
 
             has_threats, issues = check_archive_for_threats(temp_path)
-            self.assertTrue(has_threats)
-            self.assertTrue(any('path traversal' in i for i in issues))
-        finally:
-            os.unlink(temp_path)
+
+        self.assertTrue(has_threats)
+        self.assertTrue(any('too many files' in i for i in issues))
 
     def test_invalid_zip(self):
         """Test handling invalid ZIP file."""
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.zip') as f:
-            f.write(b'This is not a zip file')
-            temp_path = f.name
-
-        try:
-            has_threats, issues = check_archive_for_threats(temp_path)
-            self.assertTrue(has_threats)
-            self.assertTrue(any('Invalid' in i or 'corrupted' in i for i in issues))
-        finally:
-            os.unlink(temp_path)
+        has_threats, issues = check_archive_for_threats(_fixture('corrupt.zip'))
+        self.assertTrue(has_threats)
+        self.assertTrue(any('Invalid' in i or 'corrupted' in i for i in issues))
 
 
 class TestDangerousExtensions(unittest.TestCase):
     """Test dangerous extension detection."""
 
-    def test_exe_is_dangerous(self):
-        """Test .exe is flagged as dangerous."""
-        is_dangerous, issues = check_dangerous_extension('/tmp/test.exe')
-        self.assertTrue(is_dangerous)
+    # (path, expected is_dangerous)
+    CASES = [
+        ('/tmp/test.exe', True),
+        ('/tmp/test.bat', True),
+        ('/tmp/script.ps1', True),
+        ('/tmp/test.pdf', False),
+        ('/tmp/document.pdf.exe', True),  # double extension
+    ]
 
-    def test_bat_is_dangerous(self):
-        """Test .bat is flagged as dangerous."""
-        is_dangerous, issues = check_dangerous_extension('/tmp/test.bat')
-        self.assertTrue(is_dangerous)
-
-    def test_ps1_is_dangerous(self):
-        """Test .ps1 is flagged as dangerous."""
-        is_dangerous, issues = check_dangerous_extension('/tmp/script.ps1')
-        self.assertTrue(is_dangerous)
-
-    def test_pdf_is_not_dangerous(self):
-        """Test .pdf is not flagged as dangerous."""
-        is_dangerous, issues = check_dangerous_extension('/tmp/test.pdf')
-        self.assertFalse(is_dangerous)
-
-    def test_double_extension_suspicious(self):
-        """Test double extension detection."""
-        is_dangerous, issues = check_dangerous_extension('/tmp/document.pdf.exe')
-        self.assertTrue(is_dangerous)
+    def test_dangerous_extensions(self):
+        """Test executables, scripts and double extensions are flagged; PDF is not."""
+        for path, expected in self.CASES:
+            with self.subTest(path=path):
+                is_dangerous, _ = check_dangerous_extension(path)
+                self.assertEqual(is_dangerous, expected)
 
 
 class TestAllowedExtensions(unittest.TestCase):
     """Test allowed extension checking."""
 
-    def test_pdf_allowed(self):
-        """Test PDF is allowed."""
-        is_allowed, _ = check_allowed_extension('/tmp/test.pdf')
-        self.assertTrue(is_allowed)
-
-    def test_docx_allowed(self):
-        """Test DOCX is allowed."""
-        is_allowed, _ = check_allowed_extension('/tmp/test.docx')
-        self.assertTrue(is_allowed)
+    # (path, expected is_allowed)
+    CASES = [
+        ('/tmp/test.pdf', True),
+        ('/tmp/test.docx', True),
+        ('/tmp/image.jpg', True),
+        ('/tmp/test.exe', False),
+        ('/tmp/testfile', False),  # no extension
+    ]
 
-    def test_jpg_allowed(self):
-        """Test JPG is allowed."""
-        is_allowed, _ = check_allowed_extension('/tmp/image.jpg')
-        self.assertTrue(is_allowed)
+    def test_allowed_extensions(self):
+        """Test document and image extensions are allowed; EXE and none are not."""
+        for path, expected in self.CASES:
+            with self.subTest(path=path):
+                is_allowed, _ = check_allowed_extension(path)
+                self.assertEqual(is_allowed, expected)
 
-    def test_exe_not_allowed(self):
-        """Test EXE is not allowed."""
-        is_allowed, warnings = check_allowed_extension('/tmp/test.exe')
-        self.assertFalse(is_allowed)
 
-    def test_no_extension_not_allowed(self):
-        """Test file without extension."""
-        is_allowed, warnings = check_allowed_extension('/tmp/testfile')
-        self.assertFalse(is_allowed)
-
-
-class TestScanAttachment(unittest.TestCase):
+class TestScanAttachment(ScratchDirTestCase):
     """Test the main scan_attachment function."""
 
     def test_scan_safe_pdf(self):
         """Test scanning safe PDF."""
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as f:
-            f.write(b'%PDF-1.4\n/Catalog 1 0 R\n%%EOF')
-            temp_path = f.name
-
-        try:
-            result = scan_attachment(temp_path)
-            self.assertTrue(result.is_safe)
-            self.assertEqual(result.detected_type, 'pdf')
-            self.assertEqual(result.file_extension, 'pdf')
-            self.assertEqual(len(result.issues), 0)
-        finally:
-            os.unlink(temp_path)
+        result = scan_attachment(SAFE_PDF)
+        self.assertTrue(result.is_safe)
+        self.assertEqual(result.detected_type, 'pdf')
+        self.assertEqual(result.file_extension, 'pdf')
+        self.assertEqual(len(result.issues), 0)
 
     def test_scan_executable(self):
         """Test scanning executable file."""
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.exe') as f:
-            f.write(b'MZ\x90\x00\x03\x00\x00\x00')
-            temp_path = f.name
+        result = scan_attachment(EXE_FILE)
+        self.assertFalse(result.is_safe)
+        self.assertTrue(len(result.issues) > 0)
 
-        try:
-            result = scan_attachment(temp_path)
-            self.assertFalse(result.is_safe)
-            self.assertTrue(len(result.issues) > 0)
-        finally:
-            os.unlink(temp_path)
+    def test_scan_executable_fast_reject(self):
+        """Test fast_reject skips hashing files with a dangerous extension."""
+        result = scan_attachment(EXE_FILE, fast_reject=True)
+        self.assertFalse(result.is_safe)
+        self.assertTrue(any('dangerous extension' in i for i in result.issues))
+        self.assertEqual(result.file_hash, '')
 
     def test_scan_type_mismatch(self):
         """Test scanning file with type mismatch."""
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as f:
-            # Write EXE signature but name it .pdf
-            f.write(b'MZ\x90\x00\x03\x00\x00\x00')
-            temp_path = f.name
-
-        try:
-            result = scan_attachment(temp_path)
-            self.assertFalse(result.is_safe)
-            self.assertTrue(any('mismatch' in i.lower() or 'executable' in i.lower()
-                                for i in result.issues))
-        finally:
-            os.unlink(temp_path)
+        # EXE signature but named .pdf
+        temp_path = self._link(EXE_FILE, 'fake.pdf')
+
+        result = scan_attachment(temp_path)
+        self.assertFalse(result.is_safe)
+        self.assertTrue(any('mismatch' in i.lower() or 'executable' in i.lower()
+                            for i in result.issues))
+
+    def test_scan_reads_header_once(self):
+        """Test scan_attachment shares one header read across checks."""
+        with patch('upwork_attachment_scanner.read_file_header',
+                   wraps=read_file_header) as spy:
+            result = scan_attachment(PNG_FILE)
+
+        self.assertTrue(result.is_safe)
+        self.assertEqual(spy.call_count, 1)
+
+    def test_scan_hashes_with_compute_file_hash(self):
+        """Test scan_attachment hashes the file through compute_file_hash."""
+        with patch('upwork_attachment_scanner.compute_file_hash',
+                   wraps=compute_file_hash) as spy:
+            result = scan_attachment(PNG_FILE)
+
+        spy.assert_called_once_with(PNG_FILE)
+        self.assertEqual(result.file_hash, compute_file_hash(PNG_FILE))
+
+    def test_scan_matches_in_memory_validation(self):
+        """Test scanning a file and validating its bytes give the same findings."""
+        names = ['safe.pdf', 'image.png', 'malware.exe', 'legacy.doc',
+                 'with_exe.zip', 'traversal.zip', 'corrupt.zip']
+        for name in names:
+            with self.subTest(name=name):
+                path = _fixture(name)
+                with open(path, 'rb') as f:
+                    data = f.read()
+
+                from_file = scan_attachment(path)
+                is_safe, from_bytes = validate_attachment_bytes(data, name)
+
+                self.assertEqual(is_safe, from_file.is_safe)
+                self.assertEqual(from_bytes.detected_type, from_file.detected_type)
+                self.assertEqual(from_bytes.issues, from_file.issues)
+                self.assertEqual(from_bytes.file_hash, from_file.file_hash)
 
     def test_scan_nonexistent_file(self):
         """Test scanning nonexistent file."""
@@ -659,169 +641,152 @@ class TestScanAttachment(unittest.TestCase):
 
     def test_scan_has_file_hash(self):
         """Test scan result includes file hash."""
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.txt') as f:
-            f.write(b'test content')
-            temp_path = f.name
+        temp_path = self._mk('.txt', b'test content')
 
-        try:
-            result = scan_attachment(temp_path)
-            self.assertTrue(len(result.file_hash) > 0)
-            self.assertEqual(len(result.file_hash), 64)
-        finally:
-            os.unlink(temp_path)
+        result = scan_attachment(temp_path)
+        self.assertTrue(len(result.file_hash) > 0)
+        self.assertEqual(len(result.file_hash), 64)
 
 
-class TestFeature84SecurityChecks(unittest.TestCase):
+class TestFeature84SecurityChecks(ScratchDirTestCase):
     """Tests specifically for Feature #84 requirements."""
 
     def test_feature84_download_and_scan(self):
         """Test: Download job attachment and run basic security checks."""
         # Simulate downloaded attachment
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as f:
-            f.write(b'%PDF-1.4\n/Page 1\n%%EOF')
-            temp_path = f.name
-
-        try:
-            result = scan_attachment(temp_path)
-            self.assertIsInstance(result, ScanResult)
-            self.assertIn('file_path', result.to_dict())
-            self.assertIn('is_safe', result.to_dict())
-            self.assertIn('issues', result.to_dict())
-        finally:
-            os.unlink(temp_path)
+        result = scan_attachment(SAFE_PDF)
+        self.assertIsInstance(result, ScanResult)
+        self.assertIn('file_path', result.to_dict())
+        self.assertIn('is_safe', result.to_dict())
+        self.assertIn('issues', result.to_dict())
 
     def test_feature84_verify_no_executable(self):
         """Test: Verify no executable content in safe files."""
-        # Create safe document
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as f:
-            f.write(b'%PDF-1.4\nThis is a safe document\n%%EOF')
-            temp_path = f.name
-
-        try:
-            result = scan_attachment(temp_path)
-            # Should be safe (no executable)
-            self.assertTrue(result.is_safe)
-            self.assertFalse(any('executable' in i.lower() for i in result.issues))
-        finally:
-            os.unlink(temp_path)
+        result = scan_attachment(SAFE_PDF)
+        # Should be safe (no executable)
+        self.assertTrue(result.is_safe)
+        self.assertFalse(any('executable' in i.lower() for i in result.issues))
 
     def test_feature84_detect_executable_content(self):
         """Test: Verify executable content is detected and rejected."""
-        # Create file with executable content
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as f:
-            f.write(b'MZ\x90\x00\x03\x00PE header')
-            temp_path = f.name
-
-        try:
-            result = scan_attachment(temp_path)
-            # Should not be safe (has executable signature)
-            self.assertFalse(result.is_safe)
-            self.assertTrue(
-                any('executable' in i.lower() or 'mismatch' in i.lower()
-                    for i in result.issues)
-            )
-        finally:
-            os.unlink(temp_path)
+        # Executable content under a document name
+        temp_path = self._link(EXE_FILE, 'invoice.pdf')
+
+        result = scan_attachment(temp_path)
+        # Should not be safe (has executable signature)
+        self.assertFalse(result.is_safe)
+        self.assertTrue(
+            any('executable' in i.lower() or 'mismatch' in i.lower()
+                for i in result.issues)
+        )
 
     def test_feature84_file_type_matches_extension(self):
         """Test: Verify file type matches extension - matching case."""
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.png') as f:
-            f.write(b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR')
-            temp_path = f.name
-
-        try:
-            result = scan_attachment(temp_path)
-            self.assertTrue(result.is_safe)
-            self.assertEqual(result.detected_type, 'png')
-            self.assertEqual(result.file_extension, 'png')
-        finally:
-            os.unlink(temp_path)
+        result = scan_attachment(PNG_FILE)
+        self.assertTrue(result.is_safe)
+        self.assertEqual(result.detected_type, 'png')
+        self.assertEqual(result.file_extension, 'png')
 
     def test_feature84_file_type_mismatch_detected(self):
         """Test: Verify file type mismatch is detected."""
-        # Create PNG file but name it .pdf
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as f:
-            f.write(b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR')
-            temp_path = f.name
-
-        try:
-            result = scan_attachment(temp_path)
-            self.assertFalse(result.is_safe)
-            self.assertTrue(any('mismatch' in i.lower() for i in result.issues))
-        finally:
-            os.unlink(temp_path)
+        # PNG file but named .pdf
+        temp_path = self._link(PNG_FILE, 'image.pdf')
+
+        result = scan_attachment(temp_path)
+        self.assertFalse(result.is_safe)
+        self.assertTrue(any('mismatch' in i.lower() for i in result.issues))
 
     def test_feature84_validate_for_processing(self):
         """Test: validate_attachment_for_processing returns correct tuple."""
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as f:
-            f.write(b'%PDF-1.4\n%%EOF')
-            temp_path = f.name
+        is_safe, result = validate_attachment_for_processing(SAFE_PDF)
+        self.assertIsInstance(is_safe, bool)
+        self.assertIsInstance(result, ScanResult)
+        self.assertEqual(is_safe, result.is_safe)
 
-        try:
-            is_safe, result = validate_attachment_for_processing(temp_path)
-            self.assertIsInstance(is_safe, bool)
-            self.assertIsInstance(result, ScanResult)
-            self.assertEqual(is_safe, result.is_safe)
-        finally:
-            os.unlink(temp_path)
 
-
-class TestBatchScanning(unittest.TestCase):
+class TestBatchScanning(ScratchDirTestCase):
     """Test batch scanning functionality."""
 
     def test_scan_directory(self):
         """Test scanning a directory of files."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create test files
-            pdf_path = os.path.join(tmpdir, 'doc.pdf')
-            txt_path = os.path.join(tmpdir, 'note.txt')
+        # Create test files
+        self._mk('.pdf', b'%PDF-1.4\n%%EOF')
+        self._mk('.txt', b'Hello world')
+
+        results = scan_directory(self.tmp)
+        self.assertEqual(len(results), 2)
+        self.assertTrue(all(isinstance(r, ScanResult) for r in results))
 
-            with open(pdf_path, 'wb') as f:
-                f.write(b'%PDF-1.4\n%%EOF')
-            with open(txt_path, 'w') as f:
-                f.write('Hello world')
+    def test_scan_directory_recursive(self):
+        """Test scanning descends into subdirectories only when recursive."""
+        self._mk('.txt', b'top level')
+        nested = os.path.join(self.tmp, 'nested')
+        os.mkdir(nested)
+        with open(os.path.join(nested, 'inner.txt'), 'wb') as f:
+            f.write(b'nested file')
 
-            results = scan_directory(tmpdir)
-            self.assertEqual(len(results), 2)
-            self.assertTrue(all(isinstance(r, ScanResult) for r in results))
+        self.assertEqual(len(scan_directory(self.tmp)), 2)
+        self.assertEqual(len(scan_directory(self.tmp, recursive=False)), 1)
+
+    def test_iter_directory_files_large_tree_skips_stat(self):
+        """Test listing many files relies on DirEntry type info, not os.stat."""
+        paths = {self._mk('.txt') for _ in range(500)}
+
+        with patch('upwork_attachment_scanner.os.stat', wraps=os.stat) as stat_spy:
+            listed = set(iter_directory_files(self.tmp))
+
+        self.assertEqual(listed, paths)
+        self.assertEqual(stat_spy.call_count, 0)
 
     def test_scan_batch(self):
         """Test batch scanning files."""
-        paths = []
-        try:
-            for i in range(3):
-                with tempfile.NamedTemporaryFile(delete=False, suffix='.txt') as f:
-                    f.write(f'Content {i}'.encode())
-                    paths.append(f.name)
-
-            results = scan_attachments_batch(paths)
-            self.assertEqual(len(results), 3)
-        finally:
-            for p in paths:
-                os.unlink(p)
+        paths = [self._mk('.txt', f'Content {i}'.encode()) for i in range(3)]
+
+        results = scan_attachments_batch(paths)
+        self.assertEqual(len(results), 3)
+
+    def test_scan_batch_parallel_matches_serial(self):
+        """Test parallel batch scanning preserves order and matches serial scan."""
+        paths = [self._mk('.txt', f'Content {i}'.encode()) for i in range(6)]
+
+        serial = scan_attachments_batch(paths, max_workers=1)
+        parallel = scan_attachments_batch(paths, max_workers=4)
+
+        self.assertEqual([r.file_path for r in parallel], paths)
+        self.assertEqual([r.file_hash for r in parallel], [r.file_hash for r in serial])
+
+    def test_scan_batch_reuses_result_for_duplicate_content(self):
+        """Test identical attachments in a batch are only fully scanned once."""
+        first = os.path.join(self.tmp, 'job1', 'brief.pdf')
+        second = os.path.join(self.tmp, 'job2', 'brief.pdf')
+        for path in (first, second):
+            os.mkdir(os.path.dirname(path))
+            with open(path, 'wb') as f:
+                f.write(b'%PDF-1.4\n/Launch /F (cmd.exe)\n%%EOF')
+
+        with patch('upwork_attachment_scanner.detect_file_type',
+                   wraps=detect_file_type) as spy:
+            results = scan_attachments_batch([first, second], max_workers=1)
+
+        self.assertEqual(spy.call_count, 1)
+        self.assertEqual([r.file_path for r in results], [first, second])
+        self.assertEqual(results[0].issues, results[1].issues)
+        self.assertIsNot(results[0].issues, results[1].issues)
 
     def test_filter_safe_attachments(self):
         """Test filtering safe attachments."""
-        paths = []
-        try:
-            # Create safe file
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as f:
-                f.write(b'%PDF-1.4\n%%EOF')
-                paths.append(f.name)
-
-            # Create unsafe file (exe signature with pdf extension)
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as f:
-                f.write(b'MZ\x90\x00PE header')
-                paths.append(f.name)
+        paths = [
+            # Safe file
+            SAFE_PDF,
+            # Unsafe file (exe signature with pdf extension)
+            self._link(EXE_FILE, 'fake.pdf'),
+        ]
 
-            safe_paths, results = filter_safe_attachments(paths)
+        safe_paths, results = filter_safe_attachments(paths)
 
-            # Only one should be safe
-            self.assertEqual(len(safe_paths), 1)
-            self.assertEqual(len(results), 2)
-        finally:
-            for p in paths:
-                os.unlink(p)
+        # Only one should be safe
+        self.assertEqual(len(safe_paths), 1)
+        self.assertEqual(len(results), 2)
 
 
 class TestScanSummary(unittest.TestCase):
@@ -890,63 +855,71 @@ class TestConstants(unittest.TestCase):
 class TestIntegration(unittest.TestCase):
     """Integration tests for attachment scanning."""
 
+    # Directory tree shared by every test in the class: built once in
+    # setUpClass and treated as read-only.
+    FILES = {
+        'safe.pdf': b'%PDF-1.4\n%%EOF',         # Safe PDF
+        'readme.txt': b'This is a readme file',  # Safe text
+        'malware.exe': b'MZ\x90\x00PE',          # Dangerous executable
+    }
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmpdir = tempfile.mkdtemp(dir=_TMPDIR)
+        cls.paths = []
+        for name, content in cls.FILES.items():
+            path = os.path.join(cls.tmpdir, name)
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+            try:
+                os.write(fd, content)
+            finally:
+                os.close(fd)
+            cls.paths.append(path)
+
+    @classmethod
+    def tearDownClass(cls):
+        with os.scandir(cls.tmpdir) as entries:
+            for entry in entries:
+                os.unlink(entry.path)
+        os.rmdir(cls.tmpdir)
+
     def test_full_scan_workflow(self):
         """Test complete scan workflow."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create various test files
-            files = {}
-
-            # Safe PDF
-            files['safe.pdf'] = b'%PDF-1.4\n%%EOF'
+        results = scan_directory(self.tmpdir)
 
-            # Safe text
-            files['readme.txt'] = b'This is a readme file'
+        # Verify results
+        self.assertEqual(len(results), 3)
 
-            # Dangerous executable
-            files['malware.exe'] = b'MZ\x90\x00PE'
+        # Check safe files
+        safe_count = sum(1 for r in results if r.is_safe)
+        self.assertGreaterEqual(safe_count, 1)
 
-            # Create files
-            paths = []
-            for name, content in files.items():
-                path = os.path.join(tmpdir, name)
-                with open(path, 'wb') as f:
-                    f.write(content)
-                paths.append(path)
+        # Check unsafe files
+        unsafe_count = sum(1 for r in results if not r.is_safe)
+        self.assertGreaterEqual(unsafe_count, 1)
 
-            # Scan directory
-            results = scan_directory(tmpdir)
+    def test_scan_directory_lists_once_with_scandir(self):
+        """Test a flat directory is listed with a single os.scandir call."""
+        with patch('upwork_attachment_scanner.os.scandir', wraps=os.scandir) as spy:
+            results = scan_directory(self.tmpdir)
 
-            # Verify results
-            self.assertEqual(len(results), 3)
-
-            # Check safe files
-            safe_count = sum(1 for r in results if r.is_safe)
-            self.assertGreaterEqual(safe_count, 1)
-
-            # Check unsafe files
-            unsafe_count = sum(1 for r in results if not r.is_safe)
-            self.assertGreaterEqual(unsafe_count, 1)
+        self.assertEqual(spy.call_count, 1)
+        self.assertEqual(sorted(r.file_path for r in results), sorted(self.paths))
 
     def test_deep_extractor_integration(self):
         """Test integration with deep extractor pattern."""
-        # Simulate what deep extractor would do
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as f:
-            f.write(b'%PDF-1.4\nSafe document content\n%%EOF')
-            attachment_path = f.name
-
-        try:
-            # Deep extractor would call this
-            is_safe, scan_result = validate_attachment_for_processing(attachment_path)
-
-            if is_safe:
-                # Proceed with text extraction
-                self.assertTrue(scan_result.is_safe)
-            else:
-                # Skip this attachment
-                self.assertFalse(scan_result.is_safe)
-                self.assertGreater(len(scan_result.issues), 0)
-        finally:
-            os.unlink(attachment_path)
+        # Deep extractor validates the downloaded bytes before writing them
+        is_safe, scan_result = validate_attachment_bytes(
+            b'%PDF-1.4\nSafe document content\n%%EOF', 'doc.pdf'
+        )
+
+        if is_safe:
+            # Proceed with text extraction
+            self.assertTrue(scan_result.is_safe)
+        else:
+            # Skip this attachment
+            self.assertFalse(scan_result.is_safe)
+            self.assertGreater(len(scan_result.issues), 0)
 
 
 if __name__ == '__main__':
@@ -12,17 +12,21 @@ import os
 import sys
 import json
 import unittest
+from types import MappingProxyType, SimpleNamespace
 from unittest.mock import Mock, patch, MagicMock
-from dataclasses import asdict
+import dataclasses
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Add parent directory to path for direct runs (conftest.py covers pytest)
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
 
 from executions.upwork_boost_decider import (
     BoostDecision,
     create_boost_prompt,
     parse_boost_response,
     rule_based_boost_decision,
+    rule_based_boost_decisions,
     merge_decision_with_job,
     decide_boost_sync,
     HIGH_VALUE_SPEND_THRESHOLD,
@@ -31,6 +35,52 @@ from executions.upwork_boost_decider import (
     NEW_CLIENT_SPEND_THRESHOLD
 )
 
+# Field names are fixed by the dataclass definition, so collect them once
+# rather than building a dict per assertion.
+_BOOST_FIELDS = {f.name for f in dataclasses.fields(BoostDecision)}
+
+# Read-only job fixtures shared by tests that only pass them to the decider.
+# Variants are separate constants rather than copies of a base job.
+_HIGH_VALUE_JOB = MappingProxyType({
+    'job_id': 'highvalue1',
+    'title': 'Enterprise AI Project',
+    'client_spent': 15000,
+    'client_hires': 8,
+    'payment_verified': True
+})
+
+_HIGH_VALUE_JOB_UNVERIFIED = MappingProxyType({
+    'job_id': 'highvalue3',
+    'title': 'Big Project',
+    'client_spent': 20000,
+    'client_hires': 15,
+    'payment_verified': False  # Not verified!
+})
+
+_NEW_CLIENT_JOB = MappingProxyType({
+    'job_id': 'newclient1',
+    'title': 'First Project',
+    'client_spent': 0,
+    'client_hires': 0,
+    'payment_verified': True
+})
+
+_NEW_CLIENT_JOB_UNVERIFIED = MappingProxyType({
+    'job_id': 'newclient3',
+    'title': 'Risky Project',
+    'client_spent': 0,
+    'client_hires': 0,
+    'payment_verified': False
+})
+
+_API_JOB = MappingProxyType({
+    'job_id': 'api1',
+    'title': 'Test Job',
+    'client_spent': 15000,
+    'client_hires': 10,
+    'payment_verified': True
+})
+
 
 class TestBoostDecision(unittest.TestCase):
     """Test BoostDecision dataclass."""
@@ -108,52 +158,40 @@ class TestCreateBoostPrompt(unittest.TestCase):
 class TestParseBoostResponse(unittest.TestCase):
     """Test response parsing."""
 
-    def test_parse_valid_json(self):
-        """Test parsing valid JSON response."""
-        response = '{"boost_decision": true, "reasoning": "High value client", "confidence": "high", "client_quality_score": 90}'
-
-        boost, reasoning, confidence, score = parse_boost_response(response)
-
-        self.assertTrue(boost)
-        self.assertEqual(reasoning, 'High value client')
-        self.assertEqual(confidence, 'high')
-        self.assertEqual(score, 90)
-
-    def test_parse_json_with_markdown(self):
-        """Test parsing JSON wrapped in markdown code blocks."""
-        response = '''```json
+    # (name, response, expected values keyed by parsed field)
+    _PARSE_CASES = (
+        ('valid_json',
+         '{"boost_decision": true, "reasoning": "High value client", "confidence": "high", "client_quality_score": 90}',
+         {'boost': True, 'reasoning': 'High value client', 'confidence': 'high', 'score': 90}),
+        ('json_with_markdown',
+         '''```json
 {"boost_decision": false, "reasoning": "New client", "confidence": "medium", "client_quality_score": 40}
-```'''
-
-        boost, reasoning, confidence, score = parse_boost_response(response)
-
-        self.assertFalse(boost)
-        self.assertEqual(reasoning, 'New client')
-
-    def test_parse_invalid_confidence_defaults_to_medium(self):
-        """Test that invalid confidence values default to medium."""
-        response = '{"boost_decision": true, "reasoning": "Test", "confidence": "invalid", "client_quality_score": 50}'
-
-        boost, reasoning, confidence, score = parse_boost_response(response)
-
-        self.assertEqual(confidence, 'medium')
-
-    def test_parse_score_clamping(self):
-        """Test that scores are clamped to 0-100 range."""
-        response = '{"boost_decision": true, "reasoning": "Test", "confidence": "high", "client_quality_score": 150}'
-
-        boost, reasoning, confidence, score = parse_boost_response(response)
-
-        self.assertEqual(score, 100)
-
-    def test_parse_fallback_extraction(self):
-        """Test fallback regex extraction for malformed responses."""
-        response = 'The boost_decision: true because client is good'
-
-        boost, reasoning, confidence, score = parse_boost_response(response)
-
-        self.assertTrue(boost)
-        self.assertEqual(confidence, 'low')
+```''',
+         {'boost': False, 'reasoning': 'New client'}),
+        ('markdown_without_language_or_closing_fence',
+         '''```
+{"boost_decision": true, "reasoning": "Repeat client", "confidence": "high", "client_quality_score": 85}''',
+         {'boost': True, 'reasoning': 'Repeat client', 'score': 85}),
+        ('invalid_confidence_defaults_to_medium',
+         '{"boost_decision": true, "reasoning": "Test", "confidence": "invalid", "client_quality_score": 50}',
+         {'confidence': 'medium'}),
+        ('score_clamping',
+         '{"boost_decision": true, "reasoning": "Test", "confidence": "high", "client_quality_score": 150}',
+         {'score': 100}),
+        ('fallback_extraction',  # malformed response, regex fallback
+         'The boost_decision: true because client is good',
+         {'boost': True, 'confidence': 'low'}),
+    )
+
+    def test_parse_responses(self):
+        """Test parsing JSON, markdown-wrapped and malformed responses."""
+        for name, response, expected in self._PARSE_CASES:
+            with self.subTest(name=name):
+                boost, reasoning, confidence, score = parse_boost_response(response)
+                parsed = {'boost': boost, 'reasoning': reasoning,
+                          'confidence': confidence, 'score': score}
+                for key, value in expected.items():
+                    self.assertEqual(parsed[key], value, key)
 
 
 class TestFeature39QualitySignals(unittest.TestCase):
@@ -167,57 +205,46 @@ class TestFeature39QualitySignals(unittest.TestCase):
     - Verify boost_reasoning explains decision
     """
 
-    def test_analyzes_high_client_spent(self):
-        """Test that high client_spent is analyzed and affects decision."""
-        job = {
-            'job_id': 'quality1',
-            'title': 'Test Job',
-            'client_spent': 15000,
-            'client_hires': 20,
-            'payment_verified': True
-        }
-
-        decision = rule_based_boost_decision(job)
-
-        self.assertIsInstance(decision, BoostDecision)
-        self.assertIn('job_id', asdict(decision))
-        self.assertIn('boost_decision', asdict(decision))
-        self.assertIn('boost_reasoning', asdict(decision))
+    # (job, expected boost_decision, fragment expected in reasoning or None)
+    _QUALITY_CASES = (
         # High spend + verified should result in boost
-        self.assertTrue(decision.boost_decision)
-
-    def test_analyzes_client_hires(self):
-        """Test that client_hires is analyzed and affects decision."""
-        job = {
-            'job_id': 'quality2',
-            'title': 'Test Job',
-            'client_spent': 5000,
-            'client_hires': 15,
-            'payment_verified': True
-        }
-
-        decision = rule_based_boost_decision(job)
-
+        ({'job_id': 'quality1', 'title': 'Test Job', 'client_spent': 15000,
+          'client_hires': 20, 'payment_verified': True}, True, None),
         # With good spend and many hires, should boost
-        self.assertTrue(decision.boost_decision)
-        self.assertIn('hires', decision.boost_reasoning.lower())
-
-    def test_analyzes_payment_verified(self):
-        """Test that payment_verified is analyzed and affects decision."""
-        # Job with good stats but unverified payment
-        job = {
-            'job_id': 'quality3',
-            'title': 'Test Job',
-            'client_spent': 8000,
-            'client_hires': 10,
-            'payment_verified': False
-        }
-
-        decision = rule_based_boost_decision(job)
-
-        # Unverified payment should prevent boost recommendation
-        self.assertFalse(decision.boost_decision)
-        self.assertIn('verif', decision.boost_reasoning.lower())
+        ({'job_id': 'quality2', 'title': 'Test Job', 'client_spent': 5000,
+          'client_hires': 15, 'payment_verified': True}, True, 'hires'),
+        # Good stats but unverified payment should prevent boost recommendation
+        ({'job_id': 'quality3', 'title': 'Test Job', 'client_spent': 8000,
+          'client_hires': 10, 'payment_verified': False}, False, 'verif'),
+    )
+
+    # (client_spent, client_hires, payment_verified, expected score)
+    _THRESHOLD_CASES = (
+        (99, 0, False, 0),       # below new-client spend, no hires, unverified
+        (100, 1, True, 65),      # at new-client spend threshold, one hire
+        (500, 2, True, 75),
+        (1000, 3, True, 95),     # at medium spend and min hires thresholds
+        (9999, 9, False, 65),
+        (10000, 10, True, 100),  # at high spend threshold, clamped to 100
+        (-1000, -5, True, 45),   # negative hires score nothing
+    )
+
+    def test_analyzes_quality_signals(self):
+        """Test client_spent, client_hires and payment_verified affect the decision."""
+        self.assertIn('job_id', _BOOST_FIELDS)
+        self.assertIn('boost_decision', _BOOST_FIELDS)
+        self.assertIn('boost_reasoning', _BOOST_FIELDS)
+
+        jobs = [job for job, _, _ in self._QUALITY_CASES]
+        decisions = rule_based_boost_decisions(jobs)
+
+        for (job, expected, fragment), decision in zip(self._QUALITY_CASES, decisions):
+            with self.subTest(job_id=job['job_id']):
+                self.assertIsInstance(decision, BoostDecision)
+                self.assertEqual(decision.job_id, job['job_id'])
+                self.assertEqual(decision.boost_decision, expected)
+                if fragment is not None:
+                    self.assertIn(fragment, decision.boost_reasoning.lower())
 
     def test_returns_boost_decision_boolean(self):
         """Test that boost_decision is always a boolean."""
@@ -227,9 +254,9 @@ class TestFeature39QualitySignals(unittest.TestCase):
             {'job_id': 'bool3', 'client_spent': 5000, 'client_hires': 3, 'payment_verified': True}
         ]
 
-        for job in jobs:
-            decision = rule_based_boost_decision(job)
-            self.assertIsInstance(decision.boost_decision, bool)
+        for decision in rule_based_boost_decisions(jobs):
+            with self.subTest(job_id=decision.job_id):
+                self.assertIsInstance(decision.boost_decision, bool)
 
     def test_returns_reasoning_string(self):
         """Test that boost_reasoning is always a non-empty string."""
@@ -270,6 +297,26 @@ class TestFeature39QualitySignals(unittest.TestCase):
         self.assertGreaterEqual(high_decision.client_quality_score, 80)
         self.assertLessEqual(low_decision.client_quality_score, 30)
 
+    def test_quality_score_at_thresholds(self):
+        """Test quality score points switch exactly at each threshold."""
+        for client_spent, client_hires, payment_verified, expected in self._THRESHOLD_CASES:
+            with self.subTest(client_spent=client_spent, client_hires=client_hires,
+                              payment_verified=payment_verified):
+                job = {'job_id': 'threshold', 'client_spent': client_spent,
+                       'client_hires': client_hires, 'payment_verified': payment_verified}
+
+                self.assertEqual(rule_based_boost_decision(job).client_quality_score, expected)
+
+    def test_batch_decision_matches_single(self):
+        """Test the batch API returns the same decisions as one-at-a-time calls."""
+        jobs = [case[0] for case in self._QUALITY_CASES] + [
+            _HIGH_VALUE_JOB, _HIGH_VALUE_JOB_UNVERIFIED,
+            _NEW_CLIENT_JOB, _NEW_CLIENT_JOB_UNVERIFIED, _API_JOB,
+        ]
+
+        self.assertEqual(rule_based_boost_decisions(jobs),
+                         [rule_based_boost_decision(j) for j in jobs])
+
 
 class TestFeature40HighValueClients(unittest.TestCase):
     """
@@ -284,13 +331,7 @@ class TestFeature40HighValueClients(unittest.TestCase):
 
     def test_recommends_boost_for_high_spend_verified(self):
         """Test boost recommendation for client_spent > $10000 AND payment_verified."""
-        job = {
-            'job_id': 'highvalue1',
-            'title': 'Enterprise AI Project',
-            'client_spent': 15000,
-            'client_hires': 8,
-            'payment_verified': True
-        }
+        job = _HIGH_VALUE_JOB
 
         decision = rule_based_boost_decision(job)
 
@@ -314,13 +355,7 @@ class TestFeature40HighValueClients(unittest.TestCase):
 
     def test_high_spend_unverified_no_boost(self):
         """Test that high spend WITHOUT verified payment doesn't get boost."""
-        job = {
-            'job_id': 'highvalue3',
-            'title': 'Big Project',
-            'client_spent': 20000,
-            'client_hires': 15,
-            'payment_verified': False  # Not verified!
-        }
+        job = _HIGH_VALUE_JOB_UNVERIFIED
 
         decision = rule_based_boost_decision(job)
 
@@ -372,13 +407,7 @@ class TestFeature41NewClients(unittest.TestCase):
 
     def test_no_boost_for_zero_spend_zero_hires(self):
         """Test no boost for brand new client ($0 spent, 0 hires)."""
-        job = {
-            'job_id': 'newclient1',
-            'title': 'First Project',
-            'client_spent': 0,
-            'client_hires': 0,
-            'payment_verified': True
-        }
+        job = _NEW_CLIENT_JOB
 
         decision = rule_based_boost_decision(job)
 
@@ -402,13 +431,7 @@ class TestFeature41NewClients(unittest.TestCase):
 
     def test_new_client_with_unverified_payment(self):
         """Test handling of new client with unverified payment (double negative)."""
-        job = {
-            'job_id': 'newclient3',
-            'title': 'Risky Project',
-            'client_spent': 0,
-            'client_hires': 0,
-            'payment_verified': False
-        }
+        job = _NEW_CLIENT_JOB_UNVERIFIED
 
         decision = rule_based_boost_decision(job)
 
@@ -418,13 +441,7 @@ class TestFeature41NewClients(unittest.TestCase):
 
     def test_low_quality_score_for_new_clients(self):
         """Test that new clients get low quality scores."""
-        job = {
-            'job_id': 'newclient4',
-            'title': 'Unknown Client Project',
-            'client_spent': 0,
-            'client_hires': 0,
-            'payment_verified': True
-        }
+        job = _NEW_CLIENT_JOB
 
         decision = rule_based_boost_decision(job)
 
@@ -433,13 +450,7 @@ class TestFeature41NewClients(unittest.TestCase):
 
     def test_reasoning_explains_new_client(self):
         """Test that reasoning explains why new client doesn't get boost."""
-        job = {
-            'job_id': 'newclient5',
-            'title': 'New Client Test',
-            'client_spent': 0,
-            'client_hires': 0,
-            'payment_verified': True
-        }
+        job = _NEW_CLIENT_JOB
 
         decision = rule_based_boost_decision(job)
 
@@ -450,6 +461,13 @@ class TestFeature41NewClients(unittest.TestCase):
             f"Reasoning should explain new client status: {decision.boost_reasoning}"
         )
 
+    def test_fixed_reasoning_is_shared(self):
+        """Test decisions with a fixed reason reuse one string instead of rebuilding it."""
+        first = rule_based_boost_decision(_NEW_CLIENT_JOB)
+        second = rule_based_boost_decision(_NEW_CLIENT_JOB_UNVERIFIED)
+
+        self.assertIs(first.boost_reasoning, second.boost_reasoning)
+
 
 class TestMergeDecisionWithJob(unittest.TestCase):
     """Test merging decision with job data."""
@@ -593,21 +611,19 @@ class TestEdgeCases(unittest.TestCase):
 class TestAPIIntegration(unittest.TestCase):
     """Test API integration with mocked client."""
 
+    @classmethod
+    def setUpClass(cls):
+        # The response is only read, so one plain object serves every test.
+        cls._response_text = '{"boost_decision": true, "reasoning": "Test", "confidence": "high", "client_quality_score": 80}'
+        cls._canned_response = SimpleNamespace(content=[SimpleNamespace(text=cls._response_text)])
+
     @patch('executions.upwork_boost_decider.BOOST_DECISION_MODEL', 'claude-sonnet-4-20250514')
     def test_decide_boost_sync_calls_api(self):
         """Test that decide_boost_sync makes correct API call."""
         mock_client = Mock()
-        mock_response = Mock()
-        mock_response.content = [Mock(text='{"boost_decision": true, "reasoning": "Test", "confidence": "high", "client_quality_score": 80}')]
-        mock_client.messages.create.return_value = mock_response
+        mock_client.messages.create.return_value = self._canned_response
 
-        job = {
-            'job_id': 'api1',
-            'title': 'Test Job',
-            'client_spent': 15000,
-            'client_hires': 10,
-            'payment_verified': True
-        }
+        job = _API_JOB
 
         decision = decide_boost_sync(job, mock_client)
 
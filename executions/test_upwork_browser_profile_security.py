@@ -9,18 +9,20 @@ Tests:
 - Secure profile creation
 """
 
+import functools
 import os
 import sys
 import stat
 import json
 import tempfile
-import shutil
 import unittest
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Add parent directory to path for direct runs (conftest.py covers pytest)
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
 
 from executions.upwork_browser_profile_security import (
     get_secure_profile_path,
@@ -44,19 +46,151 @@ from executions.upwork_browser_profile_security import (
 )
 
 
-class TestDirectoryPermissions(unittest.TestCase):
+# Keep scratch trees on tmpfs when it is available
+_SHM = '/dev/shm'
+_TMP_BASE = _SHM if os.path.isdir(_SHM) and os.access(_SHM, os.W_OK) else None
+
+# Insecure directory modes and the issue each one must report
+_INSECURE_DIR_MODES = (
+    (0o755, "world-readable"),  # rwxr-xr-x
+    (0o777, "world-writable"),  # rwxrwxrwx
+    (0o770, "group-writable"),  # rwxrwx---
+)
+
+# Sensitive profile files written world-readable, with their contents
+_EXPOSED_FILES = (
+    ("Cookies", b"encrypted cookie data"),
+    ("Login Data", b"encrypted login data"),
+)
+
+# Process umask, read once so _make_profile knows when a mode needs a chmod
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def _make_profile(root, files=None, dirs=None):
+    """Create profile entries under root with their modes set at creation.
+
+    ``dirs`` maps relative directory names to modes and is created first;
+    ``files`` maps relative file names to ``(data, mode)`` pairs. Every
+    entry is resolved against one descriptor for root rather than a full
+    path, and an extra chmod is only issued when the umask would strip
+    requested bits.
+    """
+    dir_fd = os.open(root, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        for name, mode in (dirs or {}).items():
+            os.mkdir(name, mode, dir_fd=dir_fd)
+            if mode & _UMASK:
+                os.chmod(name, mode, dir_fd=dir_fd)
+        for name, (data, mode) in (files or {}).items():
+            fd = os.open(name, os.O_CREAT | os.O_WRONLY | os.O_TRUNC, mode, dir_fd=dir_fd)
+            try:
+                if mode & _UMASK:
+                    os.fchmod(fd, mode)
+                os.write(fd, data)
+            finally:
+                os.close(fd)
+    finally:
+        os.close(dir_fd)
+
+
+def _mode(path):
+    """Return the permission bits of path from a single lstat."""
+    return stat.S_IMODE(os.stat(path, follow_symlinks=False).st_mode)
+
+
+def _has(issues, sub):
+    """Return True if any issue string contains sub."""
+    return sub in "\n".join(issues)
+
+
+@functools.lru_cache(maxsize=None)
+def _project_gitignore():
+    """Return the project .gitignore text, read at most once per session."""
+    gitignore_path = Path(__file__).parent.parent / ".gitignore"
+    return gitignore_path.read_text() if gitignore_path.exists() else None
+
+
+def _fast_rmtree(path):
+    """Remove a directory tree using os.scandir's cached entry types.
+
+    Walks with an explicit stack instead of recursion and ignores errors,
+    matching ``shutil.rmtree(path, ignore_errors=True)``.
+    """
+    pending = [path]
+    visited = []
+    while pending:
+        current = pending.pop()
+        visited.append(current)
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    else:
+                        try:
+                            os.unlink(entry.path)
+                        except OSError:
+                            pass
+        except OSError:
+            pass
+    for current in reversed(visited):
+        try:
+            os.rmdir(current)
+        except OSError:
+            pass
+
+
+class ProfileTestCase(unittest.TestCase):
+    """Base class giving each test its own directory under a per-class root."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Create one scratch root for the whole class."""
+        cls._class_tmp = tempfile.mkdtemp(prefix='profile_security_test_', dir=_TMP_BASE)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove every per-test directory in one pass."""
+        _fast_rmtree(cls._class_tmp)
+
+    def setUp(self):
+        """Create this test's directory inside the class root."""
+        self.temp_dir = tempfile.mkdtemp(dir=self._class_tmp)
+
+
+class ProjectRootTestCase(ProfileTestCase):
+    """Base class that points get_project_root at each test's directory."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Patch get_project_root once for the whole class."""
+        super().setUpClass()
+        cls._root_patcher = patch('executions.upwork_browser_profile_security.get_project_root')
+        cls._project_root = cls._root_patcher.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Restore get_project_root."""
+        cls._root_patcher.stop()
+        super().tearDownClass()
+
+    def setUp(self):
+        """Root the patched project at this test's directory."""
+        super().setUp()
+        self._project_root.return_value = Path(self.temp_dir)
+
+
+class TestDirectoryPermissions(ProfileTestCase):
     """Test directory permission checking and setting."""
 
     def setUp(self):
         """Create temporary directory for tests."""
-        self.temp_dir = tempfile.mkdtemp()
+        super().setUp()
         self.test_profile = Path(self.temp_dir) / "test_profile"
         self.test_profile.mkdir()
 
-    def tearDown(self):
-        """Clean up temporary directory."""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-
     def test_secure_directory_passes(self):
         """Test that a secure directory passes permission check."""
         os.chmod(self.test_profile, SECURE_DIR_MODE)
@@ -64,33 +198,14 @@ class TestDirectoryPermissions(unittest.TestCase):
         self.assertTrue(is_secure)
         self.assertEqual(len(issues), 0)
 
-    def test_world_readable_fails(self):
-        """Test that world-readable directory fails check."""
-        os.chmod(self.test_profile, 0o755)  # rwxr-xr-x
-        is_secure, issues = check_directory_permissions(self.test_profile)
-        self.assertFalse(is_secure)
-        self.assertTrue(any("world-readable" in i for i in issues))
-
-    def test_world_writable_fails(self):
-        """Test that world-writable directory fails check."""
-        os.chmod(self.test_profile, 0o777)  # rwxrwxrwx
-        is_secure, issues = check_directory_permissions(self.test_profile)
-        self.assertFalse(is_secure)
-        self.assertTrue(any("world-writable" in i for i in issues))
-
-    def test_group_writable_fails(self):
-        """Test that group-writable directory fails check."""
-        os.chmod(self.test_profile, 0o770)  # rwxrwx---
-        is_secure, issues = check_directory_permissions(self.test_profile)
-        self.assertFalse(is_secure)
-        self.assertTrue(any("group-writable" in i for i in issues))
-
-    def test_nonexistent_directory_passes(self):
-        """Test that nonexistent directory passes (will be created securely)."""
-        nonexistent = Path(self.temp_dir) / "does_not_exist"
-        is_secure, issues = check_directory_permissions(nonexistent)
-        self.assertTrue(is_secure)
-        self.assertEqual(len(issues), 0)
+    def test_insecure_modes_fail(self):
+        """Test that each insecure directory mode fails with its own issue."""
+        for mode, expected in _INSECURE_DIR_MODES:
+            with self.subTest(mode=oct(mode)):
+                os.chmod(self.test_profile, mode)
+                is_secure, issues = check_directory_permissions(self.test_profile)
+                self.assertFalse(is_secure)
+                self.assertTrue(_has(issues, expected))
 
     def test_secure_directory_permissions(self):
         """Test setting secure permissions on a directory."""
@@ -98,36 +213,47 @@ class TestDirectoryPermissions(unittest.TestCase):
         os.chmod(self.test_profile, 0o777)
 
         # Create some files
-        (self.test_profile / "test_file.txt").write_text("test")
-        subdir = self.test_profile / "subdir"
-        subdir.mkdir()
-        (subdir / "nested.txt").write_text("nested")
+        _make_profile(
+            self.test_profile,
+            dirs={"subdir": 0o755},
+            files={
+                "test_file.txt": (b"test", 0o644),
+                "subdir/nested.txt": (b"nested", 0o644),
+            },
+        )
 
         # Secure the directory
         result = secure_directory_permissions(self.test_profile)
         self.assertTrue(result)
 
         # Check permissions
-        dir_mode = stat.S_IMODE(os.stat(self.test_profile).st_mode)
-        self.assertEqual(dir_mode, SECURE_DIR_MODE)
+        self.assertEqual(_mode(self.test_profile), SECURE_DIR_MODE)
+        self.assertEqual(_mode(self.test_profile / "test_file.txt"), SECURE_FILE_MODE)
 
-        file_mode = stat.S_IMODE(os.stat(self.test_profile / "test_file.txt").st_mode)
-        self.assertEqual(file_mode, SECURE_FILE_MODE)
 
-
-class TestSensitiveFileProtection(unittest.TestCase):
+class TestSensitiveFileProtection(ProfileTestCase):
     """Test sensitive file exposure checking."""
 
-    def setUp(self):
-        """Create temporary directory with profile structure."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.test_profile = Path(self.temp_dir) / "test_profile"
-        self.default_dir = self.test_profile / "Default"
-        self.default_dir.mkdir(parents=True)
+    @classmethod
+    def setUpClass(cls):
+        """Create the profile structure once for the whole class."""
+        super().setUpClass()
+        cls.temp_dir = cls._class_tmp
+        cls.test_profile = Path(cls.temp_dir) / "test_profile"
+        cls.default_dir = cls.test_profile / "Default"
+        _make_profile(cls.temp_dir, dirs={
+            "test_profile": SECURE_DIR_MODE,
+            "test_profile/Default": SECURE_DIR_MODE,
+        })
 
-    def tearDown(self):
-        """Clean up temporary directory."""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    def setUp(self):
+        """Empty Default so each test starts from the bare structure."""
+        with os.scandir(self.default_dir) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    _fast_rmtree(entry.path)
+                else:
+                    os.unlink(entry.path)
 
     def test_no_sensitive_files_passes(self):
         """Test that profile without sensitive files passes."""
@@ -137,43 +263,47 @@ class TestSensitiveFileProtection(unittest.TestCase):
 
     def test_secure_cookies_file_passes(self):
         """Test that secure Cookies file passes."""
-        cookies_file = self.default_dir / "Cookies"
-        cookies_file.write_text("encrypted cookie data")
-        os.chmod(cookies_file, SECURE_FILE_MODE)
+        _make_profile(self.default_dir, files={
+            "Cookies": (b"encrypted cookie data", SECURE_FILE_MODE),
+        })
 
         is_secure, issues = check_sensitive_files_not_exposed(self.test_profile)
         self.assertTrue(is_secure)
         self.assertEqual(len(issues), 0)
 
-    def test_world_readable_cookies_fails(self):
-        """Test that world-readable Cookies file fails."""
-        cookies_file = self.default_dir / "Cookies"
-        cookies_file.write_text("encrypted cookie data")
-        os.chmod(cookies_file, 0o644)  # rw-r--r--
+    def test_world_readable_files_fail(self):
+        """Test that world-readable Cookies and Login Data files fail."""
+        for name, data in _EXPOSED_FILES:
+            with self.subTest(name=name):
+                _make_profile(self.default_dir, files={name: (data, 0o644)})  # rw-r--r--
 
-        is_secure, issues = check_sensitive_files_not_exposed(self.test_profile)
-        self.assertFalse(is_secure)
-        self.assertTrue(any("Cookies" in i and "insecure" in i for i in issues))
-
-    def test_world_readable_login_data_fails(self):
-        """Test that world-readable Login Data fails."""
-        login_file = self.default_dir / "Login Data"
-        login_file.write_text("encrypted login data")
-        os.chmod(login_file, 0o644)
-
-        is_secure, issues = check_sensitive_files_not_exposed(self.test_profile)
-        self.assertFalse(is_secure)
-        self.assertTrue(any("Login Data" in i for i in issues))
+                is_secure, issues = check_sensitive_files_not_exposed(self.test_profile)
+                self.assertFalse(is_secure)
+                self.assertTrue(_has(issues, f"Sensitive file {name} has insecure"))
+                (self.default_dir / name).unlink()
 
     def test_insecure_session_storage_fails(self):
         """Test that insecure Session Storage directory fails."""
-        session_dir = self.default_dir / "Session Storage"
-        session_dir.mkdir()
-        os.chmod(session_dir, 0o777)
+        _make_profile(self.default_dir, dirs={"Session Storage": 0o777})
 
         is_secure, issues = check_sensitive_files_not_exposed(self.test_profile)
         self.assertFalse(is_secure)
-        self.assertTrue(any("Session Storage" in i for i in issues))
+        self.assertTrue(_has(issues, "Session Storage"))
+
+
+class TestNonexistentPaths(ProfileTestCase):
+    """Test checks against paths that were never created."""
+
+    def setUp(self):
+        """Use the class root as is; these tests never create anything."""
+        self.temp_dir = self._class_tmp
+
+    def test_nonexistent_directory_passes(self):
+        """Test that nonexistent directory passes (will be created securely)."""
+        nonexistent = Path(self.temp_dir) / "does_not_exist"
+        is_secure, issues = check_directory_permissions(nonexistent)
+        self.assertTrue(is_secure)
+        self.assertEqual(len(issues), 0)
 
     def test_nonexistent_profile_passes(self):
         """Test that nonexistent profile passes (nothing to expose)."""
@@ -183,104 +313,82 @@ class TestSensitiveFileProtection(unittest.TestCase):
         self.assertEqual(len(issues), 0)
 
 
-class TestGitignoreCoverage(unittest.TestCase):
+class TestGitignoreCoverage(ProjectRootTestCase):
     """Test .gitignore coverage verification."""
 
     def setUp(self):
         """Create temporary directory with .gitignore."""
-        self.temp_dir = tempfile.mkdtemp()
+        super().setUp()
         self.gitignore_path = Path(self.temp_dir) / ".gitignore"
         self.test_profile = Path(self.temp_dir) / "test_profile"
         self.test_profile.mkdir()
 
-    def tearDown(self):
-        """Clean up temporary directory."""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-
     def test_missing_gitignore_fails(self):
         """Test that missing .gitignore fails."""
-        with patch('executions.upwork_browser_profile_security.get_project_root',
-                   return_value=Path(self.temp_dir)):
-            is_covered, issues, warnings = check_gitignore_coverage(self.test_profile)
-            self.assertFalse(is_covered)
-            self.assertTrue(any(".gitignore" in i for i in issues))
+        is_covered, issues, warnings = check_gitignore_coverage(self.test_profile)
+        self.assertFalse(is_covered)
+        self.assertTrue(_has(issues, ".gitignore"))
 
     def test_profile_in_gitignore_passes(self):
         """Test that profile listed in .gitignore passes."""
-        self.gitignore_path.write_text("test_profile/\n")
+        self.gitignore_path.write_bytes(b"test_profile/\n")
 
-        with patch('executions.upwork_browser_profile_security.get_project_root',
-                   return_value=Path(self.temp_dir)):
-            is_covered, issues, warnings = check_gitignore_coverage(self.test_profile)
-            self.assertTrue(is_covered)
-            self.assertEqual(len(issues), 0)
+        is_covered, issues, warnings = check_gitignore_coverage(self.test_profile)
+        self.assertTrue(is_covered)
+        self.assertEqual(len(issues), 0)
 
     def test_profile_not_in_gitignore_fails(self):
         """Test that profile not in .gitignore fails."""
-        self.gitignore_path.write_text("other_stuff/\n")
+        self.gitignore_path.write_bytes(b"other_stuff/\n")
 
-        with patch('executions.upwork_browser_profile_security.get_project_root',
-                   return_value=Path(self.temp_dir)):
-            is_covered, issues, warnings = check_gitignore_coverage(self.test_profile)
-            self.assertFalse(is_covered)
-            self.assertTrue(any("test_profile" in i for i in issues))
+        is_covered, issues, warnings = check_gitignore_coverage(self.test_profile)
+        self.assertFalse(is_covered)
+        self.assertTrue(_has(issues, "test_profile"))
 
     def test_wildcard_pattern_covers_profile(self):
         """Test that wildcard pattern covers profile."""
-        self.gitignore_path.write_text("*test_profile*\n")
+        self.gitignore_path.write_bytes(b"*test_profile*\n")
 
-        with patch('executions.upwork_browser_profile_security.get_project_root',
-                   return_value=Path(self.temp_dir)):
-            is_covered, issues, warnings = check_gitignore_coverage(self.test_profile)
-            self.assertTrue(is_covered)
+        is_covered, issues, warnings = check_gitignore_coverage(self.test_profile)
+        self.assertTrue(is_covered)
 
     def test_sensitive_file_patterns_warning(self):
         """Test that missing sensitive file patterns generate warnings."""
-        self.gitignore_path.write_text("test_profile/\n")
+        self.gitignore_path.write_bytes(b"test_profile/\n")
 
-        with patch('executions.upwork_browser_profile_security.get_project_root',
-                   return_value=Path(self.temp_dir)):
-            is_covered, issues, warnings = check_gitignore_coverage(self.test_profile)
-            # Should pass (profile is covered) but may have warnings
-            self.assertTrue(is_covered)
+        is_covered, issues, warnings = check_gitignore_coverage(self.test_profile)
+        # Should pass (profile is covered) but may have warnings
+        self.assertTrue(is_covered)
 
 
-class TestValidateProfileSecurity(unittest.TestCase):
+class TestValidateProfileSecurity(ProjectRootTestCase):
     """Test the full profile security validation."""
 
     def setUp(self):
         """Create temporary directory with profile structure."""
-        self.temp_dir = tempfile.mkdtemp()
+        super().setUp()
         self.test_profile = Path(self.temp_dir) / "upwork_profile"
         self.default_dir = self.test_profile / "Default"
         self.default_dir.mkdir(parents=True)
         self.gitignore_path = Path(self.temp_dir) / ".gitignore"
-        self.gitignore_path.write_text("upwork_profile/\n")
-
-    def tearDown(self):
-        """Clean up temporary directory."""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        self.gitignore_path.write_bytes(b"upwork_profile/\n")
 
     def test_secure_profile_validation(self):
         """Test validation of a secure profile."""
         os.chmod(self.test_profile, SECURE_DIR_MODE)
         os.chmod(self.default_dir, SECURE_DIR_MODE)
 
-        with patch('executions.upwork_browser_profile_security.get_project_root',
-                   return_value=Path(self.temp_dir)):
-            result = validate_profile_security(self.test_profile)
-            self.assertTrue(result.is_secure)
-            self.assertEqual(len(result.issues), 0)
+        result = validate_profile_security(self.test_profile)
+        self.assertTrue(result.is_secure)
+        self.assertEqual(len(result.issues), 0)
 
     def test_insecure_profile_validation(self):
         """Test validation of an insecure profile."""
         os.chmod(self.test_profile, 0o755)
 
-        with patch('executions.upwork_browser_profile_security.get_project_root',
-                   return_value=Path(self.temp_dir)):
-            result = validate_profile_security(self.test_profile)
-            self.assertFalse(result.is_secure)
-            self.assertTrue(len(result.issues) > 0)
+        result = validate_profile_security(self.test_profile)
+        self.assertFalse(result.is_secure)
+        self.assertTrue(len(result.issues) > 0)
 
     def test_result_to_dict(self):
         """Test ProfileSecurityResult to_dict conversion."""
@@ -310,118 +418,94 @@ class TestValidateProfileSecurity(unittest.TestCase):
         self.assertFalse(bool(insecure_result))
 
 
-class TestEnsureProfileSecurity(unittest.TestCase):
+class TestEnsureProfileSecurity(ProjectRootTestCase):
     """Test the ensure_profile_security function."""
 
     def setUp(self):
         """Create temporary directory."""
-        self.temp_dir = tempfile.mkdtemp()
+        super().setUp()
         self.gitignore_path = Path(self.temp_dir) / ".gitignore"
-        self.gitignore_path.write_text("# Initial gitignore\n")
-
-    def tearDown(self):
-        """Clean up temporary directory."""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        self.gitignore_path.write_bytes(b"# Initial gitignore\n")
 
     def test_creates_secure_directory(self):
         """Test that ensure creates a secure directory."""
         profile_path = Path(self.temp_dir) / "new_profile"
 
-        with patch('executions.upwork_browser_profile_security.get_project_root',
-                   return_value=Path(self.temp_dir)):
-            result = ensure_profile_security(profile_path)
+        result = ensure_profile_security(profile_path)
 
-            self.assertTrue(profile_path.exists())
-            mode = stat.S_IMODE(os.stat(profile_path).st_mode)
-            self.assertEqual(mode, SECURE_DIR_MODE)
+        self.assertTrue(profile_path.exists())
+        mode = _mode(profile_path)
+        self.assertEqual(mode, SECURE_DIR_MODE)
 
     def test_secures_existing_directory(self):
         """Test that ensure secures an existing directory."""
         profile_path = Path(self.temp_dir) / "existing_profile"
         profile_path.mkdir(mode=0o777)
 
-        with patch('executions.upwork_browser_profile_security.get_project_root',
-                   return_value=Path(self.temp_dir)):
-            result = ensure_profile_security(profile_path)
+        result = ensure_profile_security(profile_path)
 
-            mode = stat.S_IMODE(os.stat(profile_path).st_mode)
-            self.assertEqual(mode, SECURE_DIR_MODE)
+        mode = _mode(profile_path)
+        self.assertEqual(mode, SECURE_DIR_MODE)
 
     def test_updates_gitignore(self):
         """Test that ensure updates .gitignore."""
         profile_path = Path(self.temp_dir) / "new_profile"
 
-        with patch('executions.upwork_browser_profile_security.get_project_root',
-                   return_value=Path(self.temp_dir)):
-            result = ensure_profile_security(profile_path)
+        result = ensure_profile_security(profile_path)
 
-            gitignore_content = self.gitignore_path.read_text()
-            self.assertIn("new_profile/", gitignore_content)
+        gitignore_content = self.gitignore_path.read_bytes()
+        self.assertIn(b"new_profile/", gitignore_content)
 
 
-class TestUpdateGitignore(unittest.TestCase):
+class TestUpdateGitignore(ProjectRootTestCase):
     """Test .gitignore update functionality."""
 
     def setUp(self):
         """Create temporary directory."""
-        self.temp_dir = tempfile.mkdtemp()
+        super().setUp()
         self.gitignore_path = Path(self.temp_dir) / ".gitignore"
 
-    def tearDown(self):
-        """Clean up temporary directory."""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-
     def test_creates_patterns_in_empty_gitignore(self):
         """Test adding patterns to empty .gitignore."""
-        self.gitignore_path.write_text("")
+        self.gitignore_path.write_bytes(b"")
 
-        with patch('executions.upwork_browser_profile_security.get_project_root',
-                   return_value=Path(self.temp_dir)):
-            result = update_gitignore_for_profiles()
-            self.assertTrue(result)
+        result = update_gitignore_for_profiles()
+        self.assertTrue(result)
 
-            content = self.gitignore_path.read_text()
-            self.assertIn("browser_profile/", content)
+        content = self.gitignore_path.read_bytes()
+        self.assertIn(b"browser_profile/", content)
 
     def test_does_not_duplicate_patterns(self):
         """Test that existing patterns are not duplicated."""
-        self.gitignore_path.write_text("browser_profile/\nuser_data/\n")
+        self.gitignore_path.write_bytes(b"browser_profile/\nuser_data/\n")
 
-        with patch('executions.upwork_browser_profile_security.get_project_root',
-                   return_value=Path(self.temp_dir)):
-            result = update_gitignore_for_profiles()
-            self.assertTrue(result)
+        result = update_gitignore_for_profiles()
+        self.assertTrue(result)
 
-            content = self.gitignore_path.read_text()
-            self.assertEqual(content.count("browser_profile/"), 1)
+        content = self.gitignore_path.read_bytes()
+        self.assertEqual(content.count(b"browser_profile/"), 1)
 
     def test_adds_specific_profile_path(self):
         """Test adding a specific profile path."""
-        self.gitignore_path.write_text("# existing\n")
+        self.gitignore_path.write_bytes(b"# existing\n")
         profile_path = Path(self.temp_dir) / "custom_profile"
 
-        with patch('executions.upwork_browser_profile_security.get_project_root',
-                   return_value=Path(self.temp_dir)):
-            result = update_gitignore_for_profiles(profile_path)
-            self.assertTrue(result)
+        result = update_gitignore_for_profiles(profile_path)
+        self.assertTrue(result)
 
-            content = self.gitignore_path.read_text()
-            self.assertIn("custom_profile/", content)
+        content = self.gitignore_path.read_bytes()
+        self.assertIn(b"custom_profile/", content)
 
 
-class TestProfileReadme(unittest.TestCase):
+class TestProfileReadme(ProfileTestCase):
     """Test README creation in profile directory."""
 
     def setUp(self):
         """Create temporary directory."""
-        self.temp_dir = tempfile.mkdtemp()
+        super().setUp()
         self.profile_dir = Path(self.temp_dir) / "test_profile"
         self.profile_dir.mkdir()
 
-    def tearDown(self):
-        """Clean up temporary directory."""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-
     def test_creates_readme(self):
         """Test README creation."""
         create_profile_readme(self.profile_dir)
@@ -438,7 +522,7 @@ class TestProfileReadme(unittest.TestCase):
         create_profile_readme(self.profile_dir)
 
         readme_path = self.profile_dir / "README.md"
-        mode = stat.S_IMODE(os.stat(readme_path).st_mode)
+        mode = _mode(readme_path)
         self.assertEqual(mode, SECURE_FILE_MODE)
 
     def test_does_not_overwrite_existing_readme(self):
@@ -452,24 +536,23 @@ class TestProfileReadme(unittest.TestCase):
         self.assertEqual(content, "Custom content")
 
 
-class TestCleanupSessionData(unittest.TestCase):
+class TestCleanupSessionData(ProfileTestCase):
     """Test session data cleanup functionality."""
 
     def setUp(self):
         """Create temporary directory with profile structure."""
-        self.temp_dir = tempfile.mkdtemp()
+        super().setUp()
         self.profile_dir = Path(self.temp_dir) / "test_profile"
         self.default_dir = self.profile_dir / "Default"
-        self.default_dir.mkdir(parents=True)
-
-    def tearDown(self):
-        """Clean up temporary directory."""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        _make_profile(self.temp_dir, dirs={
+            "test_profile": SECURE_DIR_MODE,
+            "test_profile/Default": SECURE_DIR_MODE,
+        })
 
     def test_cleanup_removes_history(self):
         """Test that cleanup removes History file."""
         history_file = self.default_dir / "History"
-        history_file.write_text("history data")
+        _make_profile(self.default_dir, files={"History": (b"history data", SECURE_FILE_MODE)})
 
         result = cleanup_session_data(self.profile_dir)
         self.assertTrue(result)
@@ -478,7 +561,7 @@ class TestCleanupSessionData(unittest.TestCase):
     def test_cleanup_preserves_cookies_by_default(self):
         """Test that cleanup preserves Cookies by default."""
         cookies_file = self.default_dir / "Cookies"
-        cookies_file.write_text("cookie data")
+        _make_profile(self.default_dir, files={"Cookies": (b"cookie data", SECURE_FILE_MODE)})
 
         result = cleanup_session_data(self.profile_dir, preserve_cookies=True)
         self.assertTrue(result)
@@ -487,7 +570,7 @@ class TestCleanupSessionData(unittest.TestCase):
     def test_cleanup_removes_cookies_when_requested(self):
         """Test that cleanup removes Cookies when requested."""
         cookies_file = self.default_dir / "Cookies"
-        cookies_file.write_text("cookie data")
+        _make_profile(self.default_dir, files={"Cookies": (b"cookie data", SECURE_FILE_MODE)})
 
         result = cleanup_session_data(self.profile_dir, preserve_cookies=False)
         self.assertTrue(result)
@@ -496,61 +579,55 @@ class TestCleanupSessionData(unittest.TestCase):
     def test_cleanup_removes_cache_directory(self):
         """Test that cleanup removes Cache directory."""
         cache_dir = self.default_dir / "Cache"
-        cache_dir.mkdir()
-        (cache_dir / "cache_file").write_text("cache data")
+        _make_profile(
+            self.default_dir,
+            dirs={"Cache": SECURE_DIR_MODE},
+            files={"Cache/cache_file": (b"cache data", SECURE_FILE_MODE)},
+        )
 
         result = cleanup_session_data(self.profile_dir)
         self.assertTrue(result)
         self.assertFalse(cache_dir.exists())
 
 
-class TestGetSubmitterProfilePath(unittest.TestCase):
+class TestGetSubmitterProfilePath(ProjectRootTestCase):
     """Test the get_submitter_profile_path utility function."""
 
     def setUp(self):
         """Create temporary directory."""
-        self.temp_dir = tempfile.mkdtemp()
+        super().setUp()
         self.gitignore_path = Path(self.temp_dir) / ".gitignore"
-        self.gitignore_path.write_text("upwork_profile/\n")
-
-    def tearDown(self):
-        """Clean up temporary directory."""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        self.gitignore_path.write_bytes(b"upwork_profile/\n")
 
     def test_returns_string_path(self):
         """Test that function returns a string path."""
-        with patch('executions.upwork_browser_profile_security.get_project_root',
-                   return_value=Path(self.temp_dir)):
-            with patch('executions.upwork_browser_profile_security.get_default_profile_path',
-                       return_value=Path(self.temp_dir) / "upwork_profile"):
-                path = get_submitter_profile_path()
-                self.assertIsInstance(path, str)
+        with patch('executions.upwork_browser_profile_security.get_default_profile_path',
+                   return_value=Path(self.temp_dir) / "upwork_profile"):
+            path = get_submitter_profile_path()
+            self.assertIsInstance(path, str)
 
     def test_creates_profile_directory(self):
         """Test that function creates profile directory."""
         profile_path = Path(self.temp_dir) / "upwork_profile"
 
-        with patch('executions.upwork_browser_profile_security.get_project_root',
-                   return_value=Path(self.temp_dir)):
-            with patch('executions.upwork_browser_profile_security.get_default_profile_path',
-                       return_value=profile_path):
-                path = get_submitter_profile_path()
-                self.assertTrue(Path(path).exists())
+        with patch('executions.upwork_browser_profile_security.get_default_profile_path',
+                   return_value=profile_path):
+            path = get_submitter_profile_path()
+            self.assertTrue(Path(path).exists())
 
 
 class TestGitignoreIntegration(unittest.TestCase):
     """Test integration with actual .gitignore file in project."""
 
-    def test_project_gitignore_has_browser_profiles(self):
-        """Test that project .gitignore includes browser profile patterns."""
-        # Find the actual project .gitignore
-        project_root = Path(__file__).parent.parent
-        gitignore_path = project_root / ".gitignore"
-
-        if not gitignore_path.exists():
+    def setUp(self):
+        """Skip when the project has no .gitignore."""
+        self._gitignore = _project_gitignore()
+        if self._gitignore is None:
             self.skipTest("Project .gitignore not found")
 
-        content = gitignore_path.read_text()
+    def test_project_gitignore_has_browser_profiles(self):
+        """Test that project .gitignore includes browser profile patterns."""
+        content = self._gitignore
 
         # Check for essential browser profile patterns
         self.assertTrue(
@@ -564,24 +641,11 @@ class TestGitignoreIntegration(unittest.TestCase):
 
     def test_env_file_in_gitignore(self):
         """Test that .env is in .gitignore."""
-        project_root = Path(__file__).parent.parent
-        gitignore_path = project_root / ".gitignore"
-
-        if not gitignore_path.exists():
-            self.skipTest("Project .gitignore not found")
-
-        content = gitignore_path.read_text()
-        self.assertIn(".env", content)
+        self.assertIn(".env", self._gitignore)
 
     def test_token_files_in_gitignore(self):
         """Test that token files are in .gitignore."""
-        project_root = Path(__file__).parent.parent
-        gitignore_path = project_root / ".gitignore"
-
-        if not gitignore_path.exists():
-            self.skipTest("Project .gitignore not found")
-
-        content = gitignore_path.read_text()
+        content = self._gitignore
         self.assertTrue(
             "token*.json" in content or "token.json" in content,
             "Token files should be in .gitignore"
@@ -616,27 +680,7 @@ class TestConstants(unittest.TestCase):
 
 def run_tests():
     """Run all tests."""
-    loader = unittest.TestLoader()
-    suite = unittest.TestSuite()
-
-    # Add all test classes
-    test_classes = [
-        TestDirectoryPermissions,
-        TestSensitiveFileProtection,
-        TestGitignoreCoverage,
-        TestValidateProfileSecurity,
-        TestEnsureProfileSecurity,
-        TestUpdateGitignore,
-        TestProfileReadme,
-        TestCleanupSessionData,
-        TestGetSubmitterProfilePath,
-        TestGitignoreIntegration,
-        TestConstants,
-    ]
-
-    for test_class in test_classes:
-        tests = loader.loadTestsFromTestCase(test_class)
-        suite.addTests(tests)
+    suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
 
     runner = unittest.TextTestRunner(verbosity=2)
     result = runner.run(suite)
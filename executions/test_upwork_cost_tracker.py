@@ -10,12 +10,13 @@ Test steps:
 5. Verify total is approximately $0.35-0.40
 """
 
+import io
+import math
 import os
 import sys
+import logging
 import unittest
-from unittest.mock import patch, MagicMock
 import json
-import tempfile
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -42,62 +43,61 @@ from upwork_cost_tracker import (
     DEFAULT_PROPOSAL_OUTPUT_TOKENS,
     DEFAULT_PROPOSAL_THINKING_TOKENS,
     DEFAULT_VIDEO_DURATION,
+    DEFAULT_PREFILTER_COST,
+    DEFAULT_PROPOSAL_COST,
+    DEFAULT_HEYGEN_COST,
 )
 
 
+LOG = logging.getLogger(__name__)
+
+# Pre-filter pass rates the batch savings check sweeps over
+_BATCH_PASS_RATES = (0.10, 0.15, 0.20, 0.25, 0.30, 0.35, 0.40, 0.45)
+
+
+# (calculator, args, expected cost) for each pricing path
+_CALCULATION_CASES = (
+    # 1000 input, 100 output: $0.003 + $0.0015 = $0.0045
+    ('calculate_sonnet_cost', (1000, 100),
+     (1000 / 1000) * SONNET_INPUT_COST_PER_1K + (100 / 1000) * SONNET_OUTPUT_COST_PER_1K),
+    # 1500 input, 500 output, 5000 thinking: $0.0225 + $0.0375 + $0.375 = $0.435
+    ('calculate_opus_cost', (1500, 500, 5000),
+     (1500 / 1000) * OPUS_INPUT_COST_PER_1K + (500 / 1000) * OPUS_OUTPUT_COST_PER_1K
+     + (5000 / 1000) * OPUS_THINKING_COST_PER_1K),
+    # Without extended thinking
+    ('calculate_opus_cost', (1500, 500, 0),
+     (1500 / 1000) * OPUS_INPUT_COST_PER_1K + (500 / 1000) * OPUS_OUTPUT_COST_PER_1K),
+    # 60 seconds = 1 minute: $0.15
+    ('calculate_heygen_cost', (60,), 1 * HEYGEN_COST_PER_MINUTE),
+    # Very short video (10 seconds) is charged the minimum
+    ('calculate_heygen_cost', (10,), HEYGEN_MINIMUM_COST),
+)
+
 class TestCostTracker(unittest.TestCase):
     """Test the CostTracker class."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Build one tracker for the whole class."""
+        cls._tracker = CostTracker()
+
     def setUp(self):
         """Set up test fixtures."""
-        self.tracker = CostTracker()
+        self._tracker.reset()
+        self.tracker = self._tracker
         self.job_id = "~123456"
 
+    def test_cost_calculations(self):
+        """Test each pricing calculator against its expected cost."""
+        for name, args, expected in _CALCULATION_CASES:
+            with self.subTest(name=name, args=args):
+                cost = getattr(self.tracker, name)(*args)
+                self.assertAlmostEqual(cost, expected, places=6)
+
     def test_calculate_sonnet_cost(self):
         """Test Sonnet (pre-filter) cost calculation."""
         # 1000 input tokens, 100 output tokens
-        cost = self.tracker.calculate_sonnet_cost(1000, 100)
-
-        expected_input = (1000 / 1000) * SONNET_INPUT_COST_PER_1K  # $0.003
-        expected_output = (100 / 1000) * SONNET_OUTPUT_COST_PER_1K  # $0.0015
-        expected_total = expected_input + expected_output  # $0.0045
-
-        self.assertAlmostEqual(cost, expected_total, places=6)
-        self.assertAlmostEqual(cost, 0.0045, places=4)
-
-    def test_calculate_opus_cost(self):
-        """Test Opus 4.5 (proposal) cost calculation."""
-        # 1500 input, 500 output, 5000 thinking
-        cost = self.tracker.calculate_opus_cost(1500, 500, 5000)
-
-        expected_input = (1500 / 1000) * OPUS_INPUT_COST_PER_1K  # $0.0225
-        expected_output = (500 / 1000) * OPUS_OUTPUT_COST_PER_1K  # $0.0375
-        expected_thinking = (5000 / 1000) * OPUS_THINKING_COST_PER_1K  # $0.375
-        expected_total = expected_input + expected_output + expected_thinking  # $0.435
-
-        self.assertAlmostEqual(cost, expected_total, places=6)
-
-    def test_calculate_opus_cost_no_thinking(self):
-        """Test Opus cost without extended thinking."""
-        cost = self.tracker.calculate_opus_cost(1500, 500, 0)
-
-        expected = (1500 / 1000) * OPUS_INPUT_COST_PER_1K + (500 / 1000) * OPUS_OUTPUT_COST_PER_1K
-        self.assertAlmostEqual(cost, expected, places=6)
-
-    def test_calculate_heygen_cost(self):
-        """Test HeyGen video cost calculation."""
-        # 60 seconds = 1 minute
-        cost = self.tracker.calculate_heygen_cost(60)
-        expected = 1 * HEYGEN_COST_PER_MINUTE  # $0.15
-
-        self.assertAlmostEqual(cost, expected, places=4)
-
-    def test_heygen_minimum_cost(self):
-        """Test HeyGen minimum cost is enforced."""
-        # Very short video (10 seconds)
-        cost = self.tracker.calculate_heygen_cost(10)
-
-        self.assertGreaterEqual(cost, HEYGEN_MINIMUM_COST)
+        self.assertAlmostEqual(self.tracker.calculate_sonnet_cost(1000, 100), 0.0045, places=4)
 
     def test_track_prefilter(self):
         """Test pre-filter cost tracking."""
@@ -115,11 +115,11 @@ class TestCostTracker(unittest.TestCase):
         """Test pre-filter with default tokens."""
         cost = self.tracker.track_prefilter(self.job_id)
 
-        expected = self.tracker.calculate_sonnet_cost(
+        self.assertEqual(cost, DEFAULT_PREFILTER_COST)
+        self.assertEqual(DEFAULT_PREFILTER_COST, self.tracker.calculate_sonnet_cost(
             DEFAULT_PREFILTER_INPUT_TOKENS,
             DEFAULT_PREFILTER_OUTPUT_TOKENS
-        )
-        self.assertAlmostEqual(cost, expected, places=6)
+        ))
 
     def test_track_deep_extract(self):
         """Test deep extraction cost tracking."""
@@ -145,12 +145,26 @@ class TestCostTracker(unittest.TestCase):
         """Test proposal with default tokens."""
         cost = self.tracker.track_proposal(self.job_id)
 
-        expected = self.tracker.calculate_opus_cost(
+        self.assertEqual(cost, DEFAULT_PROPOSAL_COST)
+        self.assertEqual(DEFAULT_PROPOSAL_COST, self.tracker.calculate_opus_cost(
             DEFAULT_PROPOSAL_INPUT_TOKENS,
             DEFAULT_PROPOSAL_OUTPUT_TOKENS,
             DEFAULT_PROPOSAL_THINKING_TOKENS
+        ))
+
+    def test_track_proposal_without_thinking(self):
+        """Test an explicit zero thinking budget is recorded, not defaulted."""
+        cost = self.tracker.track_proposal(self.job_id, thinking_tokens=0)
+
+        self.assertEqual(self.tracker.get_job_costs(self.job_id).entries[-1].thinking_tokens, 0)
+        self.assertAlmostEqual(cost, self.tracker.calculate_opus_cost(
+            DEFAULT_PROPOSAL_INPUT_TOKENS,
+            DEFAULT_PROPOSAL_OUTPUT_TOKENS,
+            0
+        ), places=6)
+        self.assertAlmostEqual(
+            cost, estimate_full_job_cost(use_extended_thinking=False)['proposal'], places=6
         )
-        self.assertAlmostEqual(cost, expected, places=6)
 
     def test_track_heygen(self):
         """Test HeyGen video cost tracking."""
@@ -167,8 +181,8 @@ class TestCostTracker(unittest.TestCase):
         """Test HeyGen with default duration."""
         cost = self.tracker.track_heygen(self.job_id)
 
-        expected = self.tracker.calculate_heygen_cost(DEFAULT_VIDEO_DURATION)
-        self.assertAlmostEqual(cost, expected, places=6)
+        self.assertEqual(cost, DEFAULT_HEYGEN_COST)
+        self.assertEqual(DEFAULT_HEYGEN_COST, self.tracker.calculate_heygen_cost(DEFAULT_VIDEO_DURATION))
 
     def test_track_other(self):
         """Test tracking other/miscellaneous costs."""
@@ -186,13 +200,13 @@ class TestCostTracker(unittest.TestCase):
 
         job_costs = self.tracker.get_job_costs(self.job_id)
 
-        expected_total = (
-            job_costs.prefilter_cost +
-            job_costs.deep_extract_cost +
-            job_costs.proposal_cost +
-            job_costs.heygen_cost
-        )
-        self.assertAlmostEqual(job_costs.total, expected_total, places=6)
+        expected_total = math.fsum([
+            job_costs.prefilter_cost,
+            job_costs.deep_extract_cost,
+            job_costs.proposal_cost,
+            job_costs.heygen_cost,
+        ])
+        self.assertAlmostEqual(job_costs.total, expected_total, places=10)
 
     def test_job_processing_cost(self):
         """Test processing_cost excludes prefilter."""
@@ -203,12 +217,12 @@ class TestCostTracker(unittest.TestCase):
 
         job_costs = self.tracker.get_job_costs(self.job_id)
 
-        expected_processing = (
-            job_costs.deep_extract_cost +
-            job_costs.proposal_cost +
-            job_costs.heygen_cost
-        )
-        self.assertAlmostEqual(job_costs.processing_cost, expected_processing, places=6)
+        expected_processing = math.fsum([
+            job_costs.deep_extract_cost,
+            job_costs.proposal_cost,
+            job_costs.heygen_cost,
+        ])
+        self.assertAlmostEqual(job_costs.processing_cost, expected_processing, places=10)
         self.assertLess(job_costs.processing_cost, job_costs.total)
 
     def test_multiple_jobs(self):
@@ -274,22 +288,15 @@ class TestCostTracker(unittest.TestCase):
         self.assertIn(self.job_id, data['jobs'])
 
     def test_to_json(self):
-        """Test exporting to JSON file."""
+        """Test exporting JSON to a file object."""
         self.tracker.track_prefilter(self.job_id, 800, 100)
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            temp_path = f.name
-
-        try:
-            self.tracker.to_json(temp_path)
+        buf = io.StringIO()
+        self.tracker.to_json(buf)
+        data = json.loads(buf.getvalue())
 
-            with open(temp_path, 'r') as f:
-                data = json.load(f)
-
-            self.assertIn('jobs', data)
-            self.assertIn(self.job_id, data['jobs'])
-        finally:
-            os.unlink(temp_path)
+        self.assertIn('jobs', data)
+        self.assertIn(self.job_id, data['jobs'])
 
 
 class TestJobCosts(unittest.TestCase):
@@ -324,9 +331,10 @@ class TestEstimateFullJobCost(unittest.TestCase):
         self.assertGreater(costs['deep_extract'], 0)
         self.assertGreater(costs['proposal'], 0)
         self.assertGreater(costs['heygen'], 0)
-        self.assertEqual(
+        self.assertAlmostEqual(
             costs['total'],
-            costs['prefilter'] + costs['deep_extract'] + costs['proposal'] + costs['heygen']
+            math.fsum([costs['prefilter'], costs['deep_extract'], costs['proposal'], costs['heygen']]),
+            places=10
         )
 
     def test_filtered_job_estimate(self):
@@ -366,6 +374,29 @@ class TestFeature99CostVerification(unittest.TestCase):
     5. Verify total is approximately $0.35-0.40
     """
 
+    @classmethod
+    def setUpClass(cls):
+        """Build one tracker and price the default stages once for the class."""
+        cls._tracker = CostTracker()
+        # Pre-filter uses default tokens (800 input, 100 output for Sonnet)
+        cls.prefilter = cls._tracker.calculate_sonnet_cost(
+            DEFAULT_PREFILTER_INPUT_TOKENS,
+            DEFAULT_PREFILTER_OUTPUT_TOKENS
+        )
+        # Proposal uses Opus 4.5 with extended thinking
+        cls.proposal = cls._tracker.calculate_opus_cost(
+            DEFAULT_PROPOSAL_INPUT_TOKENS,
+            DEFAULT_PROPOSAL_OUTPUT_TOKENS,
+            DEFAULT_PROPOSAL_THINKING_TOKENS
+        )
+        # HeyGen video (60 seconds)
+        cls.heygen = cls._tracker.calculate_heygen_cost(DEFAULT_VIDEO_DURATION)
+
+    def setUp(self):
+        """Start each test from an empty tracker."""
+        self._tracker.reset()
+        self.tracker = self._tracker
+
     def test_full_pipeline_cost_tracking(self):
         """
         Verify that tracking through full pipeline gives expected costs.
@@ -377,12 +408,12 @@ class TestFeature99CostVerification(unittest.TestCase):
         - HeyGen video: ~$0.15-0.20
         - Total: ~$0.35-0.40
         """
-        tracker = CostTracker()
+        tracker = self.tracker
         job_id = "~test123"
 
         # Step 1: Track pre-filter cost
         prefilter_cost = tracker.track_prefilter(job_id)
-        print(f"Pre-filter cost: ${prefilter_cost:.4f}")
+        LOG.debug("Pre-filter cost: $%.4f", prefilter_cost)
 
         # Verify pre-filter cost is in expected range
         self.assertGreater(prefilter_cost, 0.001, "Pre-filter cost should be > $0.001")
@@ -390,13 +421,13 @@ class TestFeature99CostVerification(unittest.TestCase):
 
         # Step 2: Track deep extraction cost
         extract_cost = tracker.track_deep_extract(job_id)
-        print(f"Deep extract cost: ${extract_cost:.4f}")
+        LOG.debug("Deep extract cost: $%.4f", extract_cost)
 
         self.assertEqual(extract_cost, 0.01, "Deep extract cost should be $0.01")
 
         # Step 3: Track proposal generation cost (Opus 4.5 with extended thinking)
         proposal_cost = tracker.track_proposal(job_id)
-        print(f"Proposal cost: ${proposal_cost:.4f}")
+        LOG.debug("Proposal cost: $%.4f", proposal_cost)
 
         # Proposal with extended thinking should be significant
         self.assertGreater(proposal_cost, 0.10, "Proposal cost should be > $0.10")
@@ -404,7 +435,7 @@ class TestFeature99CostVerification(unittest.TestCase):
 
         # Step 4: Track HeyGen video cost
         heygen_cost = tracker.track_heygen(job_id)
-        print(f"HeyGen cost: ${heygen_cost:.4f}")
+        LOG.debug("HeyGen cost: $%.4f", heygen_cost)
 
         self.assertGreater(heygen_cost, 0.05, "HeyGen cost should be > $0.05")
         self.assertLess(heygen_cost, 0.30, "HeyGen cost should be < $0.30")
@@ -412,7 +443,7 @@ class TestFeature99CostVerification(unittest.TestCase):
         # Step 5: Verify total is approximately $0.35-0.40
         job_costs = tracker.get_job_costs(job_id)
         total = job_costs.total
-        print(f"Total cost: ${total:.4f}")
+        LOG.debug("Total cost: $%.4f", total)
 
         # The spec says ~$0.35-0.40, but with current pricing and extended thinking
         # the actual cost may be higher due to thinking tokens
@@ -420,11 +451,8 @@ class TestFeature99CostVerification(unittest.TestCase):
         self.assertGreater(total, 0.25, f"Total cost ${total:.4f} should be > $0.25")
         self.assertLess(total, 0.60, f"Total cost ${total:.4f} should be < $0.60")
 
-        # Print detailed breakdown
-        print("\n" + "=" * 50)
-        print("Feature #99 Verification - Cost Breakdown")
-        print("=" * 50)
-        print(job_costs.summary())
+        # Log detailed breakdown
+        LOG.debug("Feature #99 Verification - Cost Breakdown\n%s", job_costs.summary())
 
     def test_cost_breakdown_matches_spec(self):
         """
@@ -436,42 +464,32 @@ class TestFeature99CostVerification(unittest.TestCase):
         - Proposal generation (Opus 4.5): ~$0.15-0.20 per job
         - HeyGen video: ~$0.15-0.20 per job
         """
-        tracker = CostTracker()
-
-        # Pre-filter uses default tokens (800 input, 100 output for Sonnet)
-        prefilter = tracker.calculate_sonnet_cost(
-            DEFAULT_PREFILTER_INPUT_TOKENS,
-            DEFAULT_PREFILTER_OUTPUT_TOKENS
-        )
-        print(f"Pre-filter (Sonnet): ${prefilter:.4f}")
+        prefilter = self.prefilter
+        LOG.debug("Pre-filter (Sonnet): $%.4f", prefilter)
         # Allow wider range since exact pricing varies
         self.assertGreater(prefilter, 0.001)
         self.assertLess(prefilter, 0.03)
 
         # Deep extraction is fixed at $0.01
         extract = 0.01
-        print(f"Deep extraction: ${extract:.4f}")
+        LOG.debug("Deep extraction: $%.4f", extract)
         self.assertEqual(extract, 0.01)
 
         # Proposal uses Opus 4.5 with extended thinking
-        proposal = tracker.calculate_opus_cost(
-            DEFAULT_PROPOSAL_INPUT_TOKENS,
-            DEFAULT_PROPOSAL_OUTPUT_TOKENS,
-            DEFAULT_PROPOSAL_THINKING_TOKENS
-        )
-        print(f"Proposal (Opus 4.5): ${proposal:.4f}")
+        proposal = self.proposal
+        LOG.debug("Proposal (Opus 4.5): $%.4f", proposal)
         # Extended thinking makes this more expensive
         self.assertGreater(proposal, 0.10)
 
         # HeyGen video (60 seconds)
-        heygen = tracker.calculate_heygen_cost(DEFAULT_VIDEO_DURATION)
-        print(f"HeyGen (60s video): ${heygen:.4f}")
+        heygen = self.heygen
+        LOG.debug("HeyGen (60s video): $%.4f", heygen)
         self.assertGreater(heygen, 0.05)
         self.assertLess(heygen, 0.25)
 
         # Total
         total = prefilter + extract + proposal + heygen
-        print(f"Total: ${total:.4f}")
+        LOG.debug("Total: $%.4f", total)
 
     def test_batch_cost_savings(self):
         """
@@ -482,22 +500,13 @@ class TestFeature99CostVerification(unittest.TestCase):
         - With filter: 100 x prefilter + 25 x processing
         - Should save >50%
         """
-        tracker = CostTracker()
-
         # Calculate costs
-        prefilter_cost = tracker.calculate_sonnet_cost(
-            DEFAULT_PREFILTER_INPUT_TOKENS,
-            DEFAULT_PREFILTER_OUTPUT_TOKENS
-        )
+        prefilter_cost = self.prefilter
 
         processing_cost = (
             0.01 +  # Deep extract
-            tracker.calculate_opus_cost(
-                DEFAULT_PROPOSAL_INPUT_TOKENS,
-                DEFAULT_PROPOSAL_OUTPUT_TOKENS,
-                DEFAULT_PROPOSAL_THINKING_TOKENS
-            ) +
-            tracker.calculate_heygen_cost(DEFAULT_VIDEO_DURATION)
+            self.proposal +
+            self.heygen
         )
 
         full_cost = prefilter_cost + processing_cost
@@ -516,20 +525,31 @@ class TestFeature99CostVerification(unittest.TestCase):
         savings = without_filter - with_filter
         savings_pct = (savings / without_filter) * 100
 
-        print(f"\nBatch Cost Analysis (100 jobs, 25% pass rate):")
-        print(f"  Cost per passed job: ${full_cost:.4f}")
-        print(f"  Pre-filter cost only: ${prefilter_cost:.4f}")
-        print(f"  Processing cost only: ${processing_cost:.4f}")
-        print(f"  Without filter: ${without_filter:.2f}")
-        print(f"  With filter: ${with_filter:.2f}")
-        print(f"  Savings: ${savings:.2f} ({savings_pct:.1f}%)")
+        LOG.debug(
+            "Batch Cost Analysis (100 jobs, 25%% pass rate):\n"
+            "  Cost per passed job: $%.4f\n"
+            "  Pre-filter cost only: $%.4f\n"
+            "  Processing cost only: $%.4f\n"
+            "  Without filter: $%.2f\n"
+            "  With filter: $%.2f\n"
+            "  Savings: $%.2f (%.1f%%)",
+            full_cost, prefilter_cost, processing_cost,
+            without_filter, with_filter, savings, savings_pct
+        )
 
         # Should save at least 50%
         self.assertGreater(savings_pct, 50, "Pre-filtering should save >50% on batch processing")
 
+        # The savings hold across the realistic range of pass rates
+        for rate in _BATCH_PASS_RATES:
+            with self.subTest(pass_rate=rate):
+                passed = int(total_jobs * rate)
+                with_filter = (total_jobs * prefilter_cost) + (passed * processing_cost)
+                self.assertGreater((without_filter - with_filter) / without_filter * 100, 50)
+
     def test_realistic_token_usage(self):
         """Test with realistic token usage from actual API calls."""
-        tracker = CostTracker()
+        tracker = self.tracker
         job_id = "~realistic"
 
         # Realistic pre-filter usage (job description can be long)
@@ -556,8 +576,7 @@ class TestFeature99CostVerification(unittest.TestCase):
 
         job_costs = tracker.get_job_costs(job_id)
 
-        print("\nRealistic Usage Cost Breakdown:")
-        print(job_costs.summary())
+        LOG.debug("Realistic Usage Cost Breakdown:\n%s", job_costs.summary())
 
         # Verify total is reasonable
         self.assertGreater(job_costs.total, 0.20)
@@ -567,7 +586,8 @@ class TestFeature99CostVerification(unittest.TestCase):
 class TestGlobalTracker(unittest.TestCase):
     """Test global tracker functionality."""
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         reset_global_tracker()
 
     def test_get_global_tracker(self):
@@ -589,5 +609,6 @@ class TestGlobalTracker(unittest.TestCase):
 
 
 if __name__ == "__main__":
-    # Run with verbose output
+    # Run with verbose output; -v also shows the cost breakdowns
+    logging.basicConfig(level=logging.DEBUG if '-v' in sys.argv else logging.WARNING)
     unittest.main(verbosity=2)
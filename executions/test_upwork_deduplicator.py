@@ -15,170 +15,138 @@ import os
 import json
 import unittest
 import tempfile
-import shutil
+from unittest.mock import patch
 
 # Add executions to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+import upwork_deduplicator
 from upwork_deduplicator import LocalDeduplicator, deduplicate_jobs
 
+# Keep the JSON stores in RAM when a writable tmpfs is available
+_SHM = '/dev/shm'
+_TMP_BASE = _SHM if os.path.isdir(_SHM) and os.access(_SHM, os.W_OK) else None
 
-class TestFeature3_ApifyDeduplication(unittest.TestCase):
-    """Feature #3: Deduplicator can identify new jobs from Apify source"""
+# (source, existing ID prefix, new ID prefix, jobs per group) for Features #3 and #4
+_SOURCE_CASES = (
+    ("apify", "~existing", "~new", 5),
+    ("gmail", "~gmail_existing", "~gmail_new", 3),
+)
 
-    def setUp(self):
-        """Create a temporary directory for test files."""
-        self.test_dir = tempfile.mkdtemp()
-        self.test_file = os.path.join(self.test_dir, "processed_ids.json")
-        self.dedup = LocalDeduplicator(self.test_file)
-
-    def tearDown(self):
-        """Clean up temporary files."""
-        shutil.rmtree(self.test_dir)
-
-    def test_step1_add_sample_jobs(self):
-        """Step 1: Add 5 sample jobs to Processed IDs"""
-        # Add 5 existing jobs
-        for i in range(5):
-            self.dedup.add_processed_id(f"~existing_{i}", "apify")
-
-        processed = self.dedup.get_processed_ids()
-        self.assertEqual(len(processed), 5)
+# Fixed job batches, built once; deduplicate_jobs only reads its input
+_GMAIL_REPEAT_JOBS = ({"job_id": "~123", "source": "gmail"},)
+_ALT_ID_JOBS = ({"id": "~alt_id_123", "source": "apify"},)
+_SAME_JOB_TWICE = (
+    {"job_id": "~same_job", "source": "apify"},
+    {"job_id": "~same_job", "source": "apify"},  # Duplicate in same batch
+)
 
-    def test_step2_3_identify_new_jobs(self):
-        """Steps 2-3: Run deduplicator with 10 jobs, verify only 5 new returned"""
-        # Add 5 existing jobs
-        for i in range(5):
-            self.dedup.add_processed_id(f"~existing_{i}", "apify")
-
-        # Create batch of 10 jobs (5 existing + 5 new)
-        jobs = []
-        for i in range(5):
-            jobs.append({"job_id": f"~existing_{i}", "source": "apify", "title": f"Existing Job {i}"})
-        for i in range(5):
-            jobs.append({"job_id": f"~new_{i}", "source": "apify", "title": f"New Job {i}"})
-
-        # Deduplicate
-        new_jobs, duplicates = deduplicate_jobs(jobs, self.dedup, add_new=True)
-
-        # Verify only 5 new jobs returned
-        self.assertEqual(len(new_jobs), 5)
-        self.assertEqual(len(duplicates), 5)
-
-        # Verify new jobs are the correct ones
-        new_ids = [j['job_id'] for j in new_jobs]
-        for i in range(5):
-            self.assertIn(f"~new_{i}", new_ids)
-
-    def test_step4_all_jobs_in_processed(self):
-        """Step 4: Verify all 10 jobs are now in Processed IDs sheet"""
-        # Add 5 existing jobs
-        for i in range(5):
-            self.dedup.add_processed_id(f"~existing_{i}", "apify")
 
-        # Create batch of 10 jobs
-        jobs = []
-        for i in range(5):
-            jobs.append({"job_id": f"~existing_{i}", "source": "apify"})
-        for i in range(5):
-            jobs.append({"job_id": f"~new_{i}", "source": "apify"})
+class DedupTestCase(unittest.TestCase):
+    """Shares one temp directory per class; each test gets its own store file."""
 
-        # Deduplicate (adds new jobs)
-        deduplicate_jobs(jobs, self.dedup, add_new=True)
+    @classmethod
+    def setUpClass(cls):
+        tmp = tempfile.TemporaryDirectory(prefix='dedup_test_', dir=_TMP_BASE)
+        cls.addClassCleanup(tmp.cleanup)
+        cls.test_dir = tmp.name
 
-        # Verify all 10 are now processed
-        processed = self.dedup.get_processed_ids()
-        self.assertEqual(len(processed), 10)
+    def setUp(self):
+        self.test_file = f"{self.test_dir}{os.sep}ids_{self.id()}.json"
+        self.dedup = LocalDeduplicator.from_dict({}, self.test_file)
 
-        for i in range(5):
-            self.assertIn(f"~existing_{i}", processed)
-            self.assertIn(f"~new_{i}", processed)
+    def _bootstrap_and_dedupe(self, existing, incoming):
+        """Seed the store with (job_id, source) pairs, then deduplicate incoming jobs."""
+        self.dedup.add_many(existing)
+        return deduplicate_jobs(incoming, self.dedup, add_new=True)
 
 
-class TestFeature4_GmailDeduplication(unittest.TestCase):
-    """Feature #4: Deduplicator can identify new jobs from Gmail source"""
+class NoPersistenceMixin:
+    """Stubs out LocalDeduplicator._save so tests exercise only in-memory dedup logic."""
 
     def setUp(self):
-        self.test_dir = tempfile.mkdtemp()
-        self.test_file = os.path.join(self.test_dir, "processed_ids.json")
-        self.dedup = LocalDeduplicator(self.test_file)
-
-    def tearDown(self):
-        shutil.rmtree(self.test_dir)
+        super().setUp()
+        patcher = patch.object(LocalDeduplicator, '_save', lambda self: None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
 
-    def test_step1_add_gmail_jobs(self):
-        """Step 1: Add 3 sample jobs with source='gmail'"""
-        for i in range(3):
-            self.dedup.add_processed_id(f"~gmail_existing_{i}", "gmail")
 
-        processed = self.dedup.get_processed_ids()
-        self.assertEqual(len(processed), 3)
+class TestFeatureDeduplication(NoPersistenceMixin, DedupTestCase):
+    """Features #3 and #4: Deduplicator can identify new jobs from Apify and Gmail sources"""
 
-        # Verify source is gmail
-        for job_id, data in processed.items():
-            self.assertEqual(data['source'], 'gmail')
-
-    def test_step2_3_identify_new_gmail_jobs(self):
-        """Steps 2-3: Run with 6 Gmail jobs, verify only 3 new returned"""
-        # Add 3 existing Gmail jobs
-        for i in range(3):
-            self.dedup.add_processed_id(f"~gmail_existing_{i}", "gmail")
+    def test_step1_add_sample_jobs(self):
+        """Step 1: Add sample jobs to Processed IDs with their source"""
+        for source, existing, _, count in _SOURCE_CASES:
+            with self.subTest(source=source):
+                self.dedup.clear()
+                for i in range(count):
+                    self.dedup.add_processed_id(f"{existing}_{i}", source)
 
-        # Create batch of 6 jobs (3 existing + 3 new)
-        jobs = []
-        for i in range(3):
-            jobs.append({"job_id": f"~gmail_existing_{i}", "source": "gmail"})
-        for i in range(3):
-            jobs.append({"job_id": f"~gmail_new_{i}", "source": "gmail"})
+                processed = self.dedup.view_processed_ids()
+                self.assertEqual(len(processed), count)
 
-        new_jobs, duplicates = deduplicate_jobs(jobs, self.dedup, add_new=True)
+                for job_id in processed:
+                    self.assertEqual(self.dedup.get_source(job_id), source)
 
-        self.assertEqual(len(new_jobs), 3)
-        self.assertEqual(len(duplicates), 3)
+    def test_step2_3_identify_new_jobs(self):
+        """Steps 2-3: Run deduplicator with existing + new jobs, verify only new returned"""
+        for source, existing, new, count in _SOURCE_CASES:
+            with self.subTest(source=source):
+                self.dedup.clear()
+                # Create batch of existing + new jobs
+                jobs = (
+                    [{"job_id": f"{existing}_{i}", "source": source, "title": f"Existing Job {i}"} for i in range(count)]
+                    + [{"job_id": f"{new}_{i}", "source": source, "title": f"New Job {i}"} for i in range(count)]
+                )
+
+                new_jobs, duplicates = self._bootstrap_and_dedupe(
+                    [(f"{existing}_{i}", source) for i in range(count)], jobs
+                )
+
+                self.assertEqual(len(new_jobs), count)
+                self.assertEqual(len(duplicates), count)
+
+                # Verify new jobs are the correct ones
+                new_ids = {j['job_id'] for j in new_jobs}
+                for i in range(count):
+                    self.assertIn(f"{new}_{i}", new_ids)
 
-    def test_step4_source_recorded_correctly(self):
-        """Step 4: Verify source='gmail' is recorded for new jobs"""
-        jobs = [
-            {"job_id": "~gmail_job_1", "source": "gmail"},
-            {"job_id": "~gmail_job_2", "source": "gmail"},
-        ]
+    def test_step4_all_jobs_in_processed(self):
+        """Step 4: Verify all jobs are now in Processed IDs with their source recorded"""
+        for source, existing, new, count in _SOURCE_CASES:
+            with self.subTest(source=source):
+                self.dedup.clear()
+                jobs = (
+                    [{"job_id": f"{existing}_{i}", "source": source} for i in range(count)]
+                    + [{"job_id": f"{new}_{i}", "source": source} for i in range(count)]
+                )
 
-        deduplicate_jobs(jobs, self.dedup, add_new=True)
+                # Deduplicate (adds new jobs)
+                self._bootstrap_and_dedupe([(f"{existing}_{i}", source) for i in range(count)], jobs)
 
-        processed = self.dedup.get_processed_ids()
+                # Verify all are now processed (dict keyed by job_id, O(1) lookups)
+                processed = self.dedup.view_processed_ids()
+                self.assertEqual(len(processed), 2 * count)
 
-        self.assertEqual(processed["~gmail_job_1"]['source'], 'gmail')
-        self.assertEqual(processed["~gmail_job_2"]['source'], 'gmail')
+                for i in range(count):
+                    self.assertIn(f"{existing}_{i}", processed)
+                    self.assertEqual(self.dedup.get_source(f"{new}_{i}"), source)
 
 
-class TestFeature5_CrossSourceDeduplication(unittest.TestCase):
+class TestFeature5_CrossSourceDeduplication(NoPersistenceMixin, DedupTestCase):
     """Feature #5: Deduplicator handles cross-source deduplication correctly"""
 
-    def setUp(self):
-        self.test_dir = tempfile.mkdtemp()
-        self.test_file = os.path.join(self.test_dir, "processed_ids.json")
-        self.dedup = LocalDeduplicator(self.test_file)
-
-    def tearDown(self):
-        shutil.rmtree(self.test_dir)
-
     def test_step1_add_apify_job(self):
         """Step 1: Add job_id='123' from Apify to Processed IDs"""
         self.dedup.add_processed_id("~123", "apify")
 
-        processed = self.dedup.get_processed_ids()
-        self.assertIn("~123", processed)
-        self.assertEqual(processed["~123"]['source'], 'apify')
+        self.assertIn("~123", self.dedup.view_processed_ids())
+        self.assertEqual(self.dedup.get_source("~123"), 'apify')
 
     def test_step2_3_same_job_from_gmail_is_duplicate(self):
         """Steps 2-3: Same job from Gmail is marked as duplicate"""
-        # First, add from Apify
-        self.dedup.add_processed_id("~123", "apify")
-
-        # Now try to add same job from Gmail
-        jobs = [{"job_id": "~123", "source": "gmail"}]
-
-        new_jobs, duplicates = deduplicate_jobs(jobs, self.dedup, add_new=True)
+        # Add from Apify first, then try the same job from Gmail
+        new_jobs, duplicates = self._bootstrap_and_dedupe([("~123", "apify")], _GMAIL_REPEAT_JOBS)
 
         # Should be marked as duplicate
         self.assertEqual(len(new_jobs), 0)
@@ -186,29 +154,16 @@ class TestFeature5_CrossSourceDeduplication(unittest.TestCase):
 
     def test_step4_original_source_preserved(self):
         """Step 4: Original source='apify' is preserved"""
-        # Add from Apify first
-        self.dedup.add_processed_id("~123", "apify")
-
-        # Try to process same job from Gmail
-        jobs = [{"job_id": "~123", "source": "gmail"}]
-        deduplicate_jobs(jobs, self.dedup, add_new=True)
+        # Add from Apify first, then process the same job from Gmail
+        self._bootstrap_and_dedupe([("~123", "apify")], _GMAIL_REPEAT_JOBS)
 
         # Source should still be 'apify'
-        processed = self.dedup.get_processed_ids()
-        self.assertEqual(processed["~123"]['source'], 'apify')
+        self.assertEqual(self.dedup.get_source("~123"), 'apify')
 
 
-class TestDeduplicatorEdgeCases(unittest.TestCase):
+class TestDeduplicatorEdgeCases(NoPersistenceMixin, DedupTestCase):
     """Additional edge case tests."""
 
-    def setUp(self):
-        self.test_dir = tempfile.mkdtemp()
-        self.test_file = os.path.join(self.test_dir, "processed_ids.json")
-        self.dedup = LocalDeduplicator(self.test_file)
-
-    def tearDown(self):
-        shutil.rmtree(self.test_dir)
-
     def test_empty_job_list(self):
         """Deduplicator handles empty job list."""
         new_jobs, duplicates = deduplicate_jobs([], self.dedup)
@@ -217,26 +172,48 @@ class TestDeduplicatorEdgeCases(unittest.TestCase):
 
     def test_job_with_id_field_instead_of_job_id(self):
         """Deduplicator accepts 'id' field as alternative to 'job_id'."""
-        jobs = [{"id": "~alt_id_123", "source": "apify"}]
-
-        new_jobs, _ = deduplicate_jobs(jobs, self.dedup, add_new=True)
+        new_jobs, _ = deduplicate_jobs(_ALT_ID_JOBS, self.dedup, add_new=True)
 
         self.assertEqual(len(new_jobs), 1)
         self.assertTrue(self.dedup.is_processed("~alt_id_123"))
 
     def test_batch_processing_no_duplicates_within_batch(self):
         """Same job appearing twice in batch is handled correctly."""
-        jobs = [
-            {"job_id": "~same_job", "source": "apify"},
-            {"job_id": "~same_job", "source": "apify"},  # Duplicate in same batch
-        ]
-
-        new_jobs, duplicates = deduplicate_jobs(jobs, self.dedup, add_new=True)
+        new_jobs, duplicates = deduplicate_jobs(_SAME_JOB_TWICE, self.dedup, add_new=True)
 
         # First occurrence is new, second is duplicate
         self.assertEqual(len(new_jobs), 1)
         self.assertEqual(len(duplicates), 1)
 
+    def test_batch_of_10000_unique(self):
+        """A large batch with every job repeated splits in one linear pass."""
+        jobs = [{"job_id": f"~bulk_{i}", "source": "apify"} for i in range(10000)]
+        self.dedup.add_processed_id("~bulk_0", "gmail")
+
+        new_jobs, duplicates = deduplicate_jobs(jobs + jobs, self.dedup, add_new=True)
+
+        self.assertEqual(len(new_jobs), 9999)
+        self.assertEqual(len(duplicates), 10001)
+        self.assertEqual(len(self.dedup.view_processed_ids()), 10000)
+
+    def test_add_many_skips_existing(self):
+        """Bulk add reports only IDs not already processed."""
+        self.dedup.add_processed_id("~bulk_0", "apify")
+
+        added = self.dedup.add_many([(f"~bulk_{i}", "gmail") for i in range(3)])
+
+        self.assertEqual(added, 2)
+        self.assertEqual(self.dedup.get_source("~bulk_0"), "apify")
+
+    def test_view_processed_ids_is_live_and_read_only(self):
+        """The view reflects later adds and rejects writes."""
+        view = self.dedup.view_processed_ids()
+        self.dedup.add_processed_id("~viewed", "apify")
+
+        self.assertIn("~viewed", view)
+        with self.assertRaises(TypeError):
+            view["~forged"] = {}
+
     def test_clear_and_reprocess(self):
         """After clearing, jobs can be processed again."""
         self.dedup.add_processed_id("~job_to_clear", "apify")
@@ -246,15 +223,105 @@ class TestDeduplicatorEdgeCases(unittest.TestCase):
         self.assertFalse(self.dedup.is_processed("~job_to_clear"))
 
 
+class TestPersistence(DedupTestCase):
+    """LocalDeduplicator round-trips its records through the JSON file."""
+
+    def test_records_survive_reload(self):
+        """Single and bulk adds are readable from a fresh instance."""
+        self.dedup.add_processed_id("~saved_0", "apify")
+        self.dedup.add_many([(f"~saved_{i}", "gmail") for i in range(3)])
+
+        reloaded = LocalDeduplicator(self.test_file)
+
+        self.assertEqual(len(reloaded.get_processed_ids()), 3)
+        self.assertEqual(reloaded.get_source("~saved_0"), "apify")
+        self.assertEqual(reloaded.get_source("~saved_2"), "gmail")
+
+    def test_file_is_indented_json(self):
+        """Both encoders write the same indented UTF-8 JSON, non-ASCII text included."""
+        for use_orjson in (False, True):
+            with self.subTest(use_orjson=use_orjson):
+                if use_orjson and not upwork_deduplicator.HAS_ORJSON:
+                    self.skipTest("orjson not installed")
+                if os.path.exists(self.test_file):
+                    os.remove(self.test_file)
+
+                with patch.object(upwork_deduplicator, 'HAS_ORJSON', use_orjson):
+                    dedup = LocalDeduplicator.from_dict({}, self.test_file)
+                    dedup.add_many([("~json_0", "apify"), ("~json_1", "gmail"),
+                                    ("~json_é", "café ☕")])
+
+                records = list(dedup.view_processed_ids().values())
+                with open(self.test_file, 'rb') as f:
+                    self.assertEqual(
+                        f.read(),
+                        json.dumps(records, indent=2, ensure_ascii=False).encode('utf-8'),
+                    )
+
+                # The stdlib decoder reads what either encoder wrote
+                with patch.object(upwork_deduplicator, 'HAS_ORJSON', False):
+                    reloaded = LocalDeduplicator(self.test_file)
+                self.assertEqual(reloaded.get_processed_ids(), dedup.get_processed_ids())
+
+    def test_from_dict_defers_write(self):
+        """from_dict serves preloaded records and writes only on change."""
+        dedup = LocalDeduplicator.from_dict(
+            {"~preloaded": {"job_id": "~preloaded", "source": "gmail"}},
+            self.test_file,
+        )
+        self.assertTrue(dedup.is_processed("~preloaded"))
+        self.assertFalse(os.path.exists(self.test_file))
+
+        dedup.add_processed_id("~added", "apify")
+        self.assertEqual(len(LocalDeduplicator(self.test_file).get_processed_ids()), 2)
+
+    def test_instances_sharing_a_file_keep_each_others_records(self):
+        """Adds through one instance are not lost when another instance saves."""
+        first = LocalDeduplicator(self.test_file)
+        second = LocalDeduplicator(self.test_file)
+
+        first.add_processed_id("~first_0", "apify")
+        second.add_many([("~second_0", "gmail"), ("~second_1", "gmail")])
+        first.add_processed_id("~first_1", "apify")
+
+        stored = LocalDeduplicator(self.test_file).get_processed_ids()
+        self.assertEqual(set(stored), {"~first_0", "~first_1", "~second_0", "~second_1"})
+        self.assertEqual(stored["~second_1"]["source"], "gmail")
+
+    def test_instances_sharing_a_file_see_each_others_changes(self):
+        """Lookups on one instance reflect adds and clears made through another."""
+        reader = LocalDeduplicator(self.test_file)
+        writer = LocalDeduplicator(self.test_file)
+
+        writer.add_processed_id("~x", "gmail")
+
+        self.assertTrue(reader.is_processed("~x"))
+        self.assertEqual(reader.get_source("~x"), "gmail")
+        new_jobs, duplicates = deduplicate_jobs([{"job_id": "~x"}], reader)
+        self.assertEqual((len(new_jobs), len(duplicates)), (0, 1))
+
+        # A clear through one instance is not undone by the other's next add
+        writer.clear()
+        reader.add_processed_id("~y", "apify")
+        self.assertEqual(set(LocalDeduplicator(self.test_file).get_processed_ids()), {"~y"})
+
+    def test_clear_persists(self):
+        """Clearing empties the file, not just the in-memory records."""
+        self.dedup.add_processed_id("~job_to_clear", "apify")
+        self.dedup.clear()
+
+        self.assertFalse(LocalDeduplicator(self.test_file).is_processed("~job_to_clear"))
+
+
 def run_tests():
     """Run all tests and return success status."""
     loader = unittest.TestLoader()
     suite = unittest.TestSuite()
 
-    suite.addTests(loader.loadTestsFromTestCase(TestFeature3_ApifyDeduplication))
-    suite.addTests(loader.loadTestsFromTestCase(TestFeature4_GmailDeduplication))
+    suite.addTests(loader.loadTestsFromTestCase(TestFeatureDeduplication))
     suite.addTests(loader.loadTestsFromTestCase(TestFeature5_CrossSourceDeduplication))
     suite.addTests(loader.loadTestsFromTestCase(TestDeduplicatorEdgeCases))
+    suite.addTests(loader.loadTestsFromTestCase(TestPersistence))
 
     runner = unittest.TextTestRunner(verbosity=2)
     result = runner.run(suite)
@@ -16,15 +16,14 @@ Covers Features #15-23:
 
 import os
 import sys
-import json
 import tempfile
 import unittest
 from pathlib import Path
-from unittest.mock import Mock, MagicMock, AsyncMock, patch
-import asyncio
 
-# Add parent directory to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Add parent directory to path for direct runs (conftest.py covers pytest)
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
 
 from executions.upwork_deep_extractor import (
     extract_job_id_from_url,
@@ -40,6 +39,20 @@ from executions.upwork_deep_extractor import (
     UpworkDeepExtractor
 )
 
+# Keep scratch directories on tmpfs when it is available
+_SHM = '/dev/shm'
+_TMP_BASE = _SHM if os.path.isdir(_SHM) and os.access(_SHM, os.W_OK) else None
+
+# (budget text, budget_type, budget_min, budget_max) for TestParseBudget
+_BUDGET_CASES = (
+    ("Fixed-price: $500", "fixed", 500, 500),
+    ("Budget: $1,000 - $2,500", "fixed", 1000, 2500),
+    ("$25.00/hr", "hourly", 25.00, 25.00),
+    ("$25.00-$50.00/hr", "hourly", 25.00, 50.00),
+    ("", "unknown", None, None),
+    (None, "unknown", None, None),
+)
+
 
 class TestExtractJobIdFromUrl(unittest.TestCase):
     """Test job ID extraction from various URL formats."""
@@ -72,45 +85,15 @@ class TestExtractJobIdFromUrl(unittest.TestCase):
 class TestParseBudget(unittest.TestCase):
     """Test budget parsing logic."""
 
-    def test_parse_fixed_price(self):
-        """Feature #19: Parse fixed price budget."""
-        budget = parse_budget("Fixed-price: $500")
-        self.assertEqual(budget.budget_type, "fixed")
-        self.assertEqual(budget.budget_min, 500)
-        self.assertEqual(budget.budget_max, 500)
-
-    def test_parse_fixed_price_range(self):
-        """Feature #19: Parse fixed price budget range."""
-        budget = parse_budget("Budget: $1,000 - $2,500")
-        self.assertEqual(budget.budget_type, "fixed")
-        self.assertEqual(budget.budget_min, 1000)
-        self.assertEqual(budget.budget_max, 2500)
-
-    def test_parse_hourly_rate(self):
-        """Feature #20: Parse hourly rate."""
-        budget = parse_budget("$25.00/hr")
-        self.assertEqual(budget.budget_type, "hourly")
-        self.assertEqual(budget.budget_min, 25.00)
-        self.assertEqual(budget.budget_max, 25.00)
-
-    def test_parse_hourly_rate_range(self):
-        """Feature #20: Parse hourly rate range."""
-        budget = parse_budget("$25.00-$50.00/hr")
-        self.assertEqual(budget.budget_type, "hourly")
-        self.assertEqual(budget.budget_min, 25.00)
-        self.assertEqual(budget.budget_max, 50.00)
-
-    def test_parse_unknown_budget(self):
-        """Feature #21: Handle no budget specified."""
-        budget = parse_budget("")
-        self.assertEqual(budget.budget_type, "unknown")
-        self.assertIsNone(budget.budget_min)
-        self.assertIsNone(budget.budget_max)
-
-    def test_parse_budget_not_specified(self):
-        """Feature #21: Handle 'Budget not specified' text."""
-        budget = parse_budget(None)
-        self.assertEqual(budget.budget_type, "unknown")
+    def test_parse_budget_cases(self):
+        """Features #19-21: fixed, hourly and missing budgets parse to type/min/max."""
+        for raw, budget_type, budget_min, budget_max in _BUDGET_CASES:
+            with self.subTest(raw=raw):
+                budget = parse_budget(raw)
+                self.assertEqual(
+                    (budget.budget_type, budget.budget_min, budget.budget_max),
+                    (budget_type, budget_min, budget_max),
+                )
 
     def test_preserves_raw_text(self):
         """Test that raw budget text is preserved."""
@@ -171,16 +154,21 @@ class TestParseHiresCount(unittest.TestCase):
 class TestExtractedJob(unittest.TestCase):
     """Test ExtractedJob data class."""
 
-    def test_to_dict(self):
-        """Test conversion to dictionary."""
-        job = ExtractedJob(
+    @classmethod
+    def setUpClass(cls):
+        """Build the job once; both conversions only read it."""
+        cls.job = ExtractedJob(
             job_id="~123",
             url="https://upwork.com/jobs/~123",
             title="Test Job",
             budget=BudgetInfo(budget_type="fixed", budget_min=500, budget_max=500),
-            client=ClientInfo(country="US", payment_verified=True)
+            client=ClientInfo(country="US", payment_verified=True, hires=10, total_spent="$5K"),
+            attachments=[Attachment(filename="requirements.pdf")]
         )
-        d = job.to_dict()
+
+    def test_to_dict(self):
+        """Test conversion to dictionary."""
+        d = self.job.to_dict()
 
         self.assertEqual(d['job_id'], "~123")
         self.assertEqual(d['title'], "Test Job")
@@ -189,15 +177,7 @@ class TestExtractedJob(unittest.TestCase):
 
     def test_to_sheet_row(self):
         """Test conversion to flat sheet row."""
-        job = ExtractedJob(
-            job_id="~123",
-            url="https://upwork.com/jobs/~123",
-            title="Test Job",
-            budget=BudgetInfo(budget_type="fixed", budget_min=500, budget_max=500),
-            client=ClientInfo(country="US", payment_verified=True, hires=10, total_spent="$5K"),
-            attachments=[Attachment(filename="requirements.pdf")]
-        )
-        row = job.to_sheet_row()
+        row = self.job.to_sheet_row()
 
         self.assertEqual(row['job_id'], "~123")
         self.assertEqual(row['budget_type'], "fixed")
@@ -224,12 +204,18 @@ class TestAttachment(unittest.TestCase):
 class TestFeature15FetchJobPage(unittest.TestCase):
     """Feature #15: Deep extractor can fetch job page via Playwright."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Build one extractor for attribute checks; the browser only starts in __aenter__."""
+        tmp = tempfile.TemporaryDirectory(dir=_TMP_BASE)
+        cls.addClassCleanup(tmp.cleanup)
+        cls.extractor = UpworkDeepExtractor(headless=True, tmp_dir=str(Path(tmp.name) / "tmp"))
+
     def test_extractor_initialization(self):
         """Test extractor can be initialized."""
-        # Just test that the class can be instantiated
-        extractor = UpworkDeepExtractor(headless=True)
-        self.assertIsNotNone(extractor)
-        self.assertTrue(extractor.headless)
+        self.assertIsNotNone(self.extractor)
+        self.assertTrue(self.extractor.headless)
+        self.assertIsNone(self.extractor._browser)
 
     def test_job_id_extracted_from_url(self):
         """Test job ID is correctly extracted."""
@@ -425,7 +411,7 @@ class TestFeature23Screenshot(unittest.TestCase):
 
     def test_tmp_dir_creation(self):
         """Test tmp directory is created on extractor init."""
-        with tempfile.TemporaryDirectory() as tmpdir:
+        with tempfile.TemporaryDirectory(dir=_TMP_BASE) as tmpdir:
             tmp_path = Path(tmpdir) / "test_tmp"
             extractor = UpworkDeepExtractor(tmp_dir=str(tmp_path))
             self.assertTrue(tmp_path.exists())
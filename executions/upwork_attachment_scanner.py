@@ -28,16 +28,18 @@ CLI:
     python upwork_attachment_scanner.py --test
 """
 
+import io
 import os
 import re
 import struct
 import zipfile
 import json
+import mmap
 import argparse
 import hashlib
-from dataclasses import dataclass, field
-from pathlib import Path
-from typing import List, Dict, Optional, Tuple, Set
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from typing import List, Dict, Iterator, Optional, Tuple, FrozenSet
 from datetime import datetime
 
 
@@ -91,8 +93,29 @@ FILE_SIGNATURES: Dict[str, List[Tuple[bytes, int]]] = {
     'jar': [(b'PK\x03\x04', 0)],  # Java archive
 }
 
+
+def _build_signature_index() -> Dict[Tuple[int, int], Dict[bytes, Tuple[int, str, bytes]]]:
+    """
+    Index FILE_SIGNATURES by (offset, length) for dict-lookup type detection.
+
+    Each entry maps magic bytes to (priority, extension, magic_bytes), where
+    priority is the signature's position in FILE_SIGNATURES so the lowest
+    matching priority reproduces a first-match walk of the dict.
+    """
+    index: Dict[Tuple[int, int], Dict[bytes, Tuple[int, str, bytes]]] = {}
+    priority = 0
+    for ext, signatures in FILE_SIGNATURES.items():
+        for magic_bytes, offset in signatures:
+            table = index.setdefault((offset, len(magic_bytes)), {})
+            table.setdefault(magic_bytes, (priority, ext, magic_bytes))
+            priority += 1
+    return index
+
+
+_SIGNATURE_INDEX = _build_signature_index()
+
 # Dangerous file extensions
-DANGEROUS_EXTENSIONS: Set[str] = {
+DANGEROUS_EXTENSIONS: FrozenSet[str] = frozenset({
     # Executables
     'exe', 'dll', 'com', 'msi', 'scr', 'pif', 'cpl',
     # Scripts
@@ -115,10 +138,10 @@ DANGEROUS_EXTENSIONS: Set[str] = {
     'reg',
     # Compiled Help
     'chm',
-}
+})
 
 # Safe extensions for Upwork job attachments
-ALLOWED_EXTENSIONS: Set[str] = {
+ALLOWED_EXTENSIONS: FrozenSet[str] = frozenset({
     # Documents
     'pdf', 'doc', 'docx', 'txt', 'rtf', 'odt',
     # Spreadsheets
@@ -129,7 +152,23 @@ ALLOWED_EXTENSIONS: Set[str] = {
     'jpg', 'jpeg', 'png', 'gif', 'bmp', 'webp', 'svg', 'tiff', 'tif',
     # Archives (will be scanned)
     'zip', 'rar', '7z', 'gz', 'tar',
-}
+})
+
+# Macro-enabled Office extensions
+MACRO_ENABLED_EXTENSIONS: FrozenSet[str] = frozenset({
+    'docm', 'xlsm', 'pptm', 'dotm', 'xltm', 'potm',
+})
+
+# Office types (detected or by extension) that get macro checks
+OFFICE_TYPES: FrozenSet[str] = frozenset({
+    'doc', 'docx', 'xls', 'xlsx', 'ppt', 'pptx', 'docm', 'xlsm', 'pptm', 'odt', 'ods', 'odp',
+})
+
+# Bytes read from the start of a file for magic number checks
+HEADER_SIZE: int = 512
+
+# Bytes read from the start of an OLE compound file for format markers
+OLE_SCAN_SIZE: int = 8192
 
 # Maximum file size for scanning (100 MB)
 MAX_FILE_SIZE: int = 100 * 1024 * 1024
@@ -137,9 +176,34 @@ MAX_FILE_SIZE: int = 100 * 1024 * 1024
 # Maximum decompressed size for archives (500 MB - archive bomb protection)
 MAX_DECOMPRESSED_SIZE: int = 500 * 1024 * 1024
 
+# Maximum number of members in an archive
+MAX_ARCHIVE_MEMBERS: int = 10000
+
 # Compression ratio threshold for archive bomb detection
 ARCHIVE_BOMB_RATIO: float = 100.0
 
+# PDF threat markers, matched in one pass over the raw file bytes.
+# JavaScript markers are case-insensitive; the others are exact PDF names.
+_PDF_MARKER_RE = re.compile(
+    rb'(?P<javascript>(?i:/JavaScript\s|/JS\s*\(|/S\s*/JavaScript))'
+    rb'|(?P<launch>/Launch)'
+    rb'|(?P<embedded>/EmbeddedFile)'
+    rb'|(?P<acroform>/AcroForm)'
+    rb'|(?P<xfa>/XFA)'
+)
+
+# Kept separate because its greedy span could swallow other markers on the line
+_PDF_OPENACTION_JS_RE = re.compile(rb'OpenAction.*JavaScript', re.IGNORECASE)
+
+# OLE macro markers ('VBA' also covers the _VBA_PROJECT stream name)
+_OLE_MACRO_RE = re.compile(rb'(?P<vba>VBA)|(?P<macros>Macros)')
+
+# Read size for file hashing (256 KB)
+HASH_CHUNK_SIZE: int = 256 * 1024
+
+# Files at or above this size are memory-mapped for hashing (1 MB)
+MMAP_HASH_THRESHOLD: int = 1024 * 1024
+
 
 @dataclass
 class ScanResult:
@@ -177,23 +241,48 @@ class ScanResult:
 
 
 def get_file_extension(file_path: str) -> str:
-    """Extract and normalize file extension."""
-    ext = Path(file_path).suffix.lower().lstrip('.')
-    return ext
+    """
+    Extract and normalize file extension.
+
+    Same result as Path(file_path).suffix without building a Path: dotfiles
+    and names ending in '.' have no extension.
+    """
+    name = file_path.rstrip('/').rpartition('/')[2]
+    dot = name.rfind('.')
+    if 0 < dot < len(name) - 1:
+        return name[dot + 1:].lower()
+    return ''
 
 
 def compute_file_hash(file_path: str, algorithm: str = 'sha256') -> str:
-    """Compute hash of file content."""
+    """
+    Compute hash of file content.
+
+    Files of MMAP_HASH_THRESHOLD bytes or more are memory-mapped and hashed in
+    a single update, so OpenSSL reads the page cache directly with no copy into
+    Python. Smaller files, where mapping costs more than it saves, are read in
+    HASH_CHUNK_SIZE blocks through an unbuffered handle. hashlib releases the
+    GIL while hashing large buffers in both cases.
+    """
     if not os.path.exists(file_path):
         return ""
 
     hasher = hashlib.new(algorithm)
     try:
-        with open(file_path, 'rb') as f:
-            for chunk in iter(lambda: f.read(8192), b''):
+        with open(file_path, 'rb', buffering=0) as f:
+            if os.fstat(f.fileno()).st_size >= MMAP_HASH_THRESHOLD:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if hasattr(mm, 'madvise'):
+                        mm.madvise(mmap.MADV_SEQUENTIAL)
+                    hasher.update(mm)
+                return hasher.hexdigest()
+
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
                 hasher.update(chunk)
         return hasher.hexdigest()
-    except (IOError, OSError):
+    except (IOError, OSError, ValueError):
         return ""
 
 
@@ -206,39 +295,41 @@ def read_file_header(file_path: str, size: int = 512) -> bytes:
         return b''
 
 
-def detect_file_type(file_path: str) -> str:
+def detect_file_type(file_path: str, header: Optional[bytes] = None) -> str:
     """
     Detect actual file type based on magic bytes/signatures.
 
+    Args:
+        file_path: Path to the file
+        header: First HEADER_SIZE bytes of the file, if already read
+
     Returns the detected file type or 'unknown'.
     """
-    header = read_file_header(file_path, 512)
+    if header is None:
+        header = read_file_header(file_path, HEADER_SIZE)
     if not header:
         return 'unknown'
 
-    # Check each known file type
-    for ext, signatures in FILE_SIGNATURES.items():
-        if not signatures:
-            continue
-        for magic_bytes, offset in signatures:
-            if len(header) >= offset + len(magic_bytes):
-                if header[offset:offset + len(magic_bytes)] == magic_bytes:
-                    # Special case for ZIP-based formats (DOCX, XLSX, etc.)
-                    if magic_bytes == b'PK\x03\x04':
-                        # Try to determine specific Office format
-                        detected = detect_office_format(file_path)
-                        if detected:
-                            return detected
-                        return 'zip'
-
-                    # Special case for OLE compound files (DOC, XLS)
-                    if magic_bytes == b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1':
-                        detected = detect_ole_format(file_path)
-                        if detected:
-                            return detected
-                        return 'ole'
-
-                    return ext
+    best = _match_signature(header)
+    if best is not None:
+        ext, magic_bytes = best
+
+        # Special case for ZIP-based formats (DOCX, XLSX, etc.)
+        if magic_bytes == b'PK\x03\x04':
+            # Try to determine specific Office format
+            detected = detect_office_format(file_path)
+            if detected:
+                return detected
+            return 'zip'
+
+        # Special case for OLE compound files (DOC, XLS)
+        if magic_bytes == b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1':
+            detected = detect_ole_format(file_path)
+            if detected:
+                return detected
+            return 'ole'
+
+        return ext
 
     # Check for text-based files
     if is_text_file(header):
@@ -247,40 +338,62 @@ def detect_file_type(file_path: str) -> str:
     return 'unknown'
 
 
+def _match_signature(header: bytes) -> Optional[Tuple[str, bytes]]:
+    """
+    Find the earliest FILE_SIGNATURES entry matching the header.
+
+    One dict lookup per (offset, length) group instead of comparing every
+    signature. Returns (extension, magic_bytes) or None.
+    """
+    best = None
+    for (offset, length), table in _SIGNATURE_INDEX.items():
+        entry = table.get(header[offset:offset + length])
+        if entry is not None and (best is None or entry[0] < best[0]):
+            best = entry
+
+    if best is None:
+        return None
+    return best[1], best[2]
+
+
 def detect_office_format(file_path: str) -> Optional[str]:
     """Detect specific Office format from ZIP-based file."""
     try:
         with zipfile.ZipFile(file_path, 'r') as zf:
-            names = zf.namelist()
-
-            # Check for Office Open XML markers
-            if '[Content_Types].xml' in names:
-                if any('word/' in n for n in names):
-                    return 'docx'
-                if any('xl/' in n for n in names):
-                    return 'xlsx'
-                if any('ppt/' in n for n in names):
-                    return 'pptx'
-
-            # Check for OpenDocument markers
-            if 'mimetype' in names:
-                try:
-                    mimetype = zf.read('mimetype').decode('utf-8', errors='ignore').strip()
-                    if 'text' in mimetype:
-                        return 'odt'
-                    if 'spreadsheet' in mimetype:
-                        return 'ods'
-                    if 'presentation' in mimetype:
-                        return 'odp'
-                except:
-                    pass
-
-            # Check for JAR markers
-            if 'META-INF/MANIFEST.MF' in names:
-                return 'jar'
-
+            return _zip_office_format(zf)
     except (zipfile.BadZipFile, IOError):
-        pass
+        return None
+
+
+def _zip_office_format(zf: zipfile.ZipFile) -> Optional[str]:
+    """Detect specific Office format from an open ZIP archive."""
+    names = zf.namelist()
+
+    # Check for Office Open XML markers
+    if '[Content_Types].xml' in names:
+        if any('word/' in n for n in names):
+            return 'docx'
+        if any('xl/' in n for n in names):
+            return 'xlsx'
+        if any('ppt/' in n for n in names):
+            return 'pptx'
+
+    # Check for OpenDocument markers
+    if 'mimetype' in names:
+        try:
+            mimetype = zf.read('mimetype').decode('utf-8', errors='ignore').strip()
+            if 'text' in mimetype:
+                return 'odt'
+            if 'spreadsheet' in mimetype:
+                return 'ods'
+            if 'presentation' in mimetype:
+                return 'odp'
+        except:
+            pass
+
+    # Check for JAR markers
+    if 'META-INF/MANIFEST.MF' in names:
+        return 'jar'
 
     return None
 
@@ -289,37 +402,44 @@ def detect_ole_format(file_path: str) -> Optional[str]:
     """Detect specific format from OLE compound file."""
     try:
         with open(file_path, 'rb') as f:
-            content = f.read(8192)
+            return _ole_format(f.read(OLE_SCAN_SIZE))
+    except (IOError, OSError):
+        return None
 
-            # Look for Word document markers
-            if b'Word.Document' in content or b'Microsoft Word' in content:
-                return 'doc'
 
-            # Look for Excel markers
-            if b'Microsoft Excel' in content or b'Workbook' in content:
-                return 'xls'
+def _ole_format(content: bytes) -> Optional[str]:
+    """Detect specific format from the first OLE_SCAN_SIZE bytes of an OLE file."""
+    # Look for Word document markers
+    if b'Word.Document' in content or b'Microsoft Word' in content:
+        return 'doc'
 
-            # Look for PowerPoint markers
-            if b'Microsoft PowerPoint' in content or b'PowerPoint Document' in content:
-                return 'ppt'
+    # Look for Excel markers
+    if b'Microsoft Excel' in content or b'Workbook' in content:
+        return 'xls'
 
-            # Look for MSI markers
-            if b'Windows Installer' in content:
-                return 'msi'
+    # Look for PowerPoint markers
+    if b'Microsoft PowerPoint' in content or b'PowerPoint Document' in content:
+        return 'ppt'
 
-    except (IOError, OSError):
-        pass
+    # Look for MSI markers
+    if b'Windows Installer' in content:
+        return 'msi'
 
     return None
 
 
+# Printable ASCII plus tab, LF and CR
+_PRINTABLE_BYTES = bytes(range(32, 127)) + b'\t\n\r'
+
+
 def is_text_file(header: bytes) -> bool:
     """Check if file appears to be text-based."""
     # Check if mostly printable ASCII
     try:
         # Check first 512 bytes
         text = header[:512]
-        printable = sum(1 for b in text if 32 <= b < 127 or b in (9, 10, 13))
+        # translate() drops printable bytes in C; what remains is non-printable
+        printable = len(text) - len(text.translate(None, _PRINTABLE_BYTES))
         return printable / max(len(text), 1) > 0.85
     except:
         return False
@@ -398,14 +518,19 @@ def check_extension_matches_type(extension: str, detected_type: str) -> Tuple[bo
     return False, f"Extension '{ext}' does not match detected type '{detected_type}'"
 
 
-def check_for_executable_content(file_path: str) -> Tuple[bool, List[str]]:
+def check_for_executable_content(file_path: str, header: Optional[bytes] = None) -> Tuple[bool, List[str]]:
     """
     Check if file contains executable content.
 
+    Args:
+        file_path: Path to the file
+        header: First HEADER_SIZE bytes of the file, if already read
+
     Returns (has_executable, issues) tuple.
     """
     issues = []
-    header = read_file_header(file_path, 512)
+    if header is None:
+        header = read_file_header(file_path, HEADER_SIZE)
 
     # Check for PE (Windows executable) header
     if header[:2] == b'MZ':
@@ -436,49 +561,43 @@ def check_pdf_for_scripts(file_path: str) -> Tuple[bool, List[str]]:
 
     Returns (has_scripts, issues) tuple.
     """
-    issues = []
-
     try:
         with open(file_path, 'rb') as f:
             content = f.read()
     except (IOError, OSError):
         return False, []
 
-    content_str = content.decode('latin-1', errors='ignore')
+    issues = _pdf_script_issues(content)
+    return len(issues) > 0, issues
+
+
+def _pdf_script_issues(content: bytes) -> List[str]:
+    """
+    Find script markers in PDF content.
+
+    The whole content is scanned; all markers are found in a single pass
+    over the raw bytes using _PDF_MARKER_RE.
+    """
+    issues = []
+    found = {match.lastgroup for match in _PDF_MARKER_RE.finditer(content)}
 
     # Check for JavaScript
-    js_patterns = [
-        r'/JavaScript\s',
-        r'/JS\s*\(',
-        r'/S\s*/JavaScript',
-        r'OpenAction.*JavaScript',
-    ]
-
-    for pattern in js_patterns:
-        if re.search(pattern, content_str, re.IGNORECASE):
-            issues.append("PDF contains embedded JavaScript")
-            break
+    if 'javascript' in found or _PDF_OPENACTION_JS_RE.search(content):
+        issues.append("PDF contains embedded JavaScript")
 
     # Check for launch actions
-    if '/Launch' in content_str:
+    if 'launch' in found:
         issues.append("PDF contains Launch action (can run external programs)")
 
     # Check for embedded files
-    if '/EmbeddedFile' in content_str or '/EmbeddedFiles' in content_str:
+    if 'embedded' in found:
         issues.append("PDF contains embedded files")
 
-    # Check for URI/URL actions
-    if '/URI' in content_str or '/GoToR' in content_str:
-        # This is common and usually OK, just a warning
-        pass
+    # Check for AcroForm with XFA forms, which can contain scripts
+    if 'acroform' in found and 'xfa' in found:
+        issues.append("PDF contains XFA form (can contain scripts)")
 
-    # Check for AcroForm (can contain scripts)
-    if '/AcroForm' in content_str:
-        # Check for XFA forms which can contain scripts
-        if '/XFA' in content_str:
-            issues.append("PDF contains XFA form (can contain scripts)")
-
-    return len(issues) > 0, issues
+    return issues
 
 
 def check_office_for_macros(file_path: str) -> Tuple[bool, List[str]]:
@@ -491,7 +610,7 @@ def check_office_for_macros(file_path: str) -> Tuple[bool, List[str]]:
     ext = get_file_extension(file_path)
 
     # Check for macro-enabled extensions
-    if ext in ('docm', 'xlsm', 'pptm', 'dotm', 'xltm', 'potm'):
+    if ext in MACRO_ENABLED_EXTENSIONS:
         issues.append(f"File is a macro-enabled Office document ({ext})")
         return True, issues
 
@@ -499,18 +618,9 @@ def check_office_for_macros(file_path: str) -> Tuple[bool, List[str]]:
     if ext in ('doc', 'xls', 'ppt'):
         try:
             with open(file_path, 'rb') as f:
-                content = f.read()
-
-            # Check for VBA project stream
-            if b'_VBA_PROJECT' in content or b'VBA' in content:
-                issues.append("Document contains VBA macro project")
+                issues = _ole_macro_issues(f.read())
+            if issues:
                 return True, issues
-
-            # Check for macro storage
-            if b'Macros' in content:
-                issues.append("Document may contain macros")
-                return True, issues
-
         except (IOError, OSError):
             pass
 
@@ -518,66 +628,100 @@ def check_office_for_macros(file_path: str) -> Tuple[bool, List[str]]:
     if ext in ('docx', 'xlsx', 'pptx'):
         try:
             with zipfile.ZipFile(file_path, 'r') as zf:
-                names = zf.namelist()
-
-                # Check for VBA project
-                if any('vbaProject' in n.lower() for n in names):
-                    issues.append("Document contains VBA macro project")
-                    return True, issues
-
-                # Check for macro storage
-                if any('macros' in n.lower() for n in names):
-                    issues.append("Document may contain macros")
-                    return True, issues
-
+                issues = _ooxml_macro_issues(zf)
+            if issues:
+                return True, issues
         except (zipfile.BadZipFile, IOError):
             pass
 
     return False, issues
 
 
+def _ole_macro_issues(content: bytes) -> List[str]:
+    """Find macro markers in the content of an OLE format document."""
+    # Single pass for the VBA project stream and macro storage;
+    # VBA wins if both are present
+    has_macro_storage = False
+    for match in _OLE_MACRO_RE.finditer(content):
+        if match.lastgroup == 'vba':
+            return ["Document contains VBA macro project"]
+        has_macro_storage = True
+
+    if has_macro_storage:
+        return ["Document may contain macros"]
+    return []
+
+
+def _ooxml_macro_issues(zf: zipfile.ZipFile) -> List[str]:
+    """Find macro parts in an open OOXML document."""
+    names = zf.namelist()
+
+    # Check for VBA project
+    if any('vbaProject' in n.lower() for n in names):
+        return ["Document contains VBA macro project"]
+
+    # Check for macro storage
+    if any('macros' in n.lower() for n in names):
+        return ["Document may contain macros"]
+
+    return []
+
+
 def check_archive_for_threats(file_path: str) -> Tuple[bool, List[str]]:
     """
     Check archive file for threats (archive bomb, dangerous files).
 
+    Only the central directory is inspected; no member is ever decompressed.
+
     Returns (has_threats, issues) tuple.
     """
-    issues = []
-
     try:
         with zipfile.ZipFile(file_path, 'r') as zf:
-            # Calculate total decompressed size
-            total_size = sum(info.file_size for info in zf.infolist())
-
-            # Check for archive bomb
-            compressed_size = os.path.getsize(file_path)
-            if compressed_size > 0:
-                ratio = total_size / compressed_size
-                if ratio > ARCHIVE_BOMB_RATIO:
-                    issues.append(f"Potential archive bomb detected (compression ratio: {ratio:.1f}x)")
-
-            # Check for excessive decompressed size
-            if total_size > MAX_DECOMPRESSED_SIZE:
-                issues.append(f"Archive decompressed size exceeds limit ({total_size / 1024 / 1024:.1f} MB)")
-
-            # Check for dangerous files inside
-            for info in zf.infolist():
-                inner_ext = get_file_extension(info.filename)
-                if inner_ext in DANGEROUS_EXTENSIONS:
-                    issues.append(f"Archive contains dangerous file type: {info.filename}")
-
-                # Check for path traversal
-                if '..' in info.filename or info.filename.startswith('/'):
-                    issues.append(f"Archive contains path traversal attempt: {info.filename}")
-
+            issues = _archive_threat_issues(zf, os.path.getsize(file_path))
     except zipfile.BadZipFile:
-        issues.append("Invalid or corrupted archive file")
+        issues = ["Invalid or corrupted archive file"]
     except (IOError, OSError) as e:
-        issues.append(f"Error reading archive: {str(e)}")
+        issues = [f"Error reading archive: {str(e)}"]
 
     return len(issues) > 0, issues
 
 
+def _archive_threat_issues(zf: zipfile.ZipFile, compressed_size: int) -> List[str]:
+    """Inspect the central directory of an open ZIP archive for threats."""
+    issues = []
+    infos = zf.infolist()
+
+    # Check member count before walking entries
+    if len(infos) > MAX_ARCHIVE_MEMBERS:
+        issues.append(f"Archive contains too many files ({len(infos)} > {MAX_ARCHIVE_MEMBERS})")
+
+    # Calculate total decompressed size from declared sizes
+    total_size = sum(info.file_size for info in infos)
+
+    # Check for archive bomb
+    if compressed_size > 0:
+        ratio = total_size / compressed_size
+        if ratio > ARCHIVE_BOMB_RATIO:
+            issues.append(f"Potential archive bomb detected (compression ratio: {ratio:.1f}x)")
+
+    # Check for excessive decompressed size
+    if total_size > MAX_DECOMPRESSED_SIZE:
+        issues.append(f"Archive decompressed size exceeds limit ({total_size / 1024 / 1024:.1f} MB)")
+
+    # Check for dangerous files inside
+    for info in infos:
+        name = info.filename
+        if get_file_extension(name) in DANGEROUS_EXTENSIONS:
+            issues.append(f"Archive contains dangerous file type: {name}")
+
+        # Check for path traversal (absolute path or a '..' component)
+        normalized = name.replace('\\', '/')
+        if normalized.startswith('/') or '..' in normalized.split('/'):
+            issues.append(f"Archive contains path traversal attempt: {name}")
+
+    return issues
+
+
 def check_dangerous_extension(file_path: str) -> Tuple[bool, List[str]]:
     """
     Check if file has a dangerous extension.
@@ -590,12 +734,12 @@ def check_dangerous_extension(file_path: str) -> Tuple[bool, List[str]]:
         return True, [f"File has dangerous extension: .{ext}"]
 
     # Check for double extensions (e.g., file.pdf.exe)
-    path = Path(file_path)
-    parts = path.name.split('.')
+    name = os.path.basename(file_path)
+    parts = name.split('.')
     if len(parts) > 2:
         for part in parts[1:-1]:
             if part.lower() in DANGEROUS_EXTENSIONS:
-                return True, [f"File has suspicious double extension: {path.name}"]
+                return True, [f"File has suspicious double extension: {name}"]
 
     return False, []
 
@@ -617,13 +761,24 @@ def check_allowed_extension(file_path: str) -> Tuple[bool, List[str]]:
     return True, []
 
 
-def scan_attachment(file_path: str, strict: bool = False) -> ScanResult:
+def scan_attachment(
+    file_path: str,
+    strict: bool = False,
+    fast_reject: bool = False,
+    cache: Optional[Dict[Tuple[str, str, bool], ScanResult]] = None,
+) -> ScanResult:
     """
     Scan a file attachment for security issues.
 
     Args:
         file_path: Path to the file to scan
         strict: If True, any warning is treated as an issue
+        fast_reject: If True, return as soon as the extension is found to be
+            dangerous, without reading or hashing the file. The result then
+            has detected_type 'unknown' and an empty file_hash.
+        cache: Optional dict shared between calls. Results are keyed by
+            (file_hash, file_name, strict), so a file with the same content
+            and name as one already scanned skips the content checks.
 
     Returns:
         ScanResult with scan findings
@@ -657,16 +812,42 @@ def scan_attachment(file_path: str, strict: bool = False) -> ScanResult:
     if file_size == 0:
         warnings.append("File is empty")
 
-    # Detect actual file type
-    detected_type = detect_file_type(file_path)
+    # Check 1: Dangerous extension (needs no file content)
+    is_dangerous, ext_issues = check_dangerous_extension(file_path)
+    if is_dangerous:
+        issues.extend(ext_issues)
+        if fast_reject:
+            return ScanResult(
+                file_path=file_path,
+                file_name=file_name,
+                file_size=file_size,
+                file_extension=file_extension,
+                detected_type='unknown',
+                is_safe=False,
+                issues=issues,
+                warnings=warnings,
+            )
 
     # Compute file hash
     file_hash = compute_file_hash(file_path)
 
-    # Check 1: Dangerous extension
-    is_dangerous, ext_issues = check_dangerous_extension(file_path)
-    if is_dangerous:
-        issues.extend(ext_issues)
+    # Reuse the result for identical content under the same name
+    cache_key = (file_hash, file_name, strict)
+    if cache is not None and file_hash and cache_key in cache:
+        cached = cache[cache_key]
+        return replace(
+            cached,
+            file_path=file_path,
+            issues=list(cached.issues),
+            warnings=list(cached.warnings),
+            scan_time=datetime.utcnow().isoformat(),
+        )
+
+    # Read the header once for type detection and executable checks
+    header = read_file_header(file_path, HEADER_SIZE)
+
+    # Detect actual file type
+    detected_type = detect_file_type(file_path, header=header)
 
     # Check 2: Allowed extension
     is_allowed, ext_warnings = check_allowed_extension(file_path)
@@ -679,7 +860,7 @@ def scan_attachment(file_path: str, strict: bool = False) -> ScanResult:
         issues.append(f"File type mismatch: {match_reason}")
 
     # Check 4: Executable content
-    has_exec, exec_issues = check_for_executable_content(file_path)
+    has_exec, exec_issues = check_for_executable_content(file_path, header=header)
     if has_exec:
         issues.extend(exec_issues)
 
@@ -691,8 +872,7 @@ def scan_attachment(file_path: str, strict: bool = False) -> ScanResult:
             issues.extend(pdf_issues)
 
     # Check 6: Office document macro checks
-    if detected_type in ('doc', 'docx', 'xls', 'xlsx', 'ppt', 'pptx', 'docm', 'xlsm', 'pptm', 'odt', 'ods', 'odp') or \
-       file_extension in ('doc', 'docx', 'xls', 'xlsx', 'ppt', 'pptx', 'docm', 'xlsm', 'pptm', 'odt', 'ods', 'odp'):
+    if detected_type in OFFICE_TYPES or file_extension in OFFICE_TYPES:
         has_macros, macro_issues = check_office_for_macros(file_path)
         if has_macros:
             issues.extend(macro_issues)
@@ -708,7 +888,7 @@ def scan_attachment(file_path: str, strict: bool = False) -> ScanResult:
     if strict and len(warnings) > 0:
         is_safe = False
 
-    return ScanResult(
+    result = ScanResult(
         file_path=file_path,
         file_name=file_name,
         file_size=file_size,
@@ -719,6 +899,36 @@ def scan_attachment(file_path: str, strict: bool = False) -> ScanResult:
         warnings=warnings,
         file_hash=file_hash,
     )
+    if cache is not None and file_hash:
+        cache[cache_key] = result
+    return result
+
+
+def iter_directory_files(directory: str, recursive: bool = True) -> Iterator[str]:
+    """
+    Yield paths of regular files in a directory.
+
+    Uses os.scandir so file/directory checks reuse the type information
+    returned with each entry instead of stat-ing every path. Symlinked
+    directories are not followed.
+
+    Args:
+        directory: Path to directory to list
+        recursive: If True, descend into subdirectories
+    """
+    try:
+        with os.scandir(directory) as entries:
+            subdirs = []
+            for entry in entries:
+                if entry.is_file():
+                    yield entry.path
+                elif recursive and entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+    except OSError:
+        return
+
+    for subdir in subdirs:
+        yield from iter_directory_files(subdir, recursive=True)
 
 
 def scan_directory(directory: str, recursive: bool = True, strict: bool = False) -> List[ScanResult]:
@@ -733,51 +943,71 @@ def scan_directory(directory: str, recursive: bool = True, strict: bool = False)
     Returns:
         List of ScanResult for each file
     """
-    results = []
-
     if not os.path.isdir(directory):
-        return results
+        return []
 
-    if recursive:
-        for root, dirs, files in os.walk(directory):
-            for file_name in files:
-                file_path = os.path.join(root, file_name)
-                results.append(scan_attachment(file_path, strict=strict))
-    else:
-        for file_name in os.listdir(directory):
-            file_path = os.path.join(directory, file_name)
-            if os.path.isfile(file_path):
-                results.append(scan_attachment(file_path, strict=strict))
+    file_paths = list(iter_directory_files(directory, recursive=recursive))
+    return scan_attachments_batch(file_paths, strict=strict)
 
-    return results
 
-
-def scan_attachments_batch(file_paths: List[str], strict: bool = False) -> List[ScanResult]:
+def scan_attachments_batch(
+    file_paths: List[str],
+    strict: bool = False,
+    max_workers: Optional[int] = None,
+    fast_reject: bool = False,
+) -> List[ScanResult]:
     """
     Scan multiple files.
 
+    Files are scanned concurrently on a thread pool; hashing and file reads
+    release the GIL, so independent attachments overlap their I/O and CPU work.
+    Duplicate attachments (same content and file name) are only fully
+    scanned once per batch.
+
     Args:
         file_paths: List of file paths to scan
         strict: If True, warnings are treated as issues
+        max_workers: Maximum worker threads (default: min(32, cpu_count + 4)).
+            Use 1 to scan serially.
+        fast_reject: If True, skip reading files with a dangerous extension
 
     Returns:
-        List of ScanResult for each file
+        List of ScanResult for each file, in the same order as file_paths
     """
-    return [scan_attachment(path, strict=strict) for path in file_paths]
+    cache: Dict[Tuple[str, str, bool], ScanResult] = {}
+
+    def scan(path: str) -> ScanResult:
+        return scan_attachment(path, strict=strict, fast_reject=fast_reject, cache=cache)
+
+    if len(file_paths) <= 1 or max_workers == 1:
+        return [scan(path) for path in file_paths]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(scan, file_paths))
 
 
-def filter_safe_attachments(file_paths: List[str], strict: bool = False) -> Tuple[List[str], List[ScanResult]]:
+def filter_safe_attachments(
+    file_paths: List[str],
+    strict: bool = False,
+    max_workers: Optional[int] = None,
+) -> Tuple[List[str], List[ScanResult]]:
     """
     Filter a list of files to only safe ones.
 
+    Files with a dangerous extension are rejected without being read, so
+    their scan results carry no file_hash.
+
     Args:
         file_paths: List of file paths to filter
         strict: If True, warnings are treated as issues
+        max_workers: Maximum worker threads passed to scan_attachments_batch
 
     Returns:
         Tuple of (safe_paths, scan_results)
     """
-    results = scan_attachments_batch(file_paths, strict=strict)
+    results = scan_attachments_batch(
+        file_paths, strict=strict, max_workers=max_workers, fast_reject=True
+    )
     safe_paths = [r.file_path for r in results if r.is_safe]
     return safe_paths, results
 
@@ -798,6 +1028,136 @@ def validate_attachment_for_processing(file_path: str) -> Tuple[bool, ScanResult
     return result.is_safe, result
 
 
+def validate_attachment_bytes(data: bytes, filename: str) -> Tuple[bool, ScanResult]:
+    """
+    Validate an attachment that is already in memory.
+
+    Runs the same checks as validate_attachment_for_processing without
+    writing the content to disk.
+
+    Args:
+        data: Attachment content
+        filename: Attachment file name, used for the extension checks
+
+    Returns:
+        Tuple of (is_safe, scan_result)
+    """
+    result = _scan_bytes(data, filename)
+    return result.is_safe, result
+
+
+def _detect_type_from_bytes(data: bytes, filename: str) -> str:
+    """Detect actual file type from in-memory content (see detect_file_type)."""
+    header = data[:HEADER_SIZE]
+    if not header:
+        return 'unknown'
+
+    best = _match_signature(header)
+    if best is not None:
+        ext, magic_bytes = best
+
+        # Special case for ZIP-based formats (DOCX, XLSX, etc.)
+        if magic_bytes == b'PK\x03\x04':
+            try:
+                with zipfile.ZipFile(io.BytesIO(data), 'r') as zf:
+                    detected = _zip_office_format(zf)
+            except zipfile.BadZipFile:
+                detected = None
+            return detected or 'zip'
+
+        # Special case for OLE compound files (DOC, XLS)
+        if magic_bytes == b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1':
+            return _ole_format(data[:OLE_SCAN_SIZE]) or 'ole'
+
+        return ext
+
+    # Check for text-based files
+    if is_text_file(header):
+        return detect_text_type(header, filename)
+
+    return 'unknown'
+
+
+def _scan_bytes(data: bytes, filename: str) -> ScanResult:
+    """
+    Scan in-memory attachment content with the checks of scan_attachment.
+
+    filename only supplies the name and extension; nothing is read from disk.
+    """
+    issues = []
+    warnings = []
+
+    file_extension = get_file_extension(filename)
+    file_size = len(data)
+
+    # Check file size
+    if file_size > MAX_FILE_SIZE:
+        issues.append(f"File exceeds maximum size ({file_size / 1024 / 1024:.1f} MB > {MAX_FILE_SIZE / 1024 / 1024} MB)")
+
+    if file_size == 0:
+        warnings.append("File is empty")
+
+    # Check 1: Dangerous extension
+    is_dangerous, ext_issues = check_dangerous_extension(filename)
+    if is_dangerous:
+        issues.extend(ext_issues)
+
+    header = data[:HEADER_SIZE]
+    detected_type = _detect_type_from_bytes(data, filename)
+
+    # Check 2: Allowed extension
+    is_allowed, ext_warnings = check_allowed_extension(filename)
+    if not is_allowed:
+        warnings.extend(ext_warnings)
+
+    # Check 3: Extension matches type
+    matches, match_reason = check_extension_matches_type(file_extension, detected_type)
+    if not matches:
+        issues.append(f"File type mismatch: {match_reason}")
+
+    # Check 4: Executable content
+    has_exec, exec_issues = check_for_executable_content(filename, header=header)
+    if has_exec:
+        issues.extend(exec_issues)
+
+    # Check 5: PDF-specific checks
+    if detected_type == 'pdf' or file_extension == 'pdf':
+        issues.extend(_pdf_script_issues(data))
+
+    # Check 6: Office document macro checks
+    if detected_type in OFFICE_TYPES or file_extension in OFFICE_TYPES:
+        if file_extension in MACRO_ENABLED_EXTENSIONS:
+            issues.append(f"File is a macro-enabled Office document ({file_extension})")
+        elif file_extension in ('doc', 'xls', 'ppt'):
+            issues.extend(_ole_macro_issues(data))
+        elif file_extension in ('docx', 'xlsx', 'pptx'):
+            try:
+                with zipfile.ZipFile(io.BytesIO(data), 'r') as zf:
+                    issues.extend(_ooxml_macro_issues(zf))
+            except zipfile.BadZipFile:
+                pass
+
+    # Check 7: Archive-specific checks
+    if detected_type in ('zip', 'rar', '7z') or file_extension in ('zip', 'rar', '7z', 'gz', 'tar'):
+        try:
+            with zipfile.ZipFile(io.BytesIO(data), 'r') as zf:
+                issues.extend(_archive_threat_issues(zf, file_size))
+        except zipfile.BadZipFile:
+            issues.append("Invalid or corrupted archive file")
+
+    return ScanResult(
+        file_path=filename,
+        file_name=os.path.basename(filename),
+        file_size=file_size,
+        file_extension=file_extension,
+        detected_type=detected_type,
+        is_safe=len(issues) == 0,
+        issues=issues,
+        warnings=warnings,
+        file_hash=hashlib.sha256(data).hexdigest(),
+    )
+
+
 def get_scan_summary(results: List[ScanResult]) -> Dict:
     """
     Get a summary of scan results.
@@ -18,10 +18,12 @@ Usage:
 """
 
 import os
+import re
 import sys
 import json
 import argparse
 import asyncio
+from bisect import bisect_right
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, asdict
 from dotenv import load_dotenv
@@ -40,6 +42,37 @@ MEDIUM_VALUE_SPEND_THRESHOLD = 1000  # Client spent > $1k
 MIN_HIRES_FOR_BOOST = 3  # At least 3 previous hires
 NEW_CLIENT_SPEND_THRESHOLD = 100  # Less than $100 = new client
 
+# Quality score lookup tables: bisect_right(breakpoints, value) indexes the
+# points, so a value at a breakpoint gets that breakpoint's score (>=)
+# Spending history impact (+/- up to 30 points)
+_SPEND_BREAKPOINTS = (NEW_CLIENT_SPEND_THRESHOLD, 500, MEDIUM_VALUE_SPEND_THRESHOLD, HIGH_VALUE_SPEND_THRESHOLD)
+_SPEND_POINTS = (-20, 0, 10, 20, 30)
+# Hire history impact (+/- up to 20 points); negative counts score nothing
+_HIRES_BREAKPOINTS = (0, 1, MIN_HIRES_FOR_BOOST, 10)
+_HIRES_POINTS = (0, -20, 0, 10, 20)
+
+# Reasoning for each rule-based decision. Fixed reasons are shared as-is;
+# the rest are format templates filled with the client's spend and hires.
+_REASONS = {
+    'new_client': ("New client with no spending history or hires. "
+                   "Not worth extra connect investment for unproven client."),
+    'high_value': ("High-value client with ${client_spent:,.0f} spent and verified payment. "
+                   "Strong track record indicates serious buyer worth competing for."),
+    'established': ("Established client with ${client_spent:,.0f} spent and {client_hires} hires. "
+                    "Reasonable history suggests good probability of hire."),
+    'unverified': ("Payment method not verified. "
+                   "Risk too high for extra connect investment."),
+    'moderate': ("Moderate client profile: ${client_spent:,.0f} spent, {client_hires} hires. "
+                 "Not enough positive signals to justify boost cost."),
+}
+
+# Markdown code fence around a JSON response: the opening fence line
+# (with any language tag) and a closing fence on its own last line
+_MD_FENCE_RE = re.compile(r'\A```[^\n]*(?:\n|\Z)|\n```\Z')
+
+# Fallback for responses that are not valid JSON
+_BOOST_DECISION_RE = re.compile(r'"?boost_decision"?\s*[:=]\s*(true|false)', re.IGNORECASE)
+
 
 @dataclass
 class BoostDecision:
@@ -137,8 +170,7 @@ def parse_boost_response(response_text: str) -> Tuple[bool, str, str, int]:
         text = response_text.strip()
         if text.startswith('```'):
             # Remove markdown code blocks
-            lines = text.split('\n')
-            text = '\n'.join(lines[1:-1] if lines[-1] == '```' else lines[1:])
+            text = _MD_FENCE_RE.sub('', text)
 
         data = json.loads(text)
         boost_decision = bool(data.get('boost_decision', False))
@@ -156,8 +188,7 @@ def parse_boost_response(response_text: str) -> Tuple[bool, str, str, int]:
         return boost_decision, reasoning, confidence, client_quality_score
     except (json.JSONDecodeError, ValueError, TypeError) as e:
         # Try to extract decision from text if JSON parsing fails
-        import re
-        decision_match = re.search(r'"?boost_decision"?\s*[:=]\s*(true|false)', response_text, re.IGNORECASE)
+        decision_match = _BOOST_DECISION_RE.search(response_text)
         if decision_match:
             boost = decision_match.group(1).lower() == 'true'
             return boost, f"Extracted from response: {response_text[:200]}", 'low', 50
@@ -292,74 +323,46 @@ def rule_based_boost_decision(job: Dict) -> BoostDecision:
     # Calculate client quality score (0-100)
     quality_score = 50  # Start at neutral
 
-    # Spending history impact (+/- up to 30 points)
-    if client_spent >= HIGH_VALUE_SPEND_THRESHOLD:
-        quality_score += 30
-    elif client_spent >= MEDIUM_VALUE_SPEND_THRESHOLD:
-        quality_score += 20
-    elif client_spent >= 500:
-        quality_score += 10
-    elif client_spent < NEW_CLIENT_SPEND_THRESHOLD:
-        quality_score -= 20
-
-    # Hire history impact (+/- up to 20 points)
-    if client_hires >= 10:
-        quality_score += 20
-    elif client_hires >= MIN_HIRES_FOR_BOOST:
-        quality_score += 10
-    elif client_hires == 0:
-        quality_score -= 20
+    # Spending and hire history impact, looked up from the score tables
+    quality_score += _SPEND_POINTS[bisect_right(_SPEND_BREAKPOINTS, client_spent)]
+    quality_score += _HIRES_POINTS[bisect_right(_HIRES_BREAKPOINTS, client_hires)]
 
     # Payment verification impact (+/- 15 points)
-    if payment_verified:
-        quality_score += 15
-    else:
-        quality_score -= 15
+    quality_score += 15 if payment_verified else -15
 
     # Clamp to 0-100
     quality_score = max(0, min(100, quality_score))
 
     # Make decision based on rules
-    boost_decision = False
-    confidence = 'medium'
-    reasoning_parts = []
-
     # Feature #41: New client - don't boost
     if client_spent < NEW_CLIENT_SPEND_THRESHOLD and client_hires == 0:
         boost_decision = False
         confidence = 'high'
-        reasoning_parts.append("New client with no spending history or hires")
-        reasoning_parts.append("Not worth extra connect investment for unproven client")
+        reasoning = _REASONS['new_client']
 
     # Feature #40: High-value client - recommend boost
     elif client_spent >= HIGH_VALUE_SPEND_THRESHOLD and payment_verified:
         boost_decision = True
         confidence = 'high'
-        reasoning_parts.append(f"High-value client with ${client_spent:,.0f} spent and verified payment")
-        reasoning_parts.append("Strong track record indicates serious buyer worth competing for")
+        reasoning = _REASONS['high_value'].format(client_spent=client_spent)
 
     # Established client - consider boost
     elif client_spent >= MEDIUM_VALUE_SPEND_THRESHOLD and client_hires >= MIN_HIRES_FOR_BOOST:
         boost_decision = True
         confidence = 'medium'
-        reasoning_parts.append(f"Established client with ${client_spent:,.0f} spent and {client_hires} hires")
-        reasoning_parts.append("Reasonable history suggests good probability of hire")
+        reasoning = _REASONS['established'].format(client_spent=client_spent, client_hires=client_hires)
 
     # Unverified payment - don't boost
     elif not payment_verified:
         boost_decision = False
         confidence = 'high'
-        reasoning_parts.append("Payment method not verified")
-        reasoning_parts.append("Risk too high for extra connect investment")
+        reasoning = _REASONS['unverified']
 
     # Moderate client - don't boost by default
     else:
         boost_decision = False
         confidence = 'low'
-        reasoning_parts.append(f"Moderate client profile: ${client_spent:,.0f} spent, {client_hires} hires")
-        reasoning_parts.append("Not enough positive signals to justify boost cost")
-
-    reasoning = ". ".join(reasoning_parts) + "."
+        reasoning = _REASONS['moderate'].format(client_spent=client_spent, client_hires=client_hires)
 
     return BoostDecision(
         job_id=job_id,
@@ -370,6 +373,12 @@ def rule_based_boost_decision(job: Dict) -> BoostDecision:
     )
 
 
+def rule_based_boost_decisions(jobs: List[Dict]) -> List[BoostDecision]:
+    """Make rule-based boost decisions for a batch of jobs, in input order."""
+    decide = rule_based_boost_decision
+    return [decide(job) for job in jobs]
+
+
 def merge_decision_with_job(job: Dict, decision: BoostDecision) -> Dict:
     """Merge boost decision fields into job data."""
     return {
@@ -443,7 +452,7 @@ def main():
     # Make decisions
     if args.test:
         print("Using rule-based decisions (test mode)...")
-        decisions = [rule_based_boost_decision(job) for job in jobs]
+        decisions = rule_based_boost_decisions(jobs)
     else:
         import anthropic
 
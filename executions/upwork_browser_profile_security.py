@@ -34,16 +34,16 @@ from dataclasses import dataclass
 
 
 # Default profile directory names that should be in .gitignore
-BROWSER_PROFILE_DIRS = [
+BROWSER_PROFILE_DIRS = (
     "browser_profile",
     "user_data",
     "playwright_profile",
     "upwork_profile",
     ".playwright",
-]
+)
 
 # Files that contain sensitive session data
-SENSITIVE_FILES = [
+SENSITIVE_FILES = (
     "Cookies",
     "Cookies-journal",
     "Login Data",
@@ -53,7 +53,7 @@ SENSITIVE_FILES = [
     "Session Storage",
     "Local Storage",
     "IndexedDB",
-]
+)
 
 # Required .gitignore patterns for browser profiles
 REQUIRED_GITIGNORE_PATTERNS = [
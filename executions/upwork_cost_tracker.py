@@ -33,7 +33,7 @@ import os
 import json
 from datetime import datetime, timezone
 from dataclasses import dataclass, field, asdict
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, TextIO, Union
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -64,8 +64,43 @@ DEFAULT_PROPOSAL_THINKING_TOKENS = 5000  # Extended thinking budget
 # Default video duration in seconds
 DEFAULT_VIDEO_DURATION = 60  # 1 minute average
 
+# Deep extraction estimate (compute/bandwidth for Playwright + parsing)
+DEFAULT_DEEP_EXTRACT_COST = 0.01
 
-@dataclass
+
+def _sonnet_cost(input_tokens: int, output_tokens: int) -> float:
+    """Price a Claude Sonnet call from its token counts."""
+    input_cost = (input_tokens / 1000) * SONNET_INPUT_COST_PER_1K
+    output_cost = (output_tokens / 1000) * SONNET_OUTPUT_COST_PER_1K
+    return input_cost + output_cost
+
+
+def _opus_cost(input_tokens: int, output_tokens: int, thinking_tokens: int = 0) -> float:
+    """Price a Claude Opus 4.5 call from its token counts."""
+    input_cost = (input_tokens / 1000) * OPUS_INPUT_COST_PER_1K
+    output_cost = (output_tokens / 1000) * OPUS_OUTPUT_COST_PER_1K
+    thinking_cost = (thinking_tokens / 1000) * OPUS_THINKING_COST_PER_1K
+    return input_cost + output_cost + thinking_cost
+
+
+def _heygen_cost(duration_seconds: float) -> float:
+    """Price a HeyGen video from its duration, applying the minimum charge."""
+    duration_minutes = duration_seconds / 60
+    cost = duration_minutes * HEYGEN_COST_PER_MINUTE
+    return max(cost, HEYGEN_MINIMUM_COST)
+
+
+# Stage costs for the default estimates, folded once at import
+DEFAULT_PREFILTER_COST = _sonnet_cost(DEFAULT_PREFILTER_INPUT_TOKENS, DEFAULT_PREFILTER_OUTPUT_TOKENS)
+DEFAULT_PROPOSAL_COST = _opus_cost(
+    DEFAULT_PROPOSAL_INPUT_TOKENS,
+    DEFAULT_PROPOSAL_OUTPUT_TOKENS,
+    DEFAULT_PROPOSAL_THINKING_TOKENS
+)
+DEFAULT_HEYGEN_COST = _heygen_cost(DEFAULT_VIDEO_DURATION)
+
+
+@dataclass(slots=True)
 class CostEntry:
     """Single cost entry for a pipeline stage."""
     stage: str  # 'prefilter', 'proposal', 'heygen', 'deep_extract', etc.
@@ -80,7 +115,7 @@ class CostEntry:
         return asdict(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class JobCosts:
     """Aggregated costs for a single job."""
     job_id: str
@@ -91,6 +126,18 @@ class JobCosts:
     other_costs: float = 0.0
     entries: List[CostEntry] = field(default_factory=list)
 
+    # Layout used by summary(), built once for the class
+    _SUMMARY_FORMAT = '\n'.join([
+        "Job %s Cost Breakdown:",
+        "  Pre-filter:     $%.4f",
+        "  Deep extract:   $%.4f",
+        "  Proposal:       $%.4f",
+        "  HeyGen video:   $%.4f",
+        "  Other:          $%.4f",
+        "  ─────────────────────────",
+        "  Total:          $%.4f",
+    ])
+
     @property
     def total(self) -> float:
         """Calculate total cost."""
@@ -128,17 +175,15 @@ class JobCosts:
 
     def summary(self) -> str:
         """Return a formatted summary of costs."""
-        lines = [
-            f"Job {self.job_id} Cost Breakdown:",
-            f"  Pre-filter:     ${self.prefilter_cost:.4f}",
-            f"  Deep extract:   ${self.deep_extract_cost:.4f}",
-            f"  Proposal:       ${self.proposal_cost:.4f}",
-            f"  HeyGen video:   ${self.heygen_cost:.4f}",
-            f"  Other:          ${self.other_costs:.4f}",
-            f"  ─────────────────────────",
-            f"  Total:          ${self.total:.4f}",
-        ]
-        return '\n'.join(lines)
+        return self._SUMMARY_FORMAT % (
+            self.job_id,
+            self.prefilter_cost,
+            self.deep_extract_cost,
+            self.proposal_cost,
+            self.heygen_cost,
+            self.other_costs,
+            self.total,
+        )
 
 
 class CostTracker:
@@ -166,9 +211,7 @@ class CostTracker:
         output_tokens: int
     ) -> float:
         """Calculate cost for Claude Sonnet API call."""
-        input_cost = (input_tokens / 1000) * SONNET_INPUT_COST_PER_1K
-        output_cost = (output_tokens / 1000) * SONNET_OUTPUT_COST_PER_1K
-        return input_cost + output_cost
+        return _sonnet_cost(input_tokens, output_tokens)
 
     def calculate_opus_cost(
         self,
@@ -177,16 +220,11 @@ class CostTracker:
         thinking_tokens: int = 0
     ) -> float:
         """Calculate cost for Claude Opus 4.5 API call."""
-        input_cost = (input_tokens / 1000) * OPUS_INPUT_COST_PER_1K
-        output_cost = (output_tokens / 1000) * OPUS_OUTPUT_COST_PER_1K
-        thinking_cost = (thinking_tokens / 1000) * OPUS_THINKING_COST_PER_1K
-        return input_cost + output_cost + thinking_cost
+        return _opus_cost(input_tokens, output_tokens, thinking_tokens)
 
     def calculate_heygen_cost(self, duration_seconds: float) -> float:
         """Calculate cost for HeyGen video generation."""
-        duration_minutes = duration_seconds / 60
-        cost = duration_minutes * HEYGEN_COST_PER_MINUTE
-        return max(cost, HEYGEN_MINIMUM_COST)
+        return _heygen_cost(duration_seconds)
 
     def track_prefilter(
         self,
@@ -208,7 +246,11 @@ class CostTracker:
         input_tokens = input_tokens or DEFAULT_PREFILTER_INPUT_TOKENS
         output_tokens = output_tokens or DEFAULT_PREFILTER_OUTPUT_TOKENS
 
-        cost = self.calculate_sonnet_cost(input_tokens, output_tokens)
+        if (input_tokens == DEFAULT_PREFILTER_INPUT_TOKENS
+                and output_tokens == DEFAULT_PREFILTER_OUTPUT_TOKENS):
+            cost = DEFAULT_PREFILTER_COST
+        else:
+            cost = self.calculate_sonnet_cost(input_tokens, output_tokens)
 
         job = self._get_or_create_job(job_id)
         job.prefilter_cost += cost
@@ -224,7 +266,7 @@ class CostTracker:
     def track_deep_extract(
         self,
         job_id: str,
-        cost: float = 0.01
+        cost: float = DEFAULT_DEEP_EXTRACT_COST
     ) -> float:
         """
         Track deep extraction cost (Playwright + parsing).
@@ -264,11 +306,20 @@ class CostTracker:
         Returns:
             The calculated cost
         """
-        input_tokens = input_tokens or DEFAULT_PROPOSAL_INPUT_TOKENS
-        output_tokens = output_tokens or DEFAULT_PROPOSAL_OUTPUT_TOKENS
-        thinking_tokens = thinking_tokens or DEFAULT_PROPOSAL_THINKING_TOKENS
-
-        cost = self.calculate_opus_cost(input_tokens, output_tokens, thinking_tokens)
+        # An explicit 0 (e.g. no extended thinking) is kept, not defaulted
+        if input_tokens is None:
+            input_tokens = DEFAULT_PROPOSAL_INPUT_TOKENS
+        if output_tokens is None:
+            output_tokens = DEFAULT_PROPOSAL_OUTPUT_TOKENS
+        if thinking_tokens is None:
+            thinking_tokens = DEFAULT_PROPOSAL_THINKING_TOKENS
+
+        if (input_tokens == DEFAULT_PROPOSAL_INPUT_TOKENS
+                and output_tokens == DEFAULT_PROPOSAL_OUTPUT_TOKENS
+                and thinking_tokens == DEFAULT_PROPOSAL_THINKING_TOKENS):
+            cost = DEFAULT_PROPOSAL_COST
+        else:
+            cost = self.calculate_opus_cost(input_tokens, output_tokens, thinking_tokens)
 
         job = self._get_or_create_job(job_id)
         job.proposal_cost += cost
@@ -298,7 +349,10 @@ class CostTracker:
             The calculated cost
         """
         duration_seconds = duration_seconds or DEFAULT_VIDEO_DURATION
-        cost = self.calculate_heygen_cost(duration_seconds)
+        if duration_seconds == DEFAULT_VIDEO_DURATION:
+            cost = DEFAULT_HEYGEN_COST
+        else:
+            cost = self.calculate_heygen_cost(duration_seconds)
 
         job = self._get_or_create_job(job_id)
         job.heygen_cost += cost
@@ -350,14 +404,23 @@ class CostTracker:
 
     def get_summary(self) -> Dict[str, float]:
         """Get summary of all costs by stage."""
+        # Accumulate every stage in a single pass over the jobs
+        prefilter = deep_extract = proposal = heygen = other = 0.0
+        for job in self._jobs.values():
+            prefilter += job.prefilter_cost
+            deep_extract += job.deep_extract_cost
+            proposal += job.proposal_cost
+            heygen += job.heygen_cost
+            other += job.other_costs
+
         summary = {
             'total_jobs': len(self._jobs),
-            'prefilter_total': sum(j.prefilter_cost for j in self._jobs.values()),
-            'deep_extract_total': sum(j.deep_extract_cost for j in self._jobs.values()),
-            'proposal_total': sum(j.proposal_cost for j in self._jobs.values()),
-            'heygen_total': sum(j.heygen_cost for j in self._jobs.values()),
-            'other_total': sum(j.other_costs for j in self._jobs.values()),
-            'grand_total': self.get_total_cost(),
+            'prefilter_total': prefilter,
+            'deep_extract_total': deep_extract,
+            'proposal_total': proposal,
+            'heygen_total': heygen,
+            'other_total': other,
+            'grand_total': prefilter + deep_extract + proposal + heygen + other,
         }
 
         # Add average per job
@@ -379,8 +442,12 @@ class CostTracker:
             'summary': self.get_summary()
         }
 
-    def to_json(self, filepath: str):
-        """Export all data to JSON file."""
+    def to_json(self, filepath: Union[str, TextIO]):
+        """Export all data to a JSON file path or writable file object."""
+        if hasattr(filepath, 'write'):
+            json.dump(self.to_dict(), filepath, indent=2)
+            return
+
         with open(filepath, 'w') as f:
             json.dump(self.to_dict(), f, indent=2)
 
@@ -401,38 +468,39 @@ def estimate_full_job_cost(
     Returns:
         Dictionary with cost breakdown and total
     """
-    tracker = CostTracker()
-    job_id = "estimate"
-
-    # Pre-filter always runs
-    prefilter_cost = tracker.track_prefilter(job_id)
-
+    # Every stage prices from the folded defaults, so no tracker is needed
     costs = {
-        'prefilter': prefilter_cost,
+        'prefilter': DEFAULT_PREFILTER_COST,
         'deep_extract': 0.0,
         'proposal': 0.0,
         'heygen': 0.0,
-        'total': prefilter_cost,
+        'total': DEFAULT_PREFILTER_COST,
     }
 
     if prefilter_passed:
-        # Deep extraction
-        costs['deep_extract'] = tracker.track_deep_extract(job_id)
+        costs['deep_extract'] = DEFAULT_DEEP_EXTRACT_COST
 
-        # Proposal generation
         if use_extended_thinking:
-            costs['proposal'] = tracker.track_proposal(job_id)
+            costs['proposal'] = DEFAULT_PROPOSAL_COST
         else:
             # Without extended thinking
-            costs['proposal'] = tracker.track_proposal(
-                job_id,
-                thinking_tokens=0
+            costs['proposal'] = _opus_cost(
+                DEFAULT_PROPOSAL_INPUT_TOKENS,
+                DEFAULT_PROPOSAL_OUTPUT_TOKENS
             )
 
-        # HeyGen video
-        costs['heygen'] = tracker.track_heygen(job_id, video_duration_seconds)
+        duration = video_duration_seconds or DEFAULT_VIDEO_DURATION
+        costs['heygen'] = (
+            DEFAULT_HEYGEN_COST if duration == DEFAULT_VIDEO_DURATION
+            else _heygen_cost(duration)
+        )
 
-        costs['total'] = tracker.get_job_costs(job_id).total
+        costs['total'] = (
+            costs['prefilter'] +
+            costs['deep_extract'] +
+            costs['proposal'] +
+            costs['heygen']
+        )
 
     return costs
 
@@ -21,9 +21,17 @@ import sys
 import json
 import argparse
 from datetime import datetime
-from typing import List, Dict, Optional, Tuple
+from types import MappingProxyType
+from typing import Iterable, List, Dict, Mapping, Optional, Tuple
 from dotenv import load_dotenv
 
+# Faster JSON for the local store, stdlib json otherwise
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # Load environment variables
 load_dotenv()
 
@@ -32,11 +40,36 @@ LOCAL_PROCESSED_IDS_FILE = ".tmp/processed_ids.json"
 
 
 class LocalDeduplicator:
-    """File-based deduplicator for testing without Google Sheets."""
+    """File-based deduplicator for testing without Google Sheets.
+
+    The file is the source of truth: every lookup and add re-reads it, so
+    adds and clears made by other instances or processes are seen.
+    """
 
     def __init__(self, filepath: str = LOCAL_PROCESSED_IDS_FILE):
         self.filepath = filepath
         self._ensure_file_exists()
+        self._ids = self._load()
+        # Records held in memory but not yet written to the file
+        self._unsaved: Dict[str, dict] = {}
+
+    @classmethod
+    def from_dict(
+        cls,
+        initial: Dict[str, dict],
+        filepath: str = LOCAL_PROCESSED_IDS_FILE
+    ) -> 'LocalDeduplicator':
+        """Build from records already in memory, skipping the initial file read.
+
+        The records are kept alongside whatever the file holds, and are only
+        written once the records change.
+        """
+        dedup = cls.__new__(cls)
+        dedup.filepath = filepath
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        dedup._ids = dict(initial)
+        dedup._unsaved = dict(initial)
+        return dedup
 
     def _ensure_file_exists(self):
         """Create file if it doesn't exist."""
@@ -45,76 +78,115 @@ class LocalDeduplicator:
             with open(self.filepath, 'w') as f:
                 json.dump([], f)
 
+    def _load(self) -> Dict[str, dict]:
+        """Read the stored records, keyed by job_id."""
+        try:
+            with open(self.filepath, 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            # from_dict defers creating the file until the first write
+            return {}
+        records = orjson.loads(data) if HAS_ORJSON else json.loads(data)
+        return {r['job_id']: r for r in records}
+
+    def _refresh(self):
+        """Reload the records from the file, keeping ones not yet written.
+
+        Stored records win over unsaved ones with the same job_id. Updates
+        self._ids in place so views from view_processed_ids stay live.
+        """
+        stored = self._load()
+        for job_id, record in self._unsaved.items():
+            stored.setdefault(job_id, record)
+        self._ids.clear()
+        self._ids.update(stored)
+
+    def _save(self):
+        """Write the in-memory records back to the file."""
+        records = list(self._ids.values())
+        if HAS_ORJSON:
+            data = orjson.dumps(records, option=orjson.OPT_INDENT_2)
+        else:
+            # Raw UTF-8 like orjson, so both encoders write the same bytes
+            data = json.dumps(records, indent=2, ensure_ascii=False).encode('utf-8')
+        with open(self.filepath, 'wb') as f:
+            f.write(data)
+        self._unsaved.clear()
+
     def get_processed_ids(self) -> Dict[str, dict]:
         """Get all processed job IDs as dict keyed by job_id."""
-        with open(self.filepath, 'r') as f:
-            records = json.load(f)
-        return {r['job_id']: r for r in records}
+        self._refresh()
+        return dict(self._ids)
+
+    def view_processed_ids(self) -> Mapping[str, dict]:
+        """Read-only live view of processed IDs, without copying the dict.
+
+        The view follows this instance's records, which are re-read from the
+        file on each lookup or add; it does not read the file itself.
+        """
+        return MappingProxyType(self._ids)
 
     def add_processed_id(self, job_id: str, source: str) -> bool:
         """Add a new processed ID. Returns True if added, False if already exists."""
-        processed = self.get_processed_ids()
-
-        if job_id in processed:
+        self._refresh()
+        if job_id in self._ids:
             return False
 
-        with open(self.filepath, 'r') as f:
-            records = json.load(f)
-
-        records.append({
+        self._ids[job_id] = self._unsaved[job_id] = {
             'job_id': job_id,
             'first_seen': datetime.now().isoformat(),
             'source': source
-        })
-
-        with open(self.filepath, 'w') as f:
-            json.dump(records, f, indent=2)
+        }
+        self._save()
 
         return True
 
-    def add_processed_ids_batch(self, jobs: List[Dict]) -> int:
-        """Add multiple job IDs at once. Returns count of new IDs added."""
-        processed = self.get_processed_ids()
-
-        with open(self.filepath, 'r') as f:
-            records = json.load(f)
-
+    def add_many(self, pairs: Iterable[Tuple[str, str]]) -> int:
+        """Add (job_id, source) pairs with a single read and write. Returns count of new IDs added."""
+        self._refresh()
         added = 0
         now = datetime.now().isoformat()
 
-        for job in jobs:
-            job_id = job.get('job_id') or job.get('id')
-            source = job.get('source', 'unknown')
-
-            if job_id and job_id not in processed:
-                records.append({
+        for job_id, source in pairs:
+            if job_id not in self._ids:
+                self._ids[job_id] = self._unsaved[job_id] = {
                     'job_id': job_id,
                     'first_seen': now,
                     'source': source
-                })
-                processed[job_id] = True  # Mark as processed for this batch
+                }
                 added += 1
 
-        with open(self.filepath, 'w') as f:
-            json.dump(records, f, indent=2)
+        if added:
+            self._save()
 
         return added
 
+    def add_processed_ids_batch(self, jobs: List[Dict]) -> int:
+        """Add multiple job IDs at once. Returns count of new IDs added."""
+        pairs = []
+        for job in jobs:
+            job_id = job.get('job_id') or job.get('id')
+            if job_id:
+                pairs.append((job_id, job.get('source', 'unknown')))
+
+        return self.add_many(pairs)
+
     def is_processed(self, job_id: str) -> bool:
         """Check if a job ID has been processed."""
-        return job_id in self.get_processed_ids()
+        self._refresh()
+        return job_id in self._ids
 
     def get_source(self, job_id: str) -> Optional[str]:
         """Get the source where a job was first seen."""
-        processed = self.get_processed_ids()
-        if job_id in processed:
-            return processed[job_id].get('source')
-        return None
+        self._refresh()
+        record = self._ids.get(job_id)
+        return record.get('source') if record else None
 
     def clear(self):
         """Clear all processed IDs (for testing)."""
-        with open(self.filepath, 'w') as f:
-            json.dump([], f)
+        self._ids.clear()
+        self._unsaved.clear()
+        self._save()
 
 
 class SheetsDeduplicator:
@@ -242,8 +314,9 @@ def deduplicate_jobs(
     Returns:
         Tuple of (new_jobs, duplicate_jobs)
     """
-    processed = deduplicator.get_processed_ids()
-    seen_in_batch = set()  # Track IDs seen within this batch
+    # Processed IDs plus IDs accepted earlier in this batch, so each job
+    # needs a single set lookup
+    seen = set(deduplicator.get_processed_ids())
 
     new_jobs = []
     duplicate_jobs = []
@@ -255,12 +328,11 @@ def deduplicate_jobs(
             print(f"Warning: Job missing ID, skipping: {job.get('title', 'Unknown')}")
             continue
 
-        # Check both existing processed IDs and IDs seen in this batch
-        if job_id in processed or job_id in seen_in_batch:
+        if job_id in seen:
             duplicate_jobs.append(job)
         else:
             new_jobs.append(job)
-            seen_in_batch.add(job_id)  # Mark as seen in this batch
+            seen.add(job_id)  # Later copies in this batch are duplicates
 
     # Add new jobs to processed list
     if add_new and new_jobs:
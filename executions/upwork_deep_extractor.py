@@ -21,24 +21,24 @@ import json
 import time
 import asyncio
 import argparse
+import importlib.util
 from pathlib import Path
 from typing import Optional
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 
-# PDF extraction
-try:
-    import PyPDF2
-    HAS_PYPDF2 = True
-except ImportError:
-    HAS_PYPDF2 = False
+# PDF/DOCX extraction: only check availability here; the parsers are
+# imported on first use so importing this module stays cheap
+HAS_PYPDF2 = importlib.util.find_spec("PyPDF2") is not None
+HAS_DOCX = importlib.util.find_spec("docx") is not None
 
-# DOCX extraction
-try:
-    from docx import Document
-    HAS_DOCX = True
-except ImportError:
-    HAS_DOCX = False
+# Parser patterns, compiled once at import
+_JOB_ID_RE = re.compile(r'~([a-f0-9]+)', re.IGNORECASE)
+_BUDGET_RANGE_RE = re.compile(r'\$?([\d,]+(?:\.\d{2})?)\s*-\s*\$?([\d,]+(?:\.\d{2})?)')
+_BUDGET_AMOUNT_RE = re.compile(r'\$?([\d,]+(?:\.\d{2})?)')
+_SPENT_RE = re.compile(r'\$?([\d,]+(?:\.\d+)?)\s*(K|M)?')
+_HIRES_RE = re.compile(r'(\d+)\s*hire')
+_UNSAFE_FILENAME_RE = re.compile(r'[^\w\-_\.]')
 
 
 @dataclass
@@ -128,12 +128,29 @@ def extract_job_id_from_url(url: str) -> str:
     # https://www.upwork.com/jobs/~01abc123
     # https://www.upwork.com/freelance-jobs/apply/...~01abc123
     # https://www.upwork.com/nx/proposals/job/~01abc123/apply/
-    match = re.search(r'~([a-f0-9]+)', url, re.IGNORECASE)
+    match = _JOB_ID_RE.search(url)
     if match:
         return f"~{match.group(1)}"
     raise ValueError(f"Could not extract job ID from URL: {url}")
 
 
+def _parse_budget_amounts(budget_text: str) -> tuple[Optional[float], Optional[float]]:
+    """Return (min, max) from a range like "$25.00-$50.00", else a single amount."""
+    range_match = _BUDGET_RANGE_RE.search(budget_text)
+    if range_match:
+        return (
+            float(range_match.group(1).replace(',', '')),
+            float(range_match.group(2).replace(',', '')),
+        )
+
+    single_match = _BUDGET_AMOUNT_RE.search(budget_text)
+    if single_match:
+        value = float(single_match.group(1).replace(',', ''))
+        return value, value
+
+    return None, None
+
+
 def parse_budget(budget_text: str) -> BudgetInfo:
     """Parse budget text into structured BudgetInfo."""
     budget = BudgetInfo(budget_raw=budget_text)
@@ -143,40 +160,17 @@ def parse_budget(budget_text: str) -> BudgetInfo:
 
     text_lower = budget_text.lower()
 
-    # Check for hourly rate
+    # Check for hourly rate, then fixed price
     if '/hr' in text_lower or 'hourly' in text_lower:
         budget.budget_type = 'hourly'
-        # Extract range like "$25.00-$50.00"
-        range_match = re.search(r'\$?([\d,]+(?:\.\d{2})?)\s*-\s*\$?([\d,]+(?:\.\d{2})?)', budget_text)
-        if range_match:
-            budget.budget_min = float(range_match.group(1).replace(',', ''))
-            budget.budget_max = float(range_match.group(2).replace(',', ''))
-        else:
-            # Single value
-            single_match = re.search(r'\$?([\d,]+(?:\.\d{2})?)', budget_text)
-            if single_match:
-                value = float(single_match.group(1).replace(',', ''))
-                budget.budget_min = value
-                budget.budget_max = value
-
-    # Check for fixed price
+        budget.budget_min, budget.budget_max = _parse_budget_amounts(budget_text)
     elif 'fixed' in text_lower or 'budget' in text_lower:
         budget.budget_type = 'fixed'
-        # Extract range or single value
-        range_match = re.search(r'\$?([\d,]+(?:\.\d{2})?)\s*-\s*\$?([\d,]+(?:\.\d{2})?)', budget_text)
-        if range_match:
-            budget.budget_min = float(range_match.group(1).replace(',', ''))
-            budget.budget_max = float(range_match.group(2).replace(',', ''))
-        else:
-            single_match = re.search(r'\$?([\d,]+(?:\.\d{2})?)', budget_text)
-            if single_match:
-                value = float(single_match.group(1).replace(',', ''))
-                budget.budget_min = value
-                budget.budget_max = value
+        budget.budget_min, budget.budget_max = _parse_budget_amounts(budget_text)
 
     # Just a dollar amount without type indicator
     else:
-        amount_match = re.search(r'\$?([\d,]+(?:\.\d{2})?)', budget_text)
+        amount_match = _BUDGET_AMOUNT_RE.search(budget_text)
         if amount_match:
             value = float(amount_match.group(1).replace(',', ''))
             budget.budget_min = value
@@ -198,7 +192,7 @@ def parse_client_spent(spent_text: str) -> tuple[str, Optional[float]]:
     # Handle formats like "$10K", "$1.5M", "$500", etc.
     text_clean = spent_text.strip().upper()
 
-    match = re.search(r'\$?([\d,]+(?:\.\d+)?)\s*(K|M)?', text_clean)
+    match = _SPENT_RE.search(text_clean)
     if match:
         value = float(match.group(1).replace(',', ''))
         multiplier = match.group(2)
@@ -218,7 +212,7 @@ def parse_hires_count(hires_text: str) -> Optional[int]:
     if not hires_text:
         return None
 
-    match = re.search(r'(\d+)\s*hire', hires_text.lower())
+    match = _HIRES_RE.search(hires_text.lower())
     if match:
         return int(match.group(1))
     return None
@@ -230,6 +224,8 @@ def extract_text_from_pdf(pdf_path: str) -> str:
         return "[PDF extraction requires PyPDF2 package]"
 
     try:
+        import PyPDF2
+
         text_parts = []
         with open(pdf_path, 'rb') as f:
             reader = PyPDF2.PdfReader(f)
@@ -246,6 +242,8 @@ def extract_text_from_docx(docx_path: str) -> str:
         return "[DOCX extraction requires python-docx package]"
 
     try:
+        from docx import Document
+
         doc = Document(docx_path)
         text_parts = []
         for para in doc.paragraphs:
@@ -647,7 +645,7 @@ class UpworkDeepExtractor:
             downloads_dir.mkdir(exist_ok=True)
 
             # Sanitize filename
-            safe_filename = re.sub(r'[^\w\-_\.]', '_', attachment.filename)
+            safe_filename = _UNSAFE_FILENAME_RE.sub('_', attachment.filename)
             local_path = downloads_dir / f"{job_id}_{safe_filename}"
 
             # Download file using page context